@@ -7,11 +7,11 @@ import streamlit as st
 from dotenv import load_dotenv
 
 from consts import MODEL_NAME
+from disk_cache import content_hash
 from langchain_openai import ChatOpenAI
 
 from extracting_data.extraction_graph import build_extraction_graph, run_extraction_flow
-from extracting_data.extracting_consts import JOB_DESCRIPTION, CV
-from extracting_data.receive_text_from_documents import ReadDocuments
+from extracting_data.receive_text_from_documents import DocumentReadError
 from match_evaluation.evaluation_graph import (
     build_evaluation_graph,
     run_evaluation_flow,
@@ -54,7 +54,10 @@ def init_llm():
 
 def init_graphs(llm):
     if "extraction_graph" not in st.session_state:
-        st.session_state.extraction_graph = build_extraction_graph(llm)
+        # Streamlit has no stdin, unreadable documents must surface as errors
+        st.session_state.extraction_graph = build_extraction_graph(
+            llm, interactive=False
+        )
     if "evaluation_graph" not in st.session_state:
         st.session_state.evaluation_graph = build_evaluation_graph(llm)
 
@@ -75,24 +78,30 @@ def save_upload(upload):
     return str(file_path)
 
 
-def prepare_document(topic, raw_text, url_or_path, upload, llm):
-    doc_input = None
-    saved_path = None
-
+def prepare_document(raw_text, url_or_path, upload):
+    """Resolve what the user provided into a document input (text, link or saved path)"""
     if raw_text and raw_text.strip():
-        doc_input = raw_text.strip()
-    elif upload is not None:
+        return raw_text.strip(), None
+    if upload is not None:
         saved_path = save_upload(upload)
-        doc_input = saved_path
-    elif url_or_path and url_or_path.strip():
-        doc_input = url_or_path.strip()
-    else:
-        return None, None
+        return saved_path, saved_path
+    if url_or_path and url_or_path.strip():
+        return url_or_path.strip(), None
+    return None, None
 
-    description = ReadDocuments(
-        doc_input=doc_input, llm=llm, document_topic=topic
-    ).full_desciption_text
-    return description, saved_path
+
+def document_source(raw_text, url_or_path, upload):
+    """
+    Where a document came from, in the same precedence as prepare_document.
+    Pasted text has no source to compare, it is keyed on its content.
+    """
+    if raw_text and raw_text.strip():
+        return f"pasted:{content_hash(raw_text.strip())}"
+    if upload is not None:
+        return f"upload:{upload.name}"
+    if url_or_path and url_or_path.strip():
+        return url_or_path.strip()
+    return None
 
 
 def _get(state, key, default=None):
@@ -617,12 +626,8 @@ def main():
                 progress_placeholder,
             )
             try:
-                cv_desc, cv_path = prepare_document(
-                    CV, cv_text, cv_link, cv_upload, llm
-                )
-                job_desc, job_path = prepare_document(
-                    JOB_DESCRIPTION, job_text, job_link, job_upload, llm
-                )
+                cv_input, cv_path = prepare_document(cv_text, cv_link, cv_upload)
+                job_input, job_path = prepare_document(job_text, job_link, job_upload)
                 st.session_state.path_to_cv = cv_path
                 st.session_state.path_to_job = job_path
                 if cv_path:
@@ -630,18 +635,31 @@ def main():
                 if job_path:
                     st.session_state.job_link_cached = job_path
 
-                if not cv_desc or not job_desc:
+                if not cv_input or not job_input:
                     st.error(
                         "Please provide both CV and job description (text, file, or link)."
                     )
                     st.session_state.assessment_running = False
                     st.session_state.assessment_button_hidden = False
                 else:
+                    # The previous profile is only patched for a CV from the same source
+                    cv_source = document_source(cv_text, cv_link, cv_upload)
+                    same_cv = cv_source == st.session_state.get("previous_cv_source")
+                    # Reading/cleanup of both documents runs inside the extraction
+                    # graph, concurrently and pipelined into profile extraction
                     base_state = AgentState(
                         path_to_cv=cv_path,
                         path_to_job=job_path,
-                        cv_description_text=cv_desc,
-                        job_description_text=job_desc,
+                        cv_input=cv_input,
+                        job_input=job_input,
+                        previous_cv=(
+                            st.session_state.get("previous_cv") if same_cv else None
+                        ),
+                        previous_cv_description_text=(
+                            st.session_state.get("previous_cv_description_text")
+                            if same_cv
+                            else None
+                        ),
                     )
                     render_steps(
                         "<span style='font-size:28px'>Running assessment...</span>",
@@ -679,12 +697,23 @@ def main():
                     except Exception:
                         pass
                     st.session_state.agent_state = evaluated_state
+                    # Kept across resets: re-running with an edited CV patches this profile
+                    st.session_state.previous_cv = _get(evaluated_state, "cv")
+                    st.session_state.previous_cv_description_text = _get(
+                        evaluated_state, "cv_description_text"
+                    )
+                    st.session_state.previous_cv_source = cv_source
                     st.session_state.rewrite_state = None
                     st.session_state.docx_path = None
                     st.session_state.assessment_running = False
                     add_message("assistant", "Match assessment completed")
                     st.rerun()
-            except Exception:
+            except DocumentReadError as e:
+                st.error(f"{e}. Please check the file or link and try again.")
+                st.session_state.assessment_running = False
+                st.session_state.assessment_button_hidden = False
+            except Exception as e:
+                st.error(f"The assessment failed: {e}")
                 st.session_state.assessment_running = False
                 st.session_state.assessment_button_hidden = False
     elif st.session_state.assessment_running and not st.session_state.get(
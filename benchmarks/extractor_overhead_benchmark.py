@@ -0,0 +1,92 @@
+"""
+TrustCall extraction overhead without LLM latency: extractor rebuilt per call
+(previous behaviour) vs the cached extractor from get_extractor.
+
+Run from the repository root:
+    python -m benchmarks.extractor_overhead_benchmark
+"""
+
+import time
+from typing import Any, Dict
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from trustcall import create_extractor
+from extracting_data.description_schemas import CVDescription, JobDescription
+from extracting_data.profile_extraction import (
+    get_extractor,
+    trustcall_extract_text_to_schema,
+)
+
+ITERATIONS = 50
+SAMPLE_ARGS = {
+    CVDescription: {
+        "full_name": "Jane Doe",
+        "current_title": "Data Scientist",
+        "technical_skills": [{"name": "Python"}, {"name": "SQL"}],
+        "experience": [
+            {"title": "Data Scientist", "company": "Acme", "technologies": ["Python"]}
+        ],
+    },
+    JobDescription: {
+        "job_title": "Senior Data Scientist",
+        "required_technical_skills": [{"name": "Python"}],
+        "critical_keywords": ["Python", "SQL"],
+    },
+}
+
+
+class InstantToolCallModel(BaseChatModel):
+    """Chat model that answers every request immediately with one tool call."""
+
+    tool_name: str
+    tool_args: Dict[str, Any]
+
+    @property
+    def _llm_type(self) -> str:
+        return "instant-tool-call"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        message = AIMessage(
+            content="",
+            tool_calls=[{"name": self.tool_name, "args": self.tool_args, "id": "1"}],
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def uncached_extract(text, schema, llm):
+    extractor = create_extractor(
+        llm=llm, tools=[schema], tool_choice="any", enable_inserts=True
+    )
+    return extractor.invoke({"messages": [{"role": "user", "content": text}]})
+
+
+def per_call_ms(func, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(*args)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    print(f"{'schema':>15} {'build ms':>9} {'get ms':>7} {'uncached':>9} {'cached':>7}")
+    for schema, args in SAMPLE_ARGS.items():
+        llm = InstantToolCallModel(tool_name=schema.__name__, tool_args=args)
+        build = per_call_ms(
+            lambda: create_extractor(
+                llm=llm, tools=[schema], tool_choice="any", enable_inserts=True
+            )
+        )
+        get = per_call_ms(get_extractor, llm, schema)
+        uncached = per_call_ms(uncached_extract, "cv text", schema, llm)
+        cached = per_call_ms(trustcall_extract_text_to_schema, "cv text", schema, llm)
+        print(
+            f"{schema.__name__:>15} {build:>9.2f} {get:>7.3f} {uncached:>9.2f} {cached:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
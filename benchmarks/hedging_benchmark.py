@@ -0,0 +1,86 @@
+"""
+Wall time of the seven-call evaluator fan-out against a fake LLM that
+stalls now and then, with and without hedged requests.
+
+Run from the repository root:
+    python -m benchmarks.hedging_benchmark
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from llm_hedging import ainvoke_hedged, disable_hedging, enable_hedging
+
+NODES = [
+    "skills_match",
+    "qualification_match",
+    "seniority_match",
+    "domain_match",
+    "requirements_coverage",
+    "recency_relevance",
+    "keyword_match",
+]
+ASSESSMENTS = 200
+WARMUP_ASSESSMENTS = 100
+LATENCY_SECONDS = 0.02
+JITTER_SECONDS = 0.01
+STALL_PROBABILITY = 0.03
+STALL_SECONDS = 0.5
+SEED = 7
+
+
+class StallingLLM:
+    """Answers after a short random latency, a few requests stall for much longer."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.calls = 0
+
+    async def ainvoke(self, prompt, *args, **kwargs):
+        self.calls += 1
+        latency = LATENCY_SECONDS + self.rng.random() * JITTER_SECONDS
+        if self.rng.random() < STALL_PROBABILITY:
+            latency += STALL_SECONDS
+        await asyncio.sleep(latency)
+        return prompt
+
+
+async def assessment(llm) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(ainvoke_hedged(node, llm, node) for node in NODES))
+    return time.perf_counter() - start
+
+
+async def run(llm):
+    for _ in range(WARMUP_ASSESSMENTS):
+        await assessment(llm)
+    llm.calls = 0
+    return [await assessment(llm) for _ in range(ASSESSMENTS)]
+
+
+def report(label, times, calls):
+    times = sorted(times)
+    p99 = times[int(0.99 * (len(times) - 1))]
+    print(
+        f"{label:>10} {statistics.median(times) * 1000:>8.1f} "
+        f"{p99 * 1000:>8.1f} {max(times) * 1000:>8.1f} "
+        f"{calls / (len(times) * len(NODES)):>10.2f}"
+    )
+
+
+def main():
+    print(f"{'':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'calls/req':>10}")
+    disable_hedging()
+    llm = StallingLLM(random.Random(SEED))
+    report("plain", asyncio.run(run(llm)), llm.calls)
+
+    hedger = enable_hedging()
+    llm = StallingLLM(random.Random(SEED))
+    report("hedged", asyncio.run(run(llm)), llm.calls)
+    print(f"hedges sent: {hedger.budget.hedges} of {hedger.budget.requests} requests")
+    disable_hedging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Serial vs page-parallel PDF text extraction on synthetic multi-page PDFs.
+
+Run from the repository root:
+    python -m benchmarks.pdf_reading_benchmark
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from extracting_data.document_readers import read_pdf
+from extracting_data.parallel_pdf import read_pdf_parallel, get_pdf_pool
+
+PAGE_COUNTS = [4, 16, 40, 80]
+LINES_PER_PAGE = 45
+REPEATS = 3
+
+
+def make_synthetic_pdf(path: Path, n_pages: int) -> None:
+    """Write a minimal text-only PDF with `n_pages` pages of CV-like lines."""
+    objects = []
+    page_ids = []
+    font_id = 3
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(None)  # pages tree, filled in below
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for page_number in range(n_pages):
+        lines = [
+            f"Page {page_number + 1} line {i}: Senior Data Scientist at Company {i}, "
+            f"2019 - 2023, Python, SQL, AWS, Spark"
+            for i in range(LINES_PER_PAGE)
+        ]
+        stream = "BT /F1 9 Tf 40 800 Td 12 TL " + " ".join(
+            f"({line}) '" for line in lines
+        )
+        stream += " ET"
+        content_id = len(objects) + 1
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode()
+        )
+        page_ids.append(len(objects) + 1)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>".encode()
+        )
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {n_pages} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(bytes(out))
+
+
+def best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    # Start the pool up front: the benchmark measures steady-state throughput,
+    # which is what a long-running app or bulk intake sees.
+    pool = get_pdf_pool()
+    list(pool.map(abs, range(pool._max_workers)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'pages':>6} {'serial s':>10} {'parallel s':>11} {'speedup':>8}")
+        for n_pages in PAGE_COUNTS:
+            path = Path(tmp) / f"synthetic_{n_pages}.pdf"
+            make_synthetic_pdf(path, n_pages)
+            assert read_pdf(str(path)) == read_pdf_parallel(str(path))
+            serial = best_of(read_pdf, str(path))
+            parallel = best_of(read_pdf_parallel, str(path))
+            print(
+                f"{n_pages:>6} {serial:>10.3f} {parallel:>11.3f} {serial / parallel:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,26 @@
+from pathlib import Path
+
 MODEL_NAME = "openai/gpt-oss-120b"
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+SKILL_TAXONOMY_PATH = Path(__file__).resolve().parent / "skill_taxonomy" / "skills.json"
+# Additional JSON files in the same format, loaded after the bundled taxonomy
+SKILL_TAXONOMY_EXTRA_PATHS = []
+# Industries and domains, kept apart so a skill such as "Security" never
+# resolves to an industry
+DOMAIN_TAXONOMY_PATH = (
+    Path(__file__).resolve().parent / "skill_taxonomy" / "domains.json"
+)
+
+# Upper bound on LLM requests in flight across all threads and event loops
+LLM_MAX_CONCURRENCY = 16
+
+# Send a duplicate of an LLM request that is slower than HEDGE_PERCENTILE of its node's latencies
+LLM_HEDGING = False
+HEDGE_PERCENTILE = 0.95
+# Hedges allowed per request sent, across all nodes
+HEDGE_BUDGET = 0.1
+# Latencies a node needs before its requests are hedged, and how many are kept
+HEDGE_MIN_SAMPLES = 20
+HEDGE_LATENCY_WINDOW = 200
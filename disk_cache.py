@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from consts import MODEL_NAME
+
+
+def content_hash(*parts) -> str:
+    """Stable sha256 over bytes/str parts, used as a content-addressed cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            part = b""
+        elif isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def prompt_version(prompt: str) -> str:
+    """Short fingerprint of a prompt template, so editing a prompt invalidates its cache."""
+    return content_hash(prompt)[:12]
+
+
+def llm_model_name(llm) -> str:
+    if llm is None:
+        return MODEL_NAME
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None) or MODEL_NAME
+
+
+class DiskCache:
+    """
+    Small JSON-on-disk key/value store with size-bounded LRU eviction.
+
+    Every entry is one file named by its key. Reads refresh the file mtime,
+    so evicting the oldest mtimes first approximates least-recently-used.
+    Writes are atomic (temp file + rename), which keeps the cache safe to share
+    between threads and processes.
+    """
+
+    def __init__(self, cache_dir, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entry: dict) -> None:
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write cache entry {key}:", e)
+            return
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits into max_bytes."""
+        with self._lock:
+            entries = []
+            total_size = 0
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+            if total_size <= self.max_bytes:
+                return
+            entries.sort(key=lambda e: e[0])
+            for _, size, path in entries:
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total_size -= size
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,118 @@
+from functools import partial
+from typing import List
+from langchain_core.runnables import RunnableLambda
+from llm_hedging import invoke_hedged
+from extracting_data.extracting_consts import (
+    PAGE_SEPARATOR,
+    CHUNK_MAX_CHARS,
+    CHUNK_MAX_CONCURRENCY,
+)
+from extracting_data.extracting_prompts import EXTRACTION_PROMPT, CHUNK_CONTEXT_NOTE
+from extracting_data.text_normalizer import is_section_header, header_key
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split text into blocks on page breaks and before every section header."""
+    blocks = []
+    for page in text.split(PAGE_SEPARATOR):
+        current = []
+        for line in page.splitlines():
+            if is_section_header(line) and any(l.strip() for l in current):
+                blocks.append("\n".join(current))
+                current = []
+            current.append(line)
+        if any(l.strip() for l in current):
+            blocks.append("\n".join(current))
+    return blocks
+
+
+def split_oversized_block(block: str, max_chars: int) -> List[str]:
+    parts, current, size = [], [], 0
+    for line in block.splitlines():
+        if current and size + len(line) + 1 > max_chars:
+            parts.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        parts.append("\n".join(current))
+    return parts
+
+
+def split_into_chunks(text: str, max_chars: int = CHUNK_MAX_CHARS) -> List[str]:
+    """Greedily pack section/page blocks into chunks of at most max_chars."""
+    chunks, current = [], ""
+    for block in split_blocks(text):
+        pieces = (
+            split_oversized_block(block, max_chars)
+            if len(block) > max_chars
+            else [block]
+        )
+        for piece in pieces:
+            if current and len(current) + len(piece) + 1 > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n{piece}" if current else piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def merge_cleaned_chunks(cleaned_chunks: List[str], topic: str) -> str:
+    """
+    Concatenate cleaned chunks in document order. Chunks that found nothing are
+    dropped, and a chunk that re-opens with the header the previous chunk was
+    already in (a section split across chunks) loses the duplicate header.
+    """
+    no_info = header_key(f"No relevant information found for {topic}.")
+    merged_lines = []
+    last_header = None
+    for chunk in cleaned_chunks:
+        if header_key(chunk) == no_info:
+            continue
+        lines = chunk.strip().splitlines()
+        first_content = next((i for i, l in enumerate(lines) if l.strip()), None)
+        if (
+            first_content is not None
+            and last_header is not None
+            and is_section_header(lines[first_content])
+            and header_key(lines[first_content].rstrip(":")) == last_header
+        ):
+            lines = lines[first_content + 1 :]
+        for line in lines:
+            if is_section_header(line):
+                last_header = header_key(line.rstrip(":"))
+        if merged_lines and lines:
+            merged_lines.append("")
+        merged_lines.extend(lines)
+    if not merged_lines:
+        return f"No relevant information found for {topic}."
+    return "\n".join(merged_lines).strip()
+
+
+def chunked_cleanup(
+    text: str,
+    topic: str,
+    llm,
+    max_chars: int = CHUNK_MAX_CHARS,
+    max_concurrency: int = CHUNK_MAX_CONCURRENCY,
+) -> str:
+    """
+    Map-reduce variant of the EXTRACTION_PROMPT cleanup: the copy-and-filter prompt
+    runs concurrently on section/page chunks and the outputs are merged in order.
+    """
+    chunks = split_into_chunks(text, max_chars)
+    if len(chunks) <= 1:
+        result = invoke_hedged(
+            "cleanup", llm, EXTRACTION_PROMPT.format(topic=topic, text=text)
+        )
+        return result.content
+    prompts = [
+        CHUNK_CONTEXT_NOTE.format(part=i + 1, total=len(chunks), topic=topic)
+        + EXTRACTION_PROMPT.format(topic=topic, text=chunk)
+        for i, chunk in enumerate(chunks)
+    ]
+    results = RunnableLambda(partial(invoke_hedged, "cleanup_chunk", llm)).batch(
+        prompts, config={"max_concurrency": max_concurrency}
+    )
+    return merge_cleaned_chunks([r.content for r in results], topic)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, create_model
+from typing import List, Optional, Type
 
 
 class Skill(BaseModel):
@@ -226,3 +226,48 @@ class JobDescription(BaseModel):
         default_factory=list,
         description="Key terms that must appear for ATS to flag as match",
     )
+
+
+def cv_section_model(name: str, doc: str, fields: List[str]) -> Type[BaseModel]:
+    """Sub-model of CVDescription with the same field definitions"""
+    return create_model(
+        name,
+        __doc__=doc,
+        **{
+            field: (
+                CVDescription.model_fields[field].annotation,
+                CVDescription.model_fields[field],
+            )
+            for field in fields
+        },
+    )
+
+
+CVHeaderSection = cv_section_model(
+    "CVHeaderSection",
+    "Candidate header and profile summary from cv",
+    ["full_name", "current_title", "total_years_experience", "domains", "cv_summary"],
+)
+CVExperienceSection = cv_section_model(
+    "CVExperienceSection", "Work experience from cv", ["experience"]
+)
+CVProjectsSection = cv_section_model(
+    "CVProjectsSection", "Projects from cv", ["projects"]
+)
+CVEducationSection = cv_section_model(
+    "CVEducationSection",
+    "Education and certifications from cv",
+    ["education", "certifications"],
+)
+CVSkillsSection = cv_section_model(
+    "CVSkillsSection",
+    "Skills and languages from cv",
+    ["technical_skills", "soft_skills", "spoken_languages"],
+)
+CV_SECTION_MODELS = [
+    CVHeaderSection,
+    CVExperienceSection,
+    CVProjectsSection,
+    CVEducationSection,
+    CVSkillsSection,
+]
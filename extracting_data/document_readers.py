@@ -0,0 +1,245 @@
+import struct
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+from pypdf import PdfReader
+from docx import Document
+from extracting_data.extracting_consts import (
+    PAGE_SEPARATOR,
+    PDF_PARALLEL_READING,
+    SUBPROCESS_READER_WORKERS,
+    SNIFF_BYTES,
+)
+from extracting_data.parallel_pdf import read_pdf_parallel
+
+try:
+    import olefile
+except ImportError:
+    olefile = None
+
+PDF = "pdf"
+DOCX = "docx"
+DOC = "doc"
+RTF = "rtf"
+TEXT = "text"
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+SUFFIX_CONTENT_TYPES = {
+    ".pdf": PDF,
+    ".docx": DOCX,
+    ".doc": DOC,
+    ".rtf": RTF,
+    ".txt": TEXT,
+    ".md": TEXT,
+}
+
+
+class DocumentReader(NamedTuple):
+    func: Callable[[str], str]
+    shells_out: bool = False
+
+
+READERS: Dict[str, DocumentReader] = {}
+
+_subprocess_pool = None
+_timings_lock = threading.Lock()
+_timings: Dict[str, Dict[str, float]] = {}
+
+
+def register_reader(content_type: str, func: Callable[[str], str], shells_out=False):
+    """
+    Register (or replace) the reader for a content type. Readers that spawn
+    external processes must say so, they then run on a bounded worker pool.
+    """
+    READERS[content_type] = DocumentReader(func, shells_out)
+
+
+def read_pdf(path: str) -> str:
+    reader = PdfReader(path)
+    text = []
+    for page in reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text.append(page_text)
+    return PAGE_SEPARATOR.join(text)
+
+
+def read_docx(path: str) -> str:
+    doc = Document(path)
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+def read_txt(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def read_with_textract(path: str, extension: str) -> str:
+    import textract
+
+    text = textract.process(path, extension=extension)
+    return text.decode("utf-8", errors="ignore")
+
+
+def clean_word_text(text: str) -> str:
+    """Drop field instructions and Word control characters from a .doc text stream."""
+    out = []
+    field_depth = 0
+    in_instruction = []
+    for ch in text:
+        if ch == "\x13":
+            field_depth += 1
+            in_instruction.append(True)
+        elif ch == "\x14" and in_instruction:
+            in_instruction[-1] = False
+        elif ch == "\x15" and in_instruction:
+            in_instruction.pop()
+            field_depth -= 1
+        elif in_instruction and in_instruction[-1]:
+            continue
+        elif ch in "\r\x0b\x0c":
+            out.append("\n")
+        elif ch == "\x07":
+            out.append("\t")
+        elif ch >= " " or ch in "\n\t":
+            out.append(ch)
+    return "".join(out)
+
+
+def read_doc_ole(path: str) -> str:
+    """
+    In-process reader for legacy Word 97-2003 files: follows the piece table
+    (CLX) from the FIB into the WordDocument stream, no external processes.
+    """
+    with olefile.OleFileIO(path) as ole:
+        word_document = ole.openstream("WordDocument").read()
+        flags = struct.unpack_from("<H", word_document, 0x0A)[0]
+        table_name = "1Table" if flags & 0x0200 else "0Table"
+        table = ole.openstream(table_name).read()
+
+    # FIB: 32-byte base, then csw/fibRgW, cslw/fibRgLw, cbRgFcLcb/fibRgFcLcb
+    offset = 32
+    csw = struct.unpack_from("<H", word_document, offset)[0]
+    offset += 2 + csw * 2
+    cslw = struct.unpack_from("<H", word_document, offset)[0]
+    offset += 2 + cslw * 4 + 2
+    fc_clx, lcb_clx = struct.unpack_from("<II", word_document, offset + 33 * 8)
+    clx = table[fc_clx : fc_clx + lcb_clx]
+
+    position = 0
+    while clx[position] == 0x01:  # skip Prc entries
+        cb_grpprl = struct.unpack_from("<H", clx, position + 1)[0]
+        position += 3 + cb_grpprl
+    if clx[position] != 0x02:
+        raise ValueError("Unexpected piece table layout")
+    lcb = struct.unpack_from("<I", clx, position + 1)[0]
+    plc_pcd = clx[position + 5 : position + 5 + lcb]
+    n_pieces = (lcb - 4) // 12
+    cps = struct.unpack_from(f"<{n_pieces + 1}I", plc_pcd, 0)
+
+    pieces = []
+    for i in range(n_pieces):
+        fc = struct.unpack_from("<I", plc_pcd, (n_pieces + 1) * 4 + i * 8 + 2)[0]
+        n_chars = cps[i + 1] - cps[i]
+        if fc & 0x40000000:
+            start = (fc & ~0x40000000) // 2
+            pieces.append(word_document[start : start + n_chars].decode("cp1252"))
+        else:
+            pieces.append(
+                word_document[fc : fc + 2 * n_chars].decode("utf-16-le", "ignore")
+            )
+    return clean_word_text("".join(pieces))
+
+
+def read_doc(path: str) -> str:
+    if olefile is not None:
+        try:
+            return read_doc_ole(path)
+        except Exception as e:
+            print(f"In-process .doc parsing failed for {path}, using textract:", e)
+    # Registered in-process, only this fallback shells out
+    return run_on_subprocess_pool(read_with_textract, path, "doc")
+
+
+def read_rtf(path: str) -> str:
+    return read_with_textract(path, "rtf")
+
+
+def get_subprocess_pool() -> ThreadPoolExecutor:
+    global _subprocess_pool
+    if _subprocess_pool is None:
+        _subprocess_pool = ThreadPoolExecutor(
+            max_workers=SUBPROCESS_READER_WORKERS,
+            thread_name_prefix="document-reader",
+        )
+    return _subprocess_pool
+
+
+def run_on_subprocess_pool(func, *args) -> str:
+    """Bounds how many external converter processes run at the same time."""
+    return get_subprocess_pool().submit(func, *args).result()
+
+
+def sniff_content_type(path: str) -> Optional[str]:
+    """Detect the document type from magic bytes, falling back to the suffix."""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    if b"%PDF-" in head[:1024]:
+        return PDF
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return DOCX
+        except zipfile.BadZipFile:
+            pass
+    elif head.startswith(OLE_MAGIC):
+        return DOC
+    elif head.lstrip().startswith(b"{\\rtf"):
+        return RTF
+    elif head and b"\x00" not in head:
+        return TEXT
+    return SUFFIX_CONTENT_TYPES.get(Path(path).suffix.lower())
+
+
+def record_timing(content_type: str, seconds: float) -> None:
+    with _timings_lock:
+        stats = _timings.setdefault(content_type, {"count": 0, "total_seconds": 0.0})
+        stats["count"] += 1
+        stats["total_seconds"] += seconds
+
+
+def reader_timings() -> Dict[str, Dict[str, float]]:
+    """Per-format parse counts, total and mean seconds since process start."""
+    with _timings_lock:
+        return {
+            content_type: {
+                **stats,
+                "mean_seconds": stats["total_seconds"] / stats["count"],
+            }
+            for content_type, stats in _timings.items()
+        }
+
+
+def read_document(path: str) -> str:
+    content_type = sniff_content_type(path)
+    reader = READERS.get(content_type)
+    if reader is None:
+        raise ValueError(f"Unsupported document type for {path}")
+    start = time.perf_counter()
+    try:
+        if reader.shells_out:
+            return run_on_subprocess_pool(reader.func, path)
+        return reader.func(path)
+    finally:
+        record_timing(content_type, time.perf_counter() - start)
+
+
+register_reader(PDF, read_pdf_parallel if PDF_PARALLEL_READING else read_pdf)
+register_reader(DOCX, read_docx)
+register_reader(DOC, read_doc)
+register_reader(RTF, read_rtf, shells_out=True)
+register_reader(TEXT, read_txt)
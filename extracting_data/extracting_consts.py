@@ -1,3 +1,54 @@
 JOB_DESCRIPTION = "job description"
 CV = "cv"
 INPUT_ATTEMPTS = 3
+
+DOCUMENT_CACHE_SUBDIR = "documents"
+DOCUMENT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+PDF_PARALLEL_READING = True
+PDF_PARALLEL_MIN_PAGES = 12
+PDF_PAGES_PER_SHARD = 4
+# Pages read from a PDF, None reads all of them; truncation is logged
+PDF_MAX_PAGES = None
+# Stop reading a PDF once this much text is collected, None reads to the end
+PDF_MAX_CHARS = None
+PDF_MAX_WORKERS = None
+
+PAGE_SEPARATOR = "\n\f\n"
+
+CLEANUP_MODE_FULL = "full"
+CLEANUP_MODE_CHUNKED = "chunked"
+CLEANUP_MODE_LOCAL = "local"
+CLEANUP_MODE_NONE = "none"
+CLEANUP_MODE = CLEANUP_MODE_FULL
+# Skip the cleanup LLM call and extract profiles straight from parsed text
+FUSED_EXTRACTION = False
+# Extract CV sub-models (experience, projects, ...) in concurrent calls
+SECTION_PARALLEL_CV_EXTRACTION = False
+CHUNK_MAX_CHARS = 4000
+CHUNK_MAX_CONCURRENCY = 8
+
+MIN_SECTIONS_FOR_LOCAL_CLEANUP = {CV: 3, JOB_DESCRIPTION: 2}
+
+URL_CACHE_SUBDIR = "urls"
+URL_CACHE_MAX_BYTES = 100 * 1024 * 1024
+URL_CACHE_FRESH_SECONDS = 15 * 60
+URL_FETCH_TIMEOUT = 15
+URL_MAX_CONNECTIONS = 20
+URL_MAX_CONNECTIONS_PER_HOST = 4
+URL_USER_AGENT = "Mozilla/5.0"
+
+HTML_MAX_BYTES = 2 * 1024 * 1024
+HTML_MAX_TEXT_CHARS = 30000
+HTML_MIN_MAIN_CONTENT_CHARS = 300
+
+SUBPROCESS_READER_WORKERS = 2
+SNIFF_BYTES = 4096
+
+# Above this share of changed lines a CV is re-extracted from scratch
+INCREMENTAL_MAX_CHANGE_RATIO = 0.3
+INCREMENTAL_DIFF_CONTEXT_LINES = 2
+
+# TrustCall extractors kept built, per (llm, schema, options); one llm needs
+# up to seven (job, full CV and the five CV sections)
+EXTRACTOR_CACHE_SIZE = 24
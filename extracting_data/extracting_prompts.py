@@ -123,3 +123,29 @@ SYSTEM_INSTRUCTIONS = (
     "You MUST call the tool. Do NOT output JSON directly. "
     "If a field is missing, return null or an empty list.\n\n" + SYSTEM_RULES
 )
+
+CHUNK_CONTEXT_NOTE = """NOTE: The text below is part {part} of {total} of one longer document.
+Copy and filter only this part. Do NOT add introductions, summaries or closing remarks.
+If this part has no relevant information, respond with exactly: "No relevant information found for {topic}."
+
+"""
+
+FUSED_EXTRACTION_NOTE = """
+RAW INPUT RULES:
+- The text is raw parser output of a {topic} document, it was NOT cleaned beforehand.
+- It may contain PDF/HTML artifacts, page headers/footers, navigation, legal or company boilerplate.
+- Ignore everything that is not information about the {topic} itself.
+"""
+
+
+def fused_system_instructions(topic: str) -> str:
+    return SYSTEM_INSTRUCTIONS + FUSED_EXTRACTION_NOTE.format(topic=topic)
+
+
+INCREMENTAL_UPDATE_PROMPT = """The candidate edited their {topic}. The previously extracted profile is provided as the existing document.
+Update ONLY the fields affected by the changes below, keep everything else exactly as it is.
+Lines starting with "-" were removed, lines starting with "+" were added, other lines are unchanged context.
+
+CHANGES:
+{diff}
+"""
@@ -1,55 +1,206 @@
+from typing import List
+from skill_taxonomy.taxonomy import get_taxonomy
 from match_evaluation.agent_state import AgentState
 from extracting_data.description_schemas import CVDescription, JobDescription
-from extracting_data.receive_text_from_documents import ReadDocuments
-from extracting_data.profile_extraction import trustcall_extract_text_to_schema
-from extracting_data.extracting_consts import JOB_DESCRIPTION, CV
-
-
-def access_data(state: AgentState, llm):
-    """Read CV and job description documents"""
-    if state.cv_description_text:
-        cv_description_text = state.cv_description_text
-    elif state.path_to_cv is not None:
-        cv_description_text = ReadDocuments(
-            doc_input=state.path_to_cv, llm=llm, document_topic=CV
-        ).full_desciption_text
-    else:
-        cv_description_text = ReadDocuments(document_topic=CV).full_desciption_text
-
-    if state.job_description_text:
-        job_description_text = state.job_description_text
-    elif state.path_to_job is not None:
-        job_description_text = ReadDocuments(
-            doc_input=state.path_to_job, llm=llm, document_topic=JOB_DESCRIPTION
-        ).full_desciption_text
-    else:
-        job_description_text = ReadDocuments(
-            document_topic=JOB_DESCRIPTION
-        ).full_desciption_text
+from extracting_data.receive_text_from_documents import (
+    ReadDocuments,
+    extract_texts_from_urls,
+    is_url_string,
+)
+from extracting_data.profile_extraction import (
+    trustcall_extract_text_to_schema,
+    extract_cv_by_sections,
+    extract_incrementally,
+)
+from extracting_data.extracting_prompts import (
+    SYSTEM_INSTRUCTIONS,
+    fused_system_instructions,
+)
+from extracting_data.extracting_consts import (
+    JOB_DESCRIPTION,
+    CV,
+    CLEANUP_MODE,
+    CLEANUP_MODE_NONE,
+    FUSED_EXTRACTION,
+    SECTION_PARALLEL_CV_EXTRACTION,
+)
+
+
+def read_document_text(
+    existing_text,
+    doc_input,
+    document_topic,
+    llm,
+    cleanup_mode=CLEANUP_MODE,
+    interactive=True,
+    fetch_error=None,
+):
+    """Return already known text, otherwise read and clean the given input"""
+    if existing_text:
+        return existing_text
+    return ReadDocuments(
+        doc_input=doc_input,
+        llm=llm,
+        document_topic=document_topic,
+        cleanup_mode=cleanup_mode,
+        interactive=interactive,
+        fetch_error=fetch_error,
+    ).full_desciption_text
+
+
+FETCH_ERROR_FIELDS = {"cv_input": "cv_fetch_error", "job_input": "job_fetch_error"}
+
+
+def fetch_documents(state: AgentState):
+    """
+    Download the CV and job links in one batch over a shared client.
+
+    A fetched page replaces its link as the document input. A link that
+    failed is left in place with its error, so reading it reports the error
+    without downloading it a second time.
+    """
+    inputs = {}
+    if not state.cv_description_text:
+        inputs["cv_input"] = state.cv_input or state.path_to_cv
+    if not state.job_description_text:
+        inputs["job_input"] = state.job_input or state.path_to_job
+    links = {field: value for field, value in inputs.items() if is_url_string(value)}
+    if not links:
+        return {}
+    texts = extract_texts_from_urls(list(links.values()))
+    update = {}
+    for field, text in zip(links, texts):
+        if text is None:
+            update[FETCH_ERROR_FIELDS[field]] = f"failed to download {links[field]}"
+        else:
+            update[field] = text
+    return update
+
+
+def access_cv_data(state: AgentState, llm, fused=FUSED_EXTRACTION, interactive=True):
+    """Read CV document"""
+    return {
+        "cv_description_text": read_document_text(
+            state.cv_description_text,
+            state.cv_input or state.path_to_cv,
+            CV,
+            llm,
+            cleanup_mode=CLEANUP_MODE_NONE if fused else CLEANUP_MODE,
+            interactive=interactive,
+            fetch_error=state.cv_fetch_error,
+        )
+    }
+
+
+def access_job_data(state: AgentState, llm, fused=FUSED_EXTRACTION, interactive=True):
+    """Read job description document"""
     return {
-        "cv_description_text": cv_description_text,
-        "job_description_text": job_description_text,
+        "job_description_text": read_document_text(
+            state.job_description_text,
+            state.job_input or state.path_to_job,
+            JOB_DESCRIPTION,
+            llm,
+            cleanup_mode=CLEANUP_MODE_NONE if fused else CLEANUP_MODE,
+            interactive=interactive,
+            fetch_error=state.job_fetch_error,
+        )
     }
 
 
-def extract_job_to_profile(state: AgentState, llm):
+def extract_job_to_profile(state: AgentState, llm, fused=FUSED_EXTRACTION):
     print("Extracting job information...")
     """Extract job description to structured format"""
     result = trustcall_extract_text_to_schema(
-        state.job_description_text, JobDescription, llm
+        state.job_description_text,
+        JobDescription,
+        llm,
+        system_instructions=(
+            fused_system_instructions(JOB_DESCRIPTION) if fused else SYSTEM_INSTRUCTIONS
+        ),
     )
     return {"job": result}
 
 
-def extract_cv_to_profile(state: AgentState, llm):
+def extract_cv_to_profile(
+    state: AgentState,
+    llm,
+    fused=FUSED_EXTRACTION,
+    section_parallel=SECTION_PARALLEL_CV_EXTRACTION,
+):
     """Extract CV to structured format"""
     print("Extracting CV information...")
-    result = trustcall_extract_text_to_schema(
-        state.cv_description_text, CVDescription, llm
+    system_instructions = (
+        fused_system_instructions(CV) if fused else SYSTEM_INSTRUCTIONS
     )
+    if state.previous_cv is not None and state.previous_cv_description_text:
+        result = extract_incrementally(
+            state.previous_cv_description_text,
+            state.previous_cv,
+            state.cv_description_text,
+            llm,
+            CV,
+            system_instructions,
+        )
+        if result is not None:
+            return {"cv": result}
+    if section_parallel:
+        result = extract_cv_by_sections(
+            state.cv_description_text, llm, system_instructions
+        )
+    else:
+        result = trustcall_extract_text_to_schema(
+            state.cv_description_text,
+            CVDescription,
+            llm,
+            system_instructions=system_instructions,
+        )
     return {"cv": result}
 
 
+def process_cv(
+    state: AgentState,
+    llm,
+    fused=FUSED_EXTRACTION,
+    section_parallel=SECTION_PARALLEL_CV_EXTRACTION,
+    interactive=True,
+):
+    """
+    Read the CV and extract it right away, without waiting for the job.
+    With fused=True the cleanup LLM call is skipped: parsed text is only
+    normalized locally and goes straight into structured extraction.
+    """
+    update = access_cv_data(state, llm, fused, interactive)
+    update.update(
+        extract_cv_to_profile(
+            state.model_copy(update=update), llm, fused, section_parallel
+        )
+    )
+    return update
+
+
+def process_job(state: AgentState, llm, fused=FUSED_EXTRACTION, interactive=True):
+    """Read the job description and extract it right away, without waiting for the CV"""
+    update = access_job_data(state, llm, fused, interactive)
+    update.update(extract_job_to_profile(state.model_copy(update=update), llm, fused))
+    return update
+
+
+def profile_skill_names(cv: CVDescription, job: JobDescription) -> List[str]:
+    names = [s.name for s in cv.technical_skills]
+    for exp in cv.experience:
+        names.extend(exp.technologies)
+    for project in cv.projects:
+        names.extend(project.technologies)
+    names.extend(s.name for s in job.required_technical_skills)
+    names.extend(s.name for s in job.nice_to_have_skills)
+    names.extend(job.critical_keywords)
+    return names
+
+
 def join_extraction(state: AgentState, llm):
-    """Join node - waits for both extractions to complete"""
-    return {}
+    """Join node - waits for both extractions and annotates skill taxonomy ids"""
+    if state.cv is None or state.job is None:
+        return {}
+    return {
+        "skill_ids": get_taxonomy().annotate(profile_skill_names(state.cv, state.job))
+    }
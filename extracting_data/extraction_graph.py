@@ -1,20 +1,52 @@
 from langgraph.graph import StateGraph, START, END
 from functools import partial
 from extracting_data.extraction_functions import *
+from extracting_data.profile_extraction import warm_up_extractors
+from extracting_data.description_schemas import CV_SECTION_MODELS
 
 
-def build_extraction_graph(llm) -> StateGraph:
+def build_extraction_graph(
+    llm,
+    fused=FUSED_EXTRACTION,
+    section_parallel_cv=SECTION_PARALLEL_CV_EXTRACTION,
+    interactive=True,
+) -> StateGraph:
+    """
+    interactive=False is for servers: documents are never asked for on stdin
+    and a read failure raises DocumentReadError out of the graph.
+    """
+    warm_up_extractors(
+        llm,
+        [JobDescription]
+        + (CV_SECTION_MODELS if section_parallel_cv else [CVDescription]),
+    )
     g = StateGraph(AgentState)
-    g.add_node("access_data", partial(access_data, llm=llm))
-    g.add_node("extract_job_to_profile", partial(extract_job_to_profile, llm=llm))
-    g.add_node("extract_cv_to_profile", partial(extract_cv_to_profile, llm=llm))
+    g.add_node("fetch_documents", fetch_documents)
+    g.add_node(
+        "process_cv",
+        partial(
+            process_cv,
+            llm=llm,
+            fused=fused,
+            section_parallel=section_parallel_cv,
+            interactive=interactive,
+        ),
+    )
+    g.add_node(
+        "process_job",
+        partial(process_job, llm=llm, fused=fused, interactive=interactive),
+    )
     g.add_node("join_extraction", partial(join_extraction, llm=llm))
 
-    g.add_edge(START, "access_data")
-    g.add_edge("access_data", "extract_job_to_profile")
-    g.add_edge("access_data", "extract_cv_to_profile")
-    g.add_edge("extract_job_to_profile", "join_extraction")
-    g.add_edge("extract_cv_to_profile", "join_extraction")
+    # Reading and extraction of one document share a node: graph steps are
+    # synchronized, so separate nodes would make each extraction wait for
+    # the slower of the two documents to be read. Links are downloaded
+    # before that in one batch, the download is a single network round
+    g.add_edge(START, "fetch_documents")
+    g.add_edge("fetch_documents", "process_cv")
+    g.add_edge("fetch_documents", "process_job")
+    g.add_edge("process_job", "join_extraction")
+    g.add_edge("process_cv", "join_extraction")
     g.add_edge("join_extraction", END)
     return g.compile()
 
@@ -0,0 +1,163 @@
+import json
+import re
+from typing import Optional
+from bs4 import BeautifulSoup
+from extracting_data.extracting_consts import (
+    HTML_MAX_BYTES,
+    HTML_MAX_TEXT_CHARS,
+    HTML_MIN_MAIN_CONTENT_CHARS,
+)
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+BOILERPLATE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "iframe",
+    "nav",
+    "footer",
+    "aside",
+    "form",
+    "button",
+]
+BOILERPLATE_ATTR_RE = re.compile(
+    r"(?:^|[-_\s])(cookie|consent|gdpr|banner|nav|navbar|menu|footer|sidebar|"
+    r"breadcrumbs?|related|similar|recommended|share|social|newsletter|subscribe|"
+    r"popup|modal|promo|advert|ads)(?:$|[-_\s])",
+    re.IGNORECASE,
+)
+# A <header> inside these introduces the posting (title, company), elsewhere it
+# is the site header
+SECTIONING_TAGS = ["article", "main", "section"]
+BLOCK_TAGS = ["p", "li", "pre", "td", "dd", "h1", "h2", "h3", "h4"]
+CANDIDATE_TAGS = {"div", "section", "article", "main", "td", "ul", "ol", "body"}
+
+
+def truncate_html(html: str, max_bytes: int = HTML_MAX_BYTES) -> str:
+    """Hard cap on input size: huge pages are cut before parsing, not after."""
+    if len(html) <= max_bytes:
+        return html
+    return html[:max_bytes]
+
+
+def job_posting_from_json_ld(soup) -> Optional[str]:
+    """Most job boards embed the posting body as schema.org JobPosting JSON-LD."""
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            data = data.get("@graph", [data])
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            continue
+        for item in data:
+            if isinstance(item, dict) and is_job_posting(item):
+                description = item.get("description")
+                if isinstance(description, str) and description:
+                    body = blocks_to_text(BeautifulSoup(description, HTML_PARSER))
+                    title = item.get("title")
+                    return f"{title}\n{body}" if title else body
+    return None
+
+
+def is_job_posting(item: dict) -> bool:
+    types = item.get("@type")
+    if isinstance(types, str):
+        return types == "JobPosting"
+    return isinstance(types, list) and "JobPosting" in types
+
+
+def is_boilerplate(tag) -> bool:
+    if tag.attrs is None:
+        return False
+    attr_text = " ".join(tag.get("class") or []) + " " + (tag.get("id") or "")
+    return bool(BOILERPLATE_ATTR_RE.search(attr_text)) or tag.get("role") in {
+        "navigation",
+        "banner",
+        "contentinfo",
+        "dialog",
+    }
+
+
+def strip_boilerplate(soup) -> None:
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all("header"):
+        if tag.find_parent(SECTIONING_TAGS) is None:
+            tag.decompose()
+    for tag in soup.find_all(is_boilerplate):
+        if tag.name not in {"html", "body", "main", "article"}:
+            tag.decompose()
+
+
+def link_density(tag) -> float:
+    text_length = len(tag.get_text(" ", strip=True)) or 1
+    link_length = sum(len(a.get_text(" ", strip=True)) for a in tag.find_all("a"))
+    return min(link_length / text_length, 1.0)
+
+
+def best_content_node(soup):
+    """
+    Density-based scoring: every text block scores by its length and commas, the
+    score flows to its parent (and half to the grandparent), and link-heavy
+    containers are penalised. The best-scoring container is the posting body.
+    """
+    scores = {}
+    nodes = {}
+    for block in soup.find_all(BLOCK_TAGS):
+        text = block.get_text(" ", strip=True)
+        if len(text) < 25:
+            continue
+        block_score = 1 + text.count(",") + min(len(text) / 100, 3)
+        for ancestor, share in (
+            (block.parent, 1.0),
+            (block.parent and block.parent.parent, 0.5),
+        ):
+            if ancestor is None or ancestor.name not in CANDIDATE_TAGS:
+                continue
+            scores[id(ancestor)] = scores.get(id(ancestor), 0) + block_score * share
+            nodes[id(ancestor)] = ancestor
+    if not scores:
+        return None
+    best_id = max(scores, key=lambda k: scores[k] * (1 - link_density(nodes[k])))
+    return nodes[best_id]
+
+
+def blocks_to_text(node) -> str:
+    """Text with one line per block element, so section structure survives."""
+    for br in node.find_all("br"):
+        br.replace_with("\n")
+    for block in node.find_all(BLOCK_TAGS + ["div", "section", "ul", "ol", "tr"]):
+        block.insert_before("\n")
+        block.insert_after("\n")
+    for item in node.find_all("li"):
+        item.insert(0, "- ")
+    lines = (" ".join(line.split()) for line in node.get_text().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def extract_main_content(html: str, max_chars: int = HTML_MAX_TEXT_CHARS) -> str:
+    """Return only the main posting body of a page, without navigation and footers."""
+    soup = BeautifulSoup(truncate_html(html), HTML_PARSER)
+    text = job_posting_from_json_ld(soup)
+    if not text:
+        strip_boilerplate(soup)
+        node = best_content_node(soup)
+        if (
+            node is None
+            or len(node.get_text(" ", strip=True)) < HTML_MIN_MAIN_CONTENT_CHARS
+        ):
+            node = soup.body or soup
+        text = blocks_to_text(node)
+    return text[:max_chars]
@@ -0,0 +1,121 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from pypdf import PdfReader
+from extracting_data.extracting_consts import (
+    PDF_PARALLEL_MIN_PAGES,
+    PDF_PAGES_PER_SHARD,
+    PDF_MAX_PAGES,
+    PDF_MAX_CHARS,
+    PDF_MAX_WORKERS,
+    PAGE_SEPARATOR,
+)
+
+_pdf_pool = None
+# Worker side: (path, mtime, size) and the reader parsed for it
+_worker_reader: Optional[Tuple[Tuple[str, int, int], PdfReader]] = None
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_pdf_pool(max_workers: Optional[int] = PDF_MAX_WORKERS) -> ProcessPoolExecutor:
+    """Shared process pool, so worker start-up is paid once per process, not per CV."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn: forking a process that already runs LLM client threads is unsafe
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=max_workers or available_cpus(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(_pdf_pool.shutdown, wait=False, cancel_futures=True)
+    return _pdf_pool
+
+
+def cached_reader(path: str) -> PdfReader:
+    """
+    Reader of the last PDF this worker process read.
+
+    Shards of one document that land on the same worker reuse the parsed
+    file instead of parsing it again for every page range.
+    """
+    global _worker_reader
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _worker_reader is None or _worker_reader[0] != key:
+        _worker_reader = (key, PdfReader(path))
+    return _worker_reader[1]
+
+
+def read_pdf_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract text of pages [start, stop). Runs in a separate process."""
+    reader = cached_reader(path)
+    texts = []
+    for page_number in range(start, min(stop, len(reader.pages))):
+        texts.append(reader.pages[page_number].extract_text() or "")
+    return texts
+
+
+def shard_pages(n_pages: int, pages_per_shard: int) -> List[Tuple[int, int]]:
+    return [
+        (start, min(start + pages_per_shard, n_pages))
+        for start in range(0, n_pages, pages_per_shard)
+    ]
+
+
+def read_pdf_parallel(
+    path: str,
+    max_pages: Optional[int] = PDF_MAX_PAGES,
+    max_chars: Optional[int] = PDF_MAX_CHARS,
+    pages_per_shard: int = PDF_PAGES_PER_SHARD,
+    min_pages_for_parallel: int = PDF_PARALLEL_MIN_PAGES,
+) -> str:
+    """
+    Page-parallel PDF text extraction.
+
+    Page ranges are sharded across a process pool (pypdf is pure Python and holds
+    the GIL) and reassembled in page order. With `max_pages` set, only that many
+    pages are read, and once `max_chars` of text has been collected the
+    remaining pages (or shards) are skipped. Short documents (and single-core
+    hosts) are read serially in-process, where pool overhead would outweigh
+    the gain.
+    """
+    reader = PdfReader(path)
+    n_pages = len(reader.pages)
+    if max_pages is not None and n_pages > max_pages:
+        print(f"Reading only the first {max_pages} of {n_pages} pages of {path}")
+        n_pages = max_pages
+
+    texts = []
+    collected = 0
+
+    def budget_spent(page_texts) -> bool:
+        nonlocal collected
+        for page_text in page_texts:
+            if page_text:
+                texts.append(page_text)
+                collected += len(page_text)
+        return max_chars is not None and collected >= max_chars
+
+    if n_pages < min_pages_for_parallel or available_cpus() < 2:
+        for page_number, page in enumerate(reader.pages[:n_pages]):
+            if budget_spent([page.extract_text()]) and page_number + 1 < n_pages:
+                print(f"Stopped reading {path} after {page_number + 1} pages")
+                break
+        return PAGE_SEPARATOR.join(texts)
+
+    pool = get_pdf_pool()
+    shards = shard_pages(n_pages, pages_per_shard)
+    futures = [pool.submit(read_pdf_page_range, path, *shard) for shard in shards]
+    for i, future in enumerate(futures):
+        if budget_spent(future.result()) and i + 1 < len(futures):
+            for pending in futures[i + 1 :]:
+                pending.cancel()
+            print(f"Stopped reading {path} after {shards[i][1]} pages")
+            break
+    return PAGE_SEPARATOR.join(texts)
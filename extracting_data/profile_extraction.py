@@ -1,10 +1,72 @@
+import difflib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from trustcall import create_extractor
-from typing import Type
+from typing import Dict, Iterable, Optional, Tuple, Type
 from pydantic import BaseModel
-from extracting_data.extracting_prompts import SYSTEM_INSTRUCTIONS
+from llm_hedging import invoke_hedged
+from extracting_data.description_schemas import (
+    CVDescription,
+    CVExperienceSection,
+    CVProjectsSection,
+    CVEducationSection,
+    CV_SECTION_MODELS,
+)
+from extracting_data.extracting_prompts import (
+    SYSTEM_INSTRUCTIONS,
+    INCREMENTAL_UPDATE_PROMPT,
+)
+from extracting_data.extracting_consts import (
+    EXTRACTOR_CACHE_SIZE,
+    INCREMENTAL_MAX_CHANGE_RATIO,
+    INCREMENTAL_DIFF_CONTEXT_LINES,
+)
+from extracting_data.text_normalizer import segment_sections, header_key
 
+_extractors: OrderedDict = OrderedDict()
+_extractors_lock = threading.Lock()
 
-def trustcall_extract_text_to_schema(text: str, schema: Type[BaseModel], llm):
+
+def get_extractor(llm, schema: Type[BaseModel], tool_choice="any", enable_inserts=True):
+    """
+    Returns a cached TrustCall extractor for (llm, schema, options).
+
+    Building an extractor converts the schema into a tool definition and compiles
+    the extractor graph, which is pure overhead when repeated on every call.
+    The llm object is kept in the cache entry so its id cannot be reused while
+    the entry lives. Least recently used entries beyond EXTRACTOR_CACHE_SIZE
+    are dropped, and with them the reference to their llm.
+    """
+    key = (id(llm), schema, tool_choice, enable_inserts)
+    with _extractors_lock:
+        if key in _extractors:
+            _extractors.move_to_end(key)
+        else:
+            extractor = create_extractor(
+                llm=llm,
+                tools=[schema],
+                tool_choice=tool_choice,
+                enable_inserts=enable_inserts,
+            )
+            _extractors[key] = (llm, extractor)
+            while len(_extractors) > EXTRACTOR_CACHE_SIZE:
+                _extractors.popitem(last=False)
+        return _extractors[key][1]
+
+
+def warm_up_extractors(llm, schemas: Iterable[Type[BaseModel]]):
+    """Build extractors ahead of time, e.g. when the graph is built."""
+    for schema in schemas:
+        get_extractor(llm, schema)
+
+
+def trustcall_extract_text_to_schema(
+    text: str,
+    schema: Type[BaseModel],
+    llm,
+    system_instructions: str = SYSTEM_INSTRUCTIONS,
+):
     """
     Extracts structured data from plain text using TrustCall.
 
@@ -12,31 +74,166 @@ def trustcall_extract_text_to_schema(text: str, schema: Type[BaseModel], llm):
         text: Raw text of CV or Job Description.
         schema: Pydantic model (CVDescription or JobDescription).
         llm: LangChain-compatible LLM instance.
+        system_instructions: System prompt, defaults to SYSTEM_INSTRUCTIONS.
 
     Returns:
         Validated Pydantic object.
     """
 
-    extractor = create_extractor(
-        llm=llm,
-        tools=[schema],
-        tool_choice="any",
-        enable_inserts=True,
-    )
+    extractor = get_extractor(llm, schema)
 
-    result = extractor.invoke(
+    result = invoke_hedged(
+        f"extract_{schema.__name__}",
+        extractor,
         {
             "messages": [
                 {
                     "role": "system",
-                    "content": SYSTEM_INSTRUCTIONS,
+                    "content": system_instructions,
                 },
                 {
                     "role": "user",
                     "content": text,
                 },
             ]
-        }
+        },
     )
 
     return result["responses"][0]
+
+
+# Section header keys (see text_normalizer.SECTION_HEADER_WORDS) whose text
+# spans feed each CV sub-model; the header and skills models read everything
+CV_SECTION_HEADERS = {
+    CVExperienceSection: {
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment",
+        "employment history",
+        "work history",
+    },
+    CVProjectsSection: {"projects", "personal projects", "portfolio"},
+    CVEducationSection: {"education", "certifications", "certificates", "courses"},
+}
+
+
+def cv_section_spans(text: str) -> Dict[Type[BaseModel], Optional[str]]:
+    """
+    Text each CV sub-model is extracted from. Experience and education fall back
+    to the whole CV when no matching section header is found; projects are only
+    extracted from explicitly labeled project sections.
+    """
+    sections = segment_sections(text)
+    spans = {}
+    for model in CV_SECTION_MODELS:
+        headers = CV_SECTION_HEADERS.get(model)
+        if headers is None:
+            spans[model] = text
+            continue
+        span = "\n\n".join(
+            f"{header}\n{body}"
+            for header, body in sections
+            if header and header_key(header) in headers
+        )
+        if span:
+            spans[model] = span
+        elif model is not CVProjectsSection:
+            spans[model] = text
+    return spans
+
+
+def extract_cv_by_sections(
+    text: str, llm, system_instructions: str = SYSTEM_INSTRUCTIONS
+) -> CVDescription:
+    """
+    Extracts CVDescription as concurrent sub-model extractions over the relevant
+    text spans, so wall time follows the longest section instead of the sum.
+    """
+    spans = cv_section_spans(text)
+    with ThreadPoolExecutor(max_workers=len(spans)) as pool:
+        futures = [
+            pool.submit(
+                trustcall_extract_text_to_schema, span, model, llm, system_instructions
+            )
+            for model, span in spans.items()
+        ]
+        merged = {}
+        for future in futures:
+            merged.update(future.result().model_dump(exclude_unset=True))
+    return CVDescription.model_validate(merged)
+
+
+def text_changes(old_text: str, new_text: str) -> Tuple[float, str]:
+    """Share of changed lines and a unified diff of the changed hunks."""
+    old_lines = old_text.splitlines()
+    new_lines = new_text.splitlines()
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    changed = sum(
+        max(i2 - i1, j2 - j1)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    )
+    ratio = changed / max(len(old_lines), len(new_lines), 1)
+    diff = "\n".join(
+        difflib.unified_diff(
+            old_lines,
+            new_lines,
+            n=INCREMENTAL_DIFF_CONTEXT_LINES,
+            lineterm="",
+        )
+    )
+    return ratio, diff
+
+
+def trustcall_patch_schema(
+    diff: str,
+    existing: BaseModel,
+    llm,
+    topic: str,
+    system_instructions: str = SYSTEM_INSTRUCTIONS,
+):
+    """Patch an existing extraction with TrustCall from a text diff only."""
+    schema = type(existing)
+    extractor = get_extractor(llm, schema, enable_inserts=False)
+    result = invoke_hedged(
+        f"update_{schema.__name__}",
+        extractor,
+        {
+            "messages": [
+                {"role": "system", "content": system_instructions},
+                {
+                    "role": "user",
+                    "content": INCREMENTAL_UPDATE_PROMPT.format(topic=topic, diff=diff),
+                },
+            ],
+            "existing": {schema.__name__: existing.model_dump()},
+        },
+    )
+    for response, metadata in zip(result["responses"], result["response_metadata"]):
+        if metadata.get("json_doc_id") == schema.__name__:
+            return response
+    return result["responses"][0] if result["responses"] else existing
+
+
+def extract_incrementally(
+    previous_text: str,
+    previous_profile: BaseModel,
+    new_text: str,
+    llm,
+    topic: str,
+    system_instructions: str = SYSTEM_INSTRUCTIONS,
+) -> Optional[BaseModel]:
+    """
+    Re-extraction after an edit: an unchanged text reuses the previous profile,
+    a small edit patches it from the diff. Returns None when the text changed
+    too much and a full extraction is needed.
+    """
+    if previous_text == new_text:
+        return previous_profile
+    ratio, diff = text_changes(previous_text, new_text)
+    if ratio > INCREMENTAL_MAX_CHANGE_RATIO:
+        return None
+    return trustcall_patch_schema(
+        diff, previous_profile, llm, topic, system_instructions
+    )
@@ -1,59 +1,60 @@
+import threading
 from pathlib import Path
+from typing import List, Optional
 from urllib.parse import urlparse
-from pypdf import PdfReader
-from docx import Document
-import textract
-from consts import MODEL_NAME
-from extracting_data.extracting_consts import JOB_DESCRIPTION, INPUT_ATTEMPTS
+from consts import MODEL_NAME, CACHE_DIR
+from disk_cache import DiskCache, content_hash, prompt_version, llm_model_name
+from llm_hedging import invoke_hedged
+from extracting_data.extracting_consts import (
+    JOB_DESCRIPTION,
+    INPUT_ATTEMPTS,
+    DOCUMENT_CACHE_SUBDIR,
+    DOCUMENT_CACHE_MAX_BYTES,
+    CLEANUP_MODE,
+    CLEANUP_MODE_CHUNKED,
+    CLEANUP_MODE_LOCAL,
+    CLEANUP_MODE_NONE,
+)
+from extracting_data.document_readers import read_document
+from extracting_data.chunked_cleanup import chunked_cleanup
+from extracting_data.text_normalizer import normalize_text, local_cleanup
+from extracting_data.url_fetching import fetch_urls
+from extracting_data.html_content import extract_main_content
 from extracting_data.extracting_prompts import EXTRACTION_PROMPT
-import requests
-from bs4 import BeautifulSoup
 import os
 from langchain_openai import ChatOpenAI
 
+_document_cache = None
 
-def extract_text_from_url(url: str) -> str:
-    headers = {"User-Agent": "Mozilla/5.0"}
-
-    try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
 
-        text = soup.get_text(separator=" ")
-        text = " ".join(text.split())
+class DocumentReadError(Exception):
+    """A document given up front could not be read and there is nobody to ask."""
 
-        return text
-    except Exception as e:
-        print(f"Failed to reach link {url}:", e)
 
+# CV and job are read concurrently, interactive prompts must not interleave
+_input_lock = threading.Lock()
 
-def read_pdf(path: str) -> str:
-    reader = PdfReader(path)
-    text = []
-    for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            text.append(page_text)
-    return "\n".join(text)
 
-
-def read_docx(path: str) -> str:
-    doc = Document(path)
-    return "\n".join(p.text for p in doc.paragraphs)
+def get_document_cache() -> DiskCache:
+    """Process-wide cache of parsed and LLM-cleaned document text."""
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DiskCache(
+            CACHE_DIR / DOCUMENT_CACHE_SUBDIR, DOCUMENT_CACHE_MAX_BYTES
+        )
+    return _document_cache
 
 
-def read_txt(path: str) -> str:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
+def extract_texts_from_urls(urls: List[str]) -> List[Optional[str]]:
+    """Download all urls concurrently (pooled, revalidation-cached) and parse them."""
+    return [
+        extract_main_content(html) if html is not None else None
+        for html in fetch_urls(urls)
+    ]
 
 
-def read_doc(path: str) -> str:
-    text = textract.process(path)
-    return text.decode("utf-8", errors="ignore")
+def extract_text_from_url(url: str) -> str:
+    return extract_texts_from_urls([url])[0]
 
 
 def is_url_string(s):
@@ -79,11 +80,29 @@ class ReadDocuments:
         document_topic=JOB_DESCRIPTION,
         llm=None,
         init_pipeline=True,
+        use_cache=True,
+        cleanup_mode=CLEANUP_MODE,
+        interactive=True,
+        fetch_error=None,
     ):
+        """
+        interactive=False never asks on stdin (e.g. inside the Streamlit server),
+        a missing or unreadable input raises DocumentReadError instead.
+        fetch_error is set when doc_input is a link that already failed to
+        download, it is reported instead of downloading the link again.
+        """
         self.document_topic = document_topic
+        self.interactive = interactive
+        self.read_error = None
+        self.fetch_error = fetch_error
+        self.cleanup_mode = cleanup_mode
         self.llm = llm
         self.full_desciption_text = None
+        self.raw_text = None
         self.doc_input = doc_input
+        self.cache = get_document_cache() if use_cache else None
+        self.cache_key = None
+        self.cached_entry = None
         if init_pipeline:
             self.pipeline()
 
@@ -96,50 +115,107 @@ class ReadDocuments:
         )
 
     def init_doc_input(self):
-        self.doc_input = input(
-            f"Please enter {self.document_topic} data or provide path to file containing it\n"
-        )
+        with _input_lock:
+            self.doc_input = input(
+                f"Please enter {self.document_topic} data or provide path to file containing it\n"
+            )
 
     def extract_text_per_local_document_type(self):
-        if self.doc_input.endswith(".pdf"):
-            reading_func = read_pdf
-        elif self.doc_input.endswith(".docx"):
-            reading_func = read_docx
-        elif self.doc_input.endswith(".docx"):
-            reading_func = read_doc
-        elif self.doc_input.endswith(".txt"):
-            reading_func = read_txt
         try:
-            return reading_func(self.doc_input)
-        except:
+            return read_document(self.doc_input)
+        except Exception as e:
+            print(f"Failed to read local document {self.doc_input}:", e)
+            print("Please resubmit")
+            self.read_error = f"failed to read {Path(self.doc_input).name}: {e}"
             self.doc_input = None
-            print(f"Failed to read local document {self.doc_input}. Please resubmit ")
+
+    def make_cache_key(self, content) -> str:
+        """Key on document content + topic + model + prompt, never on file names."""
+        return content_hash(
+            content,
+            self.document_topic,
+            llm_model_name(self.llm),
+            prompt_version(EXTRACTION_PROMPT),
+            self.cleanup_mode,
+        )
+
+    def read_cached(self, content):
+        if self.cache is None:
+            return None
+        self.cache_key = self.make_cache_key(content)
+        self.cached_entry = self.cache.get(self.cache_key)
+        return self.cached_entry
 
     def extract_text(self):
         path_str = is_path_string(self.doc_input)
         if path_str:
+            cached = self.read_cached(Path(self.doc_input).read_bytes())
+            if cached is not None:
+                return cached["raw_text"]
             return self.extract_text_per_local_document_type()
         elif is_url_string(self.doc_input):
-            return extract_text_from_url(self.doc_input)
+            if self.fetch_error:
+                # Only the first attempt is skipped, a retry downloads again
+                self.read_error, self.fetch_error = self.fetch_error, None
+                return None
+            text = extract_text_from_url(self.doc_input)
+            if text is not None:
+                self.read_cached(text)
+            else:
+                self.read_error = f"failed to download {self.doc_input}"
+            return text
         else:
+            self.read_cached(self.doc_input)
             return self.doc_input
 
+    def clean_text(self, text: str) -> str:
+        text = normalize_text(text)
+        if self.cleanup_mode == CLEANUP_MODE_NONE:
+            return local_cleanup(text, self.document_topic)[0]
+        if self.cleanup_mode == CLEANUP_MODE_LOCAL:
+            local_text, well_structured = local_cleanup(text, self.document_topic)
+            if well_structured:
+                return local_text
+        if self.llm is None:
+            self.init_llm()
+        if self.cleanup_mode == CLEANUP_MODE_CHUNKED:
+            return chunked_cleanup(text, self.document_topic, self.llm)
+        result = invoke_hedged(
+            "cleanup",
+            self.llm,
+            EXTRACTION_PROMPT.format(topic=self.document_topic, text=text),
+        )
+        return result.content
+
     def pipeline(self):
+        if not self.interactive:
+            if self.doc_input is not None:
+                self.raw_text = self.extract_text()
+            if self.raw_text is None:
+                raise DocumentReadError(
+                    f"Could not read the {self.document_topic}: "
+                    f"{self.read_error or 'nothing was provided'}"
+                )
         attmepts_count = 0
-        while self.full_desciption_text is None and attmepts_count <= INPUT_ATTEMPTS:
+        while self.raw_text is None and attmepts_count <= INPUT_ATTEMPTS:
             if self.doc_input is None:
                 self.init_doc_input()
-            self.full_desciption_text = self.extract_text()
+            self.raw_text = self.extract_text()
             attmepts_count += 1
-        if self.full_desciption_text is not None:
-            if self.llm is None:
-                self.init_llm()
-            result = self.llm.invoke(
-                EXTRACTION_PROMPT.format(
-                    topic=self.document_topic, text=self.full_desciption_text
+        if self.raw_text is not None:
+            if self.cached_entry is not None and self.cached_entry.get("cleaned_text"):
+                self.full_desciption_text = self.cached_entry["cleaned_text"]
+                return
+            self.full_desciption_text = self.clean_text(self.raw_text)
+            if self.cache is not None and self.cache_key:
+                self.cache.put(
+                    self.cache_key,
+                    {
+                        "topic": self.document_topic,
+                        "raw_text": self.raw_text,
+                        "cleaned_text": self.full_desciption_text,
+                    },
                 )
-            )
-            self.full_desciption_text = result.content
         else:
             print(
                 f"Failed to get the text for {self.document_topic}. See you next time"
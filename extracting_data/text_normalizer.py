@@ -0,0 +1,205 @@
+import re
+from typing import List, Optional, Tuple
+from extracting_data.extracting_consts import (
+    PAGE_SEPARATOR,
+    CV,
+    MIN_SECTIONS_FOR_LOCAL_CLEANUP,
+)
+
+SECTION_HEADER_WORDS = {
+    "summary",
+    "profile",
+    "professional summary",
+    "about",
+    "about me",
+    "experience",
+    "work experience",
+    "professional experience",
+    "employment",
+    "employment history",
+    "work history",
+    "projects",
+    "personal projects",
+    "portfolio",
+    "education",
+    "skills",
+    "technical skills",
+    "soft skills",
+    "certifications",
+    "certificates",
+    "courses",
+    "languages",
+    "publications",
+    "awards",
+    "volunteering",
+    "responsibilities",
+    "requirements",
+    "qualifications",
+    "nice to have",
+    "benefits",
+    "about the role",
+    "about us",
+    "what you will do",
+    "what we offer",
+}
+
+UNICODE_REPLACEMENTS = {
+    "\u00a0": " ",  # no-break space
+    "\u2007": " ",
+    "\u2009": " ",
+    "\u200a": " ",
+    "\u202f": " ",
+    "\u3000": " ",
+    "\u200b": "",  # zero-width characters
+    "\u200c": "",
+    "\u200d": "",
+    "\u2060": "",
+    "\ufeff": "",
+    "\u00ad": "",  # soft hyphen
+    "\ufb00": "ff",  # ligatures from PDF fonts
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\ufffd": "",
+    "\uf0b7": "\u2022",  # Symbol-font bullet from Word exports
+}
+
+BULLET_RE = re.compile(r"^(\s*)(?:[•●▪■◦‣∙·○◆➢➤►⁃*]|[-–—](?=\s))\s*")
+LETTER_SPACED_RE = re.compile(
+    r"^\s*(?:[A-Za-z&] ){2,}[A-Za-z&](?:\s{2,}(?:[A-Za-z&] )*[A-Za-z&])*\s*$"
+)
+CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0e-\x1f\x7f]")
+
+MONTH = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?"
+DATE = rf"(?:{MONTH}\s+(?:19|20)\d{{2}}|(?:0?[1-9]|1[0-2])[/.](?:19|20)\d{{2}}|(?:19|20)\d{{2}})"
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{DATE})\s*(?:-{{1,2}}|–|—|\bto\b|\buntil\b)\s*"
+    rf"(?P<end>{DATE}|[Pp]resent|[Cc]urrent|[Nn]ow|[Tt]oday)",
+)
+
+
+def header_key(line: str) -> str:
+    return re.sub(r"[^a-z0-9 ]+", "", line.lower()).strip()
+
+
+def is_section_header(line: str) -> bool:
+    """Short standalone line that looks like a CV / job posting section title."""
+    stripped = line.strip().strip("#*").strip()
+    if not stripped or len(stripped) > 40 or stripped.endswith("."):
+        return False
+    if header_key(stripped.rstrip(":")) in SECTION_HEADER_WORDS:
+        return True
+    words = stripped.rstrip(":").split()
+    return 0 < len(words) <= 4 and stripped.isupper()
+
+
+def replace_unicode_artifacts(text: str) -> str:
+    for artifact, replacement in UNICODE_REPLACEMENTS.items():
+        text = text.replace(artifact, replacement)
+    return CONTROL_CHARS_RE.sub("", text)
+
+
+def collapse_letter_spacing(line: str) -> str:
+    """'E D U C A T I O N' -> 'Education', 'W O R K  E X P' -> 'Work Exp'."""
+    if not LETTER_SPACED_RE.match(line):
+        return line
+    words = [word.replace(" ", "") for word in re.split(r"\s{2,}", line.strip())]
+    return " ".join(words).title()
+
+
+def normalize_date_ranges(line: str) -> str:
+    """Unify range separators ('2019 - 2021', 'Jan 2020 to Present') to ' – '."""
+    return DATE_RANGE_RE.sub(
+        lambda m: f"{m.group('start')} – {m.group('end')}",
+        line,
+    )
+
+
+def unify_bullet(line: str) -> str:
+    return BULLET_RE.sub(lambda m: f"{m.group(1)}- ", line, count=1)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Deterministic version of the mechanical fixes EXTRACTION_PROMPT asks for:
+    unicode artifacts, letter-spaced headers, date ranges, bullets and spacing.
+    Page breaks are kept so the chunked cleanup can still split on them.
+    """
+    pages = []
+    for page in replace_unicode_artifacts(text).split(PAGE_SEPARATOR):
+        lines = []
+        for line in page.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+            line = line.replace("\t", " ").replace("\f", "")
+            line = collapse_letter_spacing(line)
+            line = unify_bullet(line)
+            line = normalize_date_ranges(line)
+            line = re.sub(r" {2,}", " ", line).strip()
+            lines.append(line)
+        page_text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+        if page_text:
+            pages.append(page_text)
+    return PAGE_SEPARATOR.join(pages)
+
+
+def format_header(line: str) -> str:
+    header = line.strip().strip("#*").strip().rstrip(":")
+    return header.title() if header.isupper() or header.islower() else header
+
+
+def segment_sections(text: str) -> List[Tuple[Optional[str], str]]:
+    """
+    Split text into (header, body) pairs in document order. Text before the first
+    header (usually name/contact/summary) is returned with header None.
+    """
+    sections = []
+    header, body = None, []
+    for line in text.replace(PAGE_SEPARATOR, "\n").split("\n"):
+        if is_section_header(line):
+            if header is not None or any(l.strip() for l in body):
+                sections.append((header, "\n".join(body).strip()))
+            header, body = format_header(line), []
+        else:
+            body.append(line)
+    if header is not None or any(l.strip() for l in body):
+        sections.append((header, "\n".join(body).strip()))
+    return sections
+
+
+def is_well_structured(
+    sections: List[Tuple[Optional[str], str]], document_topic: str = CV
+) -> bool:
+    """
+    True when the text already has recognisable, non-empty sections and little
+    extraction noise, i.e. an LLM pass would mostly re-emit it unchanged.
+    """
+    known_sections = [
+        header
+        for header, body in sections
+        if header and header_key(header) in SECTION_HEADER_WORDS and body
+    ]
+    min_sections = MIN_SECTIONS_FOR_LOCAL_CLEANUP.get(document_topic, 3)
+    if len(known_sections) < min_sections:
+        return False
+    text = "\n".join(body for _, body in sections)
+    if not text:
+        return False
+    noise = sum(
+        1
+        for ch in text
+        if not (ch.isalnum() or ch.isspace() or ch in ".,;:-–()/&+%'\"#@")
+    )
+    return noise / len(text) < 0.03
+
+
+def render_sections(sections: List[Tuple[Optional[str], str]]) -> str:
+    blocks = []
+    for header, body in sections:
+        blocks.append(f"{header}\n{body}" if header else body)
+    return "\n\n".join(block.strip() for block in blocks if block.strip())
+
+
+def local_cleanup(text: str, document_topic: str = CV) -> Tuple[str, bool]:
+    """Normalized, re-sectioned text plus whether it is well structured as-is."""
+    sections = segment_sections(normalize_text(text))
+    return render_sections(sections), is_well_structured(sections, document_topic)
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+import httpx
+from consts import CACHE_DIR
+from disk_cache import DiskCache, content_hash
+from extracting_data.extracting_consts import (
+    URL_CACHE_SUBDIR,
+    URL_CACHE_MAX_BYTES,
+    URL_CACHE_FRESH_SECONDS,
+    URL_FETCH_TIMEOUT,
+    URL_MAX_CONNECTIONS,
+    URL_MAX_CONNECTIONS_PER_HOST,
+    URL_USER_AGENT,
+)
+
+_url_cache = None
+
+
+def get_url_cache() -> DiskCache:
+    """Process-wide on-disk cache of fetched pages and their validators."""
+    global _url_cache
+    if _url_cache is None:
+        _url_cache = DiskCache(CACHE_DIR / URL_CACHE_SUBDIR, URL_CACHE_MAX_BYTES)
+    return _url_cache
+
+
+class UrlFetcher:
+    """
+    Async page fetcher with one pooled HTTP client, a per-host connection limit
+    and ETag / Last-Modified revalidation against an on-disk cache.
+
+    Pages fetched less than `fresh_seconds` ago are served from the cache without
+    any request. Older entries are revalidated with a conditional GET, so an
+    unchanged posting costs a 304 instead of a full download.
+
+    Use as `async with UrlFetcher() as fetcher: await fetcher.fetch_many(urls)`.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[DiskCache] = None,
+        fresh_seconds: float = URL_CACHE_FRESH_SECONDS,
+        max_connections: int = URL_MAX_CONNECTIONS,
+        max_connections_per_host: int = URL_MAX_CONNECTIONS_PER_HOST,
+        timeout: float = URL_FETCH_TIMEOUT,
+    ):
+        self.cache = cache if cache is not None else get_url_cache()
+        self.fresh_seconds = fresh_seconds
+        self.max_connections_per_host = max_connections_per_host
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": URL_USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(
+                self.max_connections_per_host
+            )
+        return self._host_semaphores[host]
+
+    async def fetch(self, url: str) -> str:
+        """Return the page body, raising httpx errors on failure."""
+        key = content_hash(url)
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry["fetched_at"] < self.fresh_seconds:
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        async with self._host_semaphore(url):
+            response = await self.client.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = time.time()
+            self.cache.put(key, entry)
+            return entry["body"]
+
+        response.raise_for_status()
+        self.cache.put(
+            key,
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "body": response.text,
+            },
+        )
+        return response.text
+
+    async def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """Fetch urls concurrently; failed urls come back as None, in input order."""
+        results = await asyncio.gather(
+            *(self.fetch(url) for url in urls), return_exceptions=True
+        )
+        bodies = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                print(f"Failed to reach link {url}:", result)
+                bodies.append(None)
+            else:
+                bodies.append(result)
+        return bodies
+
+
+async def afetch_urls(urls: List[str], **fetcher_kwargs) -> List[Optional[str]]:
+    async with UrlFetcher(**fetcher_kwargs) as fetcher:
+        return await fetcher.fetch_many(urls)
+
+
+def fetch_urls(urls: List[str], **fetcher_kwargs) -> List[Optional[str]]:
+    """Blocking entry point, coroutines should await afetch_urls instead."""
+    coroutine = afetch_urls(urls, **fetcher_kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # Sync caller on a thread that already runs a loop, asyncio.run would
+    # raise there: fetch on a loop of its own in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
@@ -6,6 +6,12 @@ from match_evaluation.evaluation_graph import (
     run_evaluation_flow,
 )
 from extracting_data.extraction_graph import build_extraction_graph, run_extraction_flow
+from extracting_data.extracting_consts import FUSED_EXTRACTION
+from match_evaluation.evaluation_consts import (
+    FUSED_EVALUATION,
+    LOCAL_RECENCY_EVALUATION,
+    RELEVANCE_GATE,
+)
 from improvement_suggestions.improvement_graph import (
     build_rewrite_graph,
     run_rewrite_flow,
@@ -13,11 +19,22 @@ from improvement_suggestions.improvement_graph import (
 from improvement_suggestions.improvement_functions import prompt_user_to_cv_rewrite
 
 
-def build_graph(llm) -> StateGraph:
+def build_graph(
+    llm,
+    fused_extraction=FUSED_EXTRACTION,
+    local_recency=LOCAL_RECENCY_EVALUATION,
+    fused_evaluation=FUSED_EVALUATION,
+    relevance_gate=RELEVANCE_GATE,
+) -> StateGraph:
     builder = StateGraph(AgentState)
 
-    extraction_graph = build_extraction_graph(llm)
-    evaluation_graph = build_evaluation_graph(llm)
+    extraction_graph = build_extraction_graph(llm, fused=fused_extraction)
+    evaluation_graph = build_evaluation_graph(
+        llm,
+        local_recency=local_recency,
+        fused=fused_evaluation,
+        gate=relevance_gate,
+    )
     rewrite_graph = build_rewrite_graph(llm)
 
     builder.add_node(
@@ -1,4 +1,5 @@
 from match_evaluation.agent_state import AgentState
+from llm_limiter import invoke_limited
 from extracting_data.description_schemas import CVDescription, JobDescription
 from improvement_suggestions.improvement_state import CVRewriteState
 from improvement_suggestions.improvement_prompts import (
@@ -83,6 +84,10 @@ def add_runs_with_formatting(paragraph, text):
 def prompt_user_to_cv_rewrite(
     state: AgentState,
 ):
+    if _state_get(state, "relevant") is False:
+        # Tailoring the CV cannot close the gap for an unrelated position
+        print(_state_get(state, "final_scoring").recommendation)
+        return "finish"
     continue_decision = input(
         "Do you want to update your CV to match profile better? Answer yes or no\n"
     )
@@ -131,6 +136,14 @@ def _state_get(state, key, default=None):
     return getattr(state, key, default)
 
 
+def _result_get(state, key, field, default):
+    """Field of an evaluation result, default when the dimension was not evaluated."""
+    result = _state_get(state, key)
+    if result is None:
+        return default
+    return _state_get(result, field, default)
+
+
 def _coerce_to_model(value, model_cls):
     """
     Ensure we pass actual model instances (or dicts convertible) to CVRewriteState.
@@ -158,19 +171,47 @@ def _invoke_updated_cv(prompt: str, llm: Any) -> dict:
     Try structured output; if the model returns an unexpected shape, fall back to raw content.
     """
     try:
-        result = llm.with_structured_output(UpdatedCvResult).invoke(prompt)
+        result = invoke_limited(llm.with_structured_output(UpdatedCvResult), prompt)
         if hasattr(result, "updated_cv_text"):
             return {"updated_cv_text": result.updated_cv_text}
     except Exception:
         pass
 
-    raw = llm.invoke(prompt)
+    raw = invoke_limited(llm, prompt)
     updated_cv_text = (
         getattr(raw, "content", None) or getattr(raw, "text", None) or str(raw)
     )
     return {"updated_cv_text": updated_cv_text}
 
 
+def job_skill_naming(cv: CVDescription, job: JobDescription, skill_ids) -> dict:
+    """Map CV skill names to the job posting's name for the same canonical skill"""
+    skill_ids = skill_ids or {}
+    job_names = {}
+    for name in [s.name for s in job.required_technical_skills] + [
+        s.name for s in job.nice_to_have_skills
+    ]:
+        if name in skill_ids:
+            job_names.setdefault(skill_ids[name], name)
+    naming = {}
+    for skill in cv.technical_skills:
+        job_name = job_names.get(skill_ids.get(skill.name))
+        if job_name and job_name != skill.name:
+            naming[skill.name] = job_name
+    return naming
+
+
+def render_skills(skills, skill_naming):
+    return "\n".join(
+        (
+            f"- {s.name} (write as: {skill_naming[s.name]})"
+            if s.name in skill_naming
+            else f"- {s.name}"
+        )
+        for s in skills
+    )
+
+
 def create_rewrite_state(state: AgentState, llm) -> CVRewriteState:
     """
     Extract only the essential information needed for CV rewriting.
@@ -194,34 +235,49 @@ def create_rewrite_state(state: AgentState, llm) -> CVRewriteState:
         target_job=target_job,
         original_cv_text=_state_get(state, "cv_description_text"),
         # Skills optimization
-        matched_skills=_state_get(state, "skills_match").matched_items,
-        partial_skill_matches=_state_get(state, "skills_match").partial_matches,
-        matched_keywords=_state_get(state, "keyword_match").matched_keywords,
-        missing_keywords=_state_get(state, "keyword_match").missing_keywords,
+        matched_skills=_result_get(state, "skills_match", "matched_items", []),
+        partial_skill_matches=_result_get(state, "skills_match", "partial_matches", []),
+        matched_keywords=_result_get(state, "keyword_match", "matched_keywords", []),
+        missing_keywords=_result_get(state, "keyword_match", "missing_keywords", []),
         # Requirements
-        must_haves_satisfied=_state_get(
-            state, "requirements_coverage"
-        ).must_have_satisfied,
-        must_haves_missing=_state_get(state, "requirements_coverage").must_have_missing,
-        nice_to_haves_satisfied=_state_get(
-            state, "requirements_coverage"
-        ).nice_to_have_satisfied,
+        must_haves_satisfied=_result_get(
+            state, "requirements_coverage", "must_have_satisfied", []
+        ),
+        must_haves_missing=_result_get(
+            state, "requirements_coverage", "must_have_missing", []
+        ),
+        nice_to_haves_satisfied=_result_get(
+            state, "requirements_coverage", "nice_to_have_satisfied", []
+        ),
         # Experience context
-        recent_relevant_experience=_state_get(
-            state, "recency_relevance"
-        ).recent_relevant_experience,
-        matched_domains=_state_get(state, "domain_match").matched_items,
-        transferable_domains=_state_get(state, "domain_match").transferable_experience,
+        recent_relevant_experience=_result_get(
+            state, "recency_relevance", "recent_relevant_experience", []
+        ),
+        matched_domains=_result_get(state, "domain_match", "matched_items", []),
+        transferable_domains=_result_get(
+            state, "domain_match", "transferable_experience", []
+        ),
         # Seniority
-        candidate_level=_state_get(state, "seniority_match").candidate_level,
-        required_level=_state_get(state, "seniority_match").required_level,
-        title_alignment=_state_get(state, "seniority_match").title_alignment,
+        candidate_level=_result_get(
+            state, "seniority_match", "candidate_level", "unknown"
+        ),
+        required_level=_result_get(
+            state, "seniority_match", "required_level", "unknown"
+        ),
+        title_alignment=_result_get(
+            state, "seniority_match", "title_alignment", "unknown"
+        ),
         # Strategic priorities
-        top_strengths=_state_get(state, "final_scoring").strengths[:5],
-        key_weaknesses=_state_get(state, "final_scoring").weaknesses[:3],
-        red_flags=_state_get(state, "all_red_flags"),
-        keyword_frequency_targets=_state_get(state, "keyword_match").keyword_frequency,
-        focus_areas=_state_get(state, "final_scoring").focus_areas or [],
+        top_strengths=_result_get(state, "final_scoring", "strengths", [])[:5],
+        key_weaknesses=_result_get(state, "final_scoring", "weaknesses", [])[:3],
+        red_flags=_state_get(state, "all_red_flags") or [],
+        skill_naming=job_skill_naming(
+            original_cv, target_job, _state_get(state, "skill_ids")
+        ),
+        keyword_frequency_targets=_result_get(
+            state, "keyword_match", "keyword_frequency", {}
+        ),
+        focus_areas=_result_get(state, "final_scoring", "focus_areas", None) or [],
     )
 
 
@@ -232,8 +288,8 @@ def rewrite_cv_initial(state: CVRewriteState, llm):
         original_cv_text=state.original_cv_text,
         total_years_experience=state.original_cv.total_years_experience,
         cv_domains=", ".join(state.original_cv.domains),
-        technical_skills="\n".join(
-            f"- {s.name}" for s in state.original_cv.technical_skills
+        technical_skills=render_skills(
+            state.original_cv.technical_skills, state.skill_naming
         ),
         soft_skills="\n".join(f"- {s.name}" for s in state.original_cv.soft_skills),
         experience_history=render_experience(state.original_cv.experience),
@@ -194,7 +194,7 @@ Do NOT claim higher seniority or ownership than stated.
   Tier 1: matched_skills + matched_keywords
   Tier 2: matched_skills
   Tier 3: remaining relevant skills
-- Use JD naming only when equivalent
+- Use JD naming only when equivalent; skills marked "(write as: X)" are equivalent, write them as X
 
 6. FORMATTING (ATS-SAFE)
 - Standard headers
@@ -61,6 +61,10 @@ class CVRewriteState(BaseModel):
     )
 
     # Optimization priorities
+    skill_naming: Dict[str, str] = Field(
+        description="CV skill name -> name the job posting uses for the same skill",
+        default_factory=dict,
+    )
     keyword_frequency_targets: Dict[str, int] = Field(
         description="How many times each critical keyword should appear",
         default_factory=dict,
@@ -79,4 +83,3 @@ class CVRewriteState(BaseModel):
     )
 
     feedback_round: int = 0
-
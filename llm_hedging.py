@@ -0,0 +1,224 @@
+import asyncio
+import math
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+from consts import (
+    LLM_HEDGING,
+    HEDGE_PERCENTILE,
+    HEDGE_BUDGET,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_LATENCY_WINDOW,
+)
+from llm_limiter import ainvoke_limited, get_llm_limiter, invoke_limited
+
+
+class LatencyTracker:
+    """Recent LLM call latencies, per node."""
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW):
+        self._samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def percentile(
+        self, key: str, percentile: float, min_samples: int = HEDGE_MIN_SAMPLES
+    ) -> Optional[float]:
+        """Latency below which percentile of the samples fall, None while too few."""
+        with self._lock:
+            samples = sorted(self._samples[key])
+        if len(samples) < max(min_samples, 1):
+            return None
+        return samples[min(len(samples) - 1, math.ceil(percentile * len(samples)) - 1)]
+
+
+class HedgeBudget:
+    """Caps hedges at a share of all requests, so a slow provider is not flooded."""
+
+    def __init__(self, ratio: float = HEDGE_BUDGET):
+        self.ratio = ratio
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+
+class LLMHedger:
+    """
+    Fires a duplicate of an LLM request that is slower than usual.
+
+    Once a node has enough samples, a request still running after the
+    node's percentile latency gets one hedge if the budget allows. The first
+    successful response wins. Async losers are cancelled. A blocking sync
+    call cannot be interrupted, so the loser runs on in its daemon thread,
+    its limiter slot is released (see LimiterSlot) and its response is
+    dropped. The timer starts when the request holds a limiter slot, so
+    waiting in the queue does not trigger hedges.
+
+    Every attempt's latency is recorded, failed ones included. A cancelled
+    loser records the time until cancellation, a lower bound.
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        budget: float = HEDGE_BUDGET,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker()
+        self.budget = HedgeBudget(budget)
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        return self.latencies.percentile(key, self.percentile, self.min_samples)
+
+    def invoke(self, key: str, runnable, *args, **kwargs):
+        self.budget.count_request()
+        delay = self.hedge_delay(key)
+        results = queue.Queue()
+        started = threading.Event()
+        limiter = get_llm_limiter()
+        slots = []
+
+        def attempt(slot):
+            try:
+                with slot:
+                    started.set()
+                    start = time.perf_counter()
+                    try:
+                        result = runnable.invoke(*args, **kwargs)
+                    finally:
+                        self.latencies.record(key, time.perf_counter() - start)
+                results.put((result, None))
+            except BaseException as e:
+                started.set()
+                results.put((None, e))
+
+        def launch():
+            # Created here, so the slot joins this thread's slot group
+            slots.append(limiter.slot())
+            threading.Thread(target=attempt, args=(slots[-1],), daemon=True).start()
+
+        attempts = 1
+        try:
+            if delay is None:
+                # Not enough samples yet, only learn the latency
+                attempt(limiter.slot())
+            else:
+                launch()
+                started.wait()
+                try:
+                    result, error = results.get(timeout=delay)
+                except queue.Empty:
+                    if self.budget.try_spend():
+                        launch()
+                        attempts += 1
+                else:
+                    if error is None:
+                        return result
+                    raise error
+
+            first_error = None
+            for _ in range(attempts):
+                result, error = results.get()
+                if error is None:
+                    return result
+                first_error = first_error or error
+            raise first_error
+        finally:
+            for slot in slots:
+                slot.release()
+
+    async def ainvoke(self, key: str, runnable, *args, **kwargs):
+        self.budget.count_request()
+        delay = self.hedge_delay(key)
+        started = asyncio.Event()
+
+        async def attempt():
+            async with get_llm_limiter():
+                started.set()
+                start = time.perf_counter()
+                try:
+                    result = await runnable.ainvoke(*args, **kwargs)
+                finally:
+                    # A cancelled loser still took at least this long, keep
+                    # it in the samples so the percentile does not drift down
+                    self.latencies.record(key, time.perf_counter() - start)
+            return result
+
+        pending = {asyncio.ensure_future(attempt())}
+        try:
+            if delay is not None:
+                waiter = asyncio.ensure_future(started.wait())
+                await asyncio.wait(
+                    pending | {waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+                waiter.cancel()
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self.budget.try_spend():
+                    pending.add(asyncio.ensure_future(attempt()))
+
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+_hedger: Optional[LLMHedger] = LLMHedger() if LLM_HEDGING else None
+
+
+def enable_hedging(**options) -> LLMHedger:
+    """Hedge every keyed LLM call from now on, options as for LLMHedger."""
+    global _hedger
+    _hedger = LLMHedger(**options)
+    return _hedger
+
+
+def disable_hedging():
+    global _hedger
+    _hedger = None
+
+
+def get_llm_hedger() -> Optional[LLMHedger]:
+    return _hedger
+
+
+def invoke_hedged(key: str, runnable, *args, **kwargs):
+    """invoke_limited, hedged when hedging is enabled. key names the calling node."""
+    hedger = _hedger
+    if hedger is None:
+        return invoke_limited(runnable, *args, **kwargs)
+    return hedger.invoke(key, runnable, *args, **kwargs)
+
+
+async def ainvoke_hedged(key: str, runnable, *args, **kwargs):
+    hedger = _hedger
+    if hedger is None:
+        return await ainvoke_limited(runnable, *args, **kwargs)
+    return await hedger.ainvoke(key, runnable, *args, **kwargs)
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+from collections import deque
+from typing import List, Optional
+
+from consts import LLM_MAX_CONCURRENCY
+
+
+class _Waiter:
+    def __init__(self, future=None):
+        self.future = future
+        self.event = None if future else threading.Event()
+        self.granted = False
+
+
+class LLMLimiter:
+    """
+    Process-wide cap on concurrent LLM requests.
+
+    asyncio.Semaphore is bound to one event loop and threading.Semaphore
+    blocks the loop, so this keeps one counter for both: sync callers wait
+    on an Event, async callers on a future of their own loop. A released
+    slot is handed to the oldest waiter, whichever kind it is.
+    """
+
+    def __init__(self, limit: int = LLM_MAX_CONCURRENCY):
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def _try_acquire(self, waiter_factory):
+        with self._lock:
+            if self.in_flight < self.limit and not self._waiters:
+                self.in_flight += 1
+                return None
+            waiter = waiter_factory()
+            self._waiters.append(waiter)
+            return waiter
+
+    def acquire(self):
+        waiter = self._try_acquire(_Waiter)
+        if waiter is not None:
+            waiter.event.wait()
+
+    async def aacquire(self):
+        loop = asyncio.get_running_loop()
+        waiter = self._try_acquire(lambda: _Waiter(loop.create_future()))
+        if waiter is None:
+            return
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over just before the cancellation
+            self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if waiter.event is not None:
+                    waiter.granted = True
+                    waiter.event.set()
+                    return
+                loop = waiter.future.get_loop()
+                if waiter.future.done() or loop.is_closed():
+                    continue
+                waiter.granted = True
+                loop.call_soon_threadsafe(_grant, waiter.future)
+                return
+            self.in_flight -= 1
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+    def slot(self, group: Optional["SlotGroup"] = None) -> "LimiterSlot":
+        return LimiterSlot(self, group)
+
+
+def _grant(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class AbandonedCall(Exception):
+    """The caller gave up on this LLM call before it got a limiter slot."""
+
+
+class LimiterSlot:
+    """
+    One slot of a blocking call, given back to the limiter exactly once.
+
+    A blocking LLM call cannot be interrupted, so a caller that stops waiting
+    for one (deadline, lost hedge) calls release() itself instead of leaving
+    the slot taken until the call returns. The abandoned request may then
+    still be in flight while its slot serves the next one, so the limit can
+    be exceeded by abandoned calls; that is preferred over stalling later
+    calls behind requests nobody waits for. Released before it was acquired,
+    the slot is given back at once and the call is not sent.
+    """
+
+    def __init__(self, limiter: LLMLimiter, group: Optional["SlotGroup"] = None):
+        self.limiter = limiter
+        self._lock = threading.Lock()
+        self._held = False
+        self._released = False
+        group = group or current_slot_group()
+        if group is not None:
+            group.add(self)
+
+    def __enter__(self):
+        self.limiter.acquire()
+        with self._lock:
+            released = self._released
+            self._held = not released
+        if released:
+            self.limiter.release()
+            raise AbandonedCall
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def release(self):
+        with self._lock:
+            self._released = True
+            if not self._held:
+                return
+            self._held = False
+        self.limiter.release()
+
+
+class SlotGroup:
+    """Slots taken on behalf of one call, released together when it is abandoned."""
+
+    def __init__(self):
+        self._slots: List[LimiterSlot] = []
+        self._released = False
+        self._lock = threading.Lock()
+
+    def add(self, slot: LimiterSlot):
+        with self._lock:
+            if not self._released:
+                self._slots.append(slot)
+                return
+        slot.release()
+
+    def release(self):
+        with self._lock:
+            self._released = True
+            slots, self._slots = self._slots, []
+        for slot in slots:
+            slot.release()
+
+
+_slot_groups = threading.local()
+
+
+def current_slot_group() -> Optional[SlotGroup]:
+    return getattr(_slot_groups, "group", None)
+
+
+def run_in_slot_group(group: SlotGroup, function, *args, **kwargs):
+    """Call function with every limiter slot taken on this thread added to group."""
+    previous = current_slot_group()
+    _slot_groups.group = group
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _slot_groups.group = previous
+
+
+_limiter: Optional[LLMLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_llm_limiter() -> LLMLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = LLMLimiter()
+    return _limiter
+
+
+def invoke_limited(runnable, *args, **kwargs):
+    with get_llm_limiter().slot():
+        return runnable.invoke(*args, **kwargs)
+
+
+async def ainvoke_limited(runnable, *args, **kwargs):
+    async with get_llm_limiter():
+        return await runnable.ainvoke(*args, **kwargs)
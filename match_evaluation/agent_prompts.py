@@ -1,57 +1,25 @@
-SKILL_MATCH_PROMPT = """
-*Role:**
-You are a strict ATS (Applicant Tracking System) Analyst. 
-Your goal is to evaluate match between technical skills of the candidate and technical skills required for the position
-
-**Job Requirements:**
-Required Technical Skills: {required_skills}
-Nice-to-Have Skills: {nice_to_have}
-
-**Candidate Skills:**
-Declared Skills: {cv_skills}
-Skills from Experience: {experience_skills}
-
-**Your Task:**
-Evaluate how well the candidate's technical skills match the job requirements.
-
-**Matching Rules:**
-1. Use semantic matching - "Python" matches "Python 3.x", "React" matches "React.js"
-2. Consider skill hierarchies - "Deep Learning" implies "Machine Learning"
-3. Give full credit for required skills, partial credit for related skills
-4. Nice-to-have skills are bonus points
-5. Weight more recent/relevant skills higher
-
-**Scoring Guide:**
-- 90-100: All required skills + multiple nice-to-haves
-- 70-89: Most required skills, some gaps
-- 50-69: Partial skills match, significant gaps
-- Below 50: Major skills mismatch
-
-**Example:**
-Required: ["Python", "SQL", "AWS"]
-Candidate: ["Python 3.x", "PostgreSQL", "AWS Lambda"]
-Match: Python (exact: 100%), SQL→PostgreSQL (semantic: 90%), AWS (exact: 100%)
-Score: 97/100
+# Each dimension prompt ends in its *_INSTRUCTIONS, the part that is not
+# CV or job data. The fused evaluation sends the CV and job once and only
+# these per dimension.
+SKILL_RESIDUAL_INSTRUCTIONS = """Exact and alias matches were already resolved. Decide only for the skills below.
+
+**Unresolved Required Skills:** {required_skills}
+**Unresolved Nice-to-Have Skills:** {nice_to_have}
+
+**Candidate Skills:** {candidate_skills}
+**Similar Names (spelling overlap only, check each one):** {similar_names}
+
+**Rules:**
+1. A skill is matched when the candidate has it under another name or a clear specialization of it
+2. A skill is a partial match when the candidate has a closely related skill (e.g. SQL → PostgreSQL)
+3. Similar names are not evidence: Microsoft Word is not Microsoft Excel, Java is not JavaScript
+4. Use the exact skill names from the lists above
+5. Leave out every skill the candidate does not have
 """
-QUALIFICATION_MATCH_PROMPT = """
-You are a strict ATS (Applicant Tracking System) Analyst. 
-You specialize in matching education and qualifications between cv and job positions.
-
-**Job Requirements:**
-Must-Have Technical Requirements: {must_have_requirements}
-Required Years of Experience: {required_years_experience}
-Required education: {required_education}
-required certifications: {required_certifications}
-
-**Candidate Qualifications:**
-Education: {education_formatted}
-Certifications: {cv_certifications}
-Total Years Experience: {total_years_experience}
-Technical Skills: {technical_skills}
-**Candidate Projects Portfolio:**
-{projects_formatted}
-
-**Your Task:**
+SKILL_RESIDUAL_PROMPT = """
+You are a strict ATS (Applicant Tracking System) Analyst.
+""" + SKILL_RESIDUAL_INSTRUCTIONS
+QUALIFICATION_MATCH_INSTRUCTIONS = """**Your Task:**
 Evaluate the candidate's formal qualifications, certifications, and project portfolio.
 
 **Matching Rules:**
@@ -69,63 +37,47 @@ Evaluate the candidate's formal qualifications, certifications, and project port
 - Good: 2+ solid projects demonstrating skills
 - Fair: 1-2 basic projects or outdated tech
 - Poor: No projects or irrelevant projects"""
+QUALIFICATION_MATCH_PROMPT = """
+You are a strict ATS (Applicant Tracking System) Analyst. 
+You specialize in matching education and qualifications between cv and job positions.
 
-KEYWORD_MATCH_PROMPT = """
-**Role:**
-You are an ATS Keyword Analyzer. Your job is to check for EXACT keyword matches that automated systems look for.
-
-**Job Critical Keywords:**
-{critical_keywords}
+**Job Requirements:**
+Must-Have Technical Requirements: {must_have_requirements}
+Required Years of Experience: {required_years_experience}
+Required education: {required_education}
+required certifications: {required_certifications}
 
-**CV Full Text:**
-{cv_full_text}
+**Candidate Qualifications:**
+Education: {education_formatted}
+Certifications: {cv_certifications}
+Total Years Experience: {total_years_experience}
+Technical Skills: {technical_skills}
+**Candidate Projects Portfolio:**
+{projects_formatted}
 
-**Your Task:**
-Perform literal, case-insensitive keyword matching. This is NOT semantic matching.
+""" + QUALIFICATION_MATCH_INSTRUCTIONS
 
-**Matching Rules:**
-1. **Exact Match Only**: "Python" matches "python" but NOT "Python developer" or "Pythonic"
-2. **Case-Insensitive**: "AWS" = "aws" = "Aws"
-3. **Count Frequency**: Track how many times each keyword appears
-4. **No Partial Credit**: "React" does NOT match "ReactJS" or "React.js" unless explicitly listed as equivalent
-
-**Keyword Equivalence Groups** (treat these as same keyword):
-- "Machine Learning" = "ML" 
-- "Artificial Intelligence" = "AI"
-- "JavaScript" = "JS"
-- "TypeScript" = "TS"
-(Only for commonly abbreviated terms)
-
-**Scoring:**
-- Score = (matched_keywords / total_critical_keywords) * 100
-- Frequency matters: Keywords appearing 2-3+ times = stronger signal
-- Missing ANY critical keyword is a red flag
+KEYWORD_REASONING_INSTRUCTIONS = """**Matched Keywords and Frequency:** {keyword_frequency}
+**Missing Keywords:** {missing_keywords}
+**Match Rate:** {score:.0f}%
 
 **ATS Pass Likelihood:**
 - High (85-100% keywords matched): Will likely pass ATS
-- Medium (60-84% matched): May pass depending on ATS settings  
+- Medium (60-84% matched): May pass depending on ATS settings
 - Low (<60% matched): Likely filtered out by ATS
 
-**Important:**
-- ATS systems are dumb - they look for exact words, not meaning
-- Missing a keyword even if you have the skill = rejection
-- This is why keyword optimization matters
-
-Provide specific optimization suggestions for missing keywords.
+**Your Task:**
+In 2-3 sentences, explain the ATS implications and give specific optimization suggestions for the missing or rarely mentioned keywords. Do not recount the keywords.
 """
+KEYWORD_REASONING_PROMPT = """
+**Role:**
+You are an ATS Keyword Analyzer. The keyword counts below were computed with literal, case-insensitive matching.
 
+""" + KEYWORD_REASONING_INSTRUCTIONS
 
-SENIORITY_MATCH_PROMPT = """You are a strict ATS (Applicant Tracking System) Analyst. You specialize in a seniority and experience level matching.
 
-**Job Requirements:**
-Required Years of Experience: {required_years_experience}
-Required Seniority: {required_seniority}
-Job Title: {job_title}
-
-**Candidate Experience:**
-Total Years: {total_years_experience}
-Career Progression: {cv_titles}
-Current Title: {current_title}
+SENIORITY_MATCH_INSTRUCTIONS = """**Computed Timeline Facts:**
+{timeline_facts}
 
 **Your Task:**
 Evaluate if the candidate's seniority level matches the job requirements.
@@ -136,6 +88,7 @@ Evaluate if the candidate's seniority level matches the job requirements.
 3. Check if current title aligns with job title level
 4. Overqualification (too senior) should score 70-80, not 100
 5. Underqualification by 2+ years is a red flag
+6. Total Years comes from the computed timeline, do not recalculate it from the dates
 
 **Seniority Levels Guide:**
 - Junior: 0-2 years
@@ -143,16 +96,25 @@ Evaluate if the candidate's seniority level matches the job requirements.
 - Senior: 5-8 years
 - Lead/Staff: 8-12 years
 - Principal/Architect: 12+ years"""
-
-DOMAIN_MATCH_PROMPT = """You are a strict ATS (Applicant Tracking System) Analyst. You specialize in industry domain matching.
+SENIORITY_MATCH_PROMPT = (
+    """You are a strict ATS (Applicant Tracking System) Analyst. You specialize in a seniority and experience level matching.
 
 **Job Requirements:**
-Required Domains/Industries: {required_domains}
-Company: {company}
+Required Years of Experience: {required_years_experience}
+Required Seniority: {required_seniority}
+Job Title: {job_title}
 
 **Candidate Experience:**
-Declared Domains: {cv_domains}
-Experience Domains: {cv_experience_domains}
+Total Years: {total_years_experience}
+Career Progression: {cv_titles}
+Current Title: {current_title}
+
+"""
+    + SENIORITY_MATCH_INSTRUCTIONS
+)
+
+DOMAIN_MATCH_INSTRUCTIONS = """**Precomputed Related Pairs (candidates, confirm or reject):**
+{related_domains}
 
 **Your Task:**
 Evaluate the candidate's industry/domain experience relevance.
@@ -163,20 +125,24 @@ Evaluate the candidate's industry/domain experience relevance.
 3. Transferable domains = 50-60 points (e.g., healthcare → fintech if both are data-heavy)
 4. No domain overlap but transferable skills = 30-40 points
 5. If no specific domain required, score based on domain diversity"""
+DOMAIN_MATCH_PROMPT = (
+    """You are a strict ATS (Applicant Tracking System) Analyst. You specialize in industry domain matching.
 
-# ============================================================================
+**Job Requirements:**
+Required Domains/Industries: {required_domains}
+Company: {company}
 
-REQUIREMENTS_COVERAGE_PROMPT = """You are a strict ATS (Applicant Tracking System) Analyst. 
-You specialize in job requirements verification.
+**Candidate Experience:**
+Declared Domains: {cv_domains}
+Experience Domains: {cv_experience_domains}
 
-**Job Requirements:**
-MUST-HAVE Requirements: {must_have}
-NICE-TO-HAVE Requirements: {nice_to_have}
-Other requirements: {other_requirements}
-**Candidate Profile:**
-{cv_summary}
+"""
+    + DOMAIN_MATCH_INSTRUCTIONS
+)
 
-**Your Task:**
+# ============================================================================
+
+REQUIREMENTS_COVERAGE_INSTRUCTIONS = """**Your Task:**
 Check how many must-have and nice-to-have requirements the candidate satisfies.
 
 **Scoring Rules:**
@@ -184,17 +150,24 @@ Check how many must-have and nice-to-have requirements the candidate satisfies.
 2. Missing any must-have = major penalty (-20 to -40 points per item)
 3. Nice-to-have requirements are bonus points (can push score above 100)
 4. Look for implicit satisfaction (e.g., "5 years Python" satisfies "proficient in Python")"""
-
-RECENCY_RELEVANCE_PROMPT = """You are a recency and relevance evaluation expert.
+REQUIREMENTS_COVERAGE_PROMPT = (
+    """You are a strict ATS (Applicant Tracking System) Analyst. 
+You specialize in job requirements verification.
 
 **Job Requirements:**
-Required Skills: {required_skills}
-Job Title: {job_title}
+MUST-HAVE Requirements: {must_have}
+NICE-TO-HAVE Requirements: {nice_to_have}
+Other requirements: {other_requirements}
+**Candidate Profile:**
+{cv_summary}
 
-**Candidate Experience Timeline:**
-{experiences_formatted}
+""" + REQUIREMENTS_COVERAGE_INSTRUCTIONS
+)
+
+RECENCY_RELEVANCE_INSTRUCTIONS = """**Computed Timeline Facts:**
+{timeline_facts}
 
-**Current Date:** December 2025
+**Current Date:** {current_date}
 
 **Your Task:**
 Evaluate how recent and relevant the candidate's experience is.
@@ -206,11 +179,22 @@ Evaluate how recent and relevant the candidate's experience is.
 4. Skills used 5+ years ago = outdated unless refreshed (40-60%)
 5. Fast-changing tech (frameworks, libraries) decay faster than fundamentals
 6. Check if candidate kept skills current across roles
+7. Use the computed timeline facts for years and months, do not recalculate them from the dates
 
 **Technology Decay Examples:**
 - Fast decay: React, Angular, specific ML frameworks (2-3 years)
 - Medium decay: Languages, cloud platforms (4-5 years)
 - Slow decay: Algorithms, system design, databases (6-8 years)"""
+RECENCY_RELEVANCE_PROMPT = """You are a recency and relevance evaluation expert.
+
+**Job Requirements:**
+Required Skills: {required_skills}
+Job Title: {job_title}
+
+**Candidate Experience Timeline:**
+{experiences_formatted}
+
+""" + RECENCY_RELEVANCE_INSTRUCTIONS
 
 WEIGHT_GENERATION_PROMPT = """
 **Role:**
@@ -228,13 +212,7 @@ Must-Have Requirements: {must_have_requirements}
 Role Summary: {role_summary}
 
 **Available Evaluation Dimensions:**
-1. **skills_match** (0-1): Technical skills alignment (semantic matching)
-2. **keyword_match** (0-1): Exact keyword matching (ATS filtering)
-3. **requirements_coverage** (0-1): Must-have vs nice-to-have satisfaction
-4. **seniority_match** (0-1): Years of experience and title level
-5. **qualification_match** (0-1): Education, certifications, portfolio quality
-6. **recency_relevance** (0-1): How current/fresh is the experience
-7. **domain_match** (0-1): Industry/domain experience relevance
+{dimensions}
 
 **Your Task:**
 Assign weights (0.0 to 1.0) that sum to 1.0, reflecting what matters MOST for this specific role.
@@ -309,44 +287,7 @@ Required Years: {required_years_experience}
 
 **Evaluation Results:**
 
-1 **Skills Match** (weight: {weight_skills:.1%})
-   Score: {skills_match_score}/100
-   Matched: {skills_matched}
-   Missing: {skills_missing}
-   Red Flags: {skills_red_flags}
-
-2 **Keyword Match** (weight: {weight_keyword:.1%})
-   Score: {keyword_match_score}/100
-   Missing Keywords: {keyword_missing}
-   Red Flags: {keyword_red_flags}
-
-3 **Requirements Coverage** (weight: {weight_requirements:.1%})
-   Score: {requirements_coverage_score}/100
-   Must-Haves Satisfied: {requirements_satisfied}/{requirements_total}
-   Coverage: {requirements_coverage_pct}%
-   Red Flags: {requirements_red_flags}
-
-4 **Seniority Match** (weight: {weight_seniority:.1%})
-   Score: {seniority_match_score}/100
-   Candidate Level: {candidate_level} | Required: {required_level}
-   Years Gap: {years_gap:+.1f} years
-   Red Flags: {seniority_red_flags}
-
-5 **Qualification Match** (weight: {weight_qualification:.1%})
-   Score: {qualification_match_score}/100
-   Portfolio Quality: {portfolio_quality}
-   Portfolio Boost: +{portfolio_boost} points
-   Red Flags: {qualification_red_flags}
-
-6 **Recency/Relevance** (weight: {weight_recency:.1%})
-   Score: {recency_relevance_score}/100
-   Tech Freshness: {tech_freshness}
-   Red Flags: {recency_red_flags}
-
-7 **Domain Match** (weight: {weight_domain:.1%})
-   Score: {domain_match_score}/100
-   Matched Domains: {domain_matched}
-   Red Flags: {domain_red_flags}
+{evaluation_results}
 
 **Weighted Score Calculation:**
 {score_breakdown}
@@ -445,3 +386,25 @@ Make the final hiring decision using this weighted score AS A STARTING POINT, bu
 
 
 """
+FUSED_EVALUATION_PROMPT = """
+**Role:**
+You are a strict ATS (Applicant Tracking System) Analyst evaluating one candidate against one job.
+The sections below are independent evaluation tasks over the job and CV given here once.
+
+**Job:**
+{job}
+
+**Candidate CV:**
+{cv}
+
+**Computed Facts:**
+Total Years Experience: {total_years_experience}
+Current Date: {current_date}
+
+**Your Task:**
+Complete every section and return one result per section, stored under the section name.
+Apply each section's rules only to that section and do not let one section's judgment change another's.
+Use the computed facts for years and months, do not recalculate them from the dates.
+
+{sections}
+"""
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+import operator
+from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional
 from extracting_data.description_schemas import CVDescription, JobDescription
 from match_evaluation.output_schemas import *
 
@@ -7,12 +8,30 @@ from match_evaluation.output_schemas import *
 class AgentState(BaseModel):
     path_to_cv: Optional[str] = None
     path_to_job: Optional[str] = None
+    # Raw input (pasted text, link or path) to read when no text is known yet
+    cv_input: Optional[str] = None
+    job_input: Optional[str] = None
+    # Why a CV or job link could not be downloaded, set by fetch_documents
+    cv_fetch_error: Optional[str] = None
+    job_fetch_error: Optional[str] = None
 
     cv_description_text: Optional[str] = None
     job_description_text: Optional[str] = None
 
     cv: Optional[CVDescription] = None
+    # Result of an earlier run, lets an edited CV be patched instead of re-extracted
+    previous_cv_description_text: Optional[str] = None
+    previous_cv: Optional[CVDescription] = None
     job: Optional[JobDescription] = None
+    # Skill name -> skill taxonomy id for every skill named in cv and job
+    skill_ids: Optional[Dict[str, int]] = None
+
+    # Set by the relevance gate, False when the detailed evaluation was skipped
+    relevant: Optional[bool] = None
+    # Wall-clock time (time.time()) the evaluation has to be finished by
+    deadline: Optional[float] = None
+    # Dimensions that missed the deadline, appended to by the parallel nodes
+    skipped_dimensions: Annotated[List[str], operator.add] = Field(default_factory=list)
 
     qualification_match: Optional[QualificationMatchResult] = None
     skills_match: Optional[SkillsMatchResult] = None
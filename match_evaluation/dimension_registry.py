@@ -0,0 +1,182 @@
+import asyncio
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Type
+from pydantic import BaseModel, Field, create_model
+from consts import CACHE_DIR
+from disk_cache import DiskCache
+from llm_limiter import SlotGroup, run_in_slot_group
+from match_evaluation.agent_state import AgentState
+from match_evaluation.llm_requests import arun_request, run_request
+from match_evaluation.output_schemas import WeightingStrategy
+from match_evaluation.evaluation_consts import (
+    DIMENSION_CACHE_SUBDIR,
+    DIMENSION_CACHE_MAX_BYTES,
+    SCORING_TIME_RESERVE,
+)
+
+
+@dataclass(frozen=True)
+class EvaluationStep:
+    """
+    One node of the evaluation graph.
+
+    reads/writes name AgentState fields; the graph is scheduled from them, a
+    step runs as soon as the steps producing its reads are done. request
+    returns an LLMRequest or a finished state update.
+
+    on_timeout builds the update used when the step misses the deadline minus
+    time_reserve, without it the step always runs to completion.
+    """
+
+    name: str
+    reads: Tuple[str, ...]
+    writes: Tuple[str, ...]
+    request: Callable
+    on_timeout: Optional[Callable[[AgentState], dict]] = None
+    time_reserve: float = 0.0
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """
+    A scored evaluation dimension, stored and weighted under its name.
+
+    title and the lines from scoring_details present its result to the
+    scoring prompt, weight_description explains it to weight generation.
+    """
+
+    name: str
+    reads: Tuple[str, ...]
+    request: Callable
+    title: str
+    weight_description: str
+    # Result -> {label: value} lines shown under its score
+    scoring_details: Optional[Callable[[BaseModel], Dict[str, object]]] = None
+    time_reserve: float = SCORING_TIME_RESERVE
+
+    @property
+    def writes(self) -> Tuple[str, ...]:
+        return (self.name,)
+
+    def on_timeout(self, state: AgentState) -> dict:
+        return {"skipped_dimensions": [self.name]}
+
+    @property
+    def weight_key(self) -> str:
+        return self.name
+
+
+DIMENSIONS: Dict[str, Dimension] = {}
+
+
+def register_dimension(dimension: Dimension):
+    """Register (or replace) a dimension, it gets a node, a weight and a score."""
+    DIMENSIONS[dimension.name] = dimension
+
+
+@lru_cache(maxsize=None)
+def _weighting_schema(weights: Tuple[Tuple[str, str], ...]) -> Type[WeightingStrategy]:
+    return create_model(
+        "WeightingStrategy",
+        __base__=WeightingStrategy,
+        **{
+            key: (float, Field(ge=0, le=1, description=description))
+            for key, description in weights
+        },
+    )
+
+
+def weighting_schema() -> Type[WeightingStrategy]:
+    """WeightingStrategy with one weight field per registered dimension."""
+    return _weighting_schema(
+        tuple((d.weight_key, d.weight_description) for d in DIMENSIONS.values())
+    )
+
+
+_dimension_cache = None
+
+
+def get_dimension_cache() -> DiskCache:
+    """Process-wide cache of dimension results, shared between runs on disk."""
+    global _dimension_cache
+    if _dimension_cache is None:
+        _dimension_cache = DiskCache(
+            CACHE_DIR / DIMENSION_CACHE_SUBDIR, DIMENSION_CACHE_MAX_BYTES
+        )
+    return _dimension_cache
+
+
+def time_left(state: AgentState, step) -> Optional[float]:
+    """Seconds until the step's deadline, None when it has no deadline."""
+    if state.deadline is None or step.on_timeout is None:
+        return None
+    return state.deadline - step.time_reserve - time.time()
+
+
+def _call_with_timeout(function: Callable[[], dict], timeout: float) -> dict:
+    """
+    Run function in a daemon thread and stop waiting after timeout.
+
+    A blocking LLM call cannot be interrupted, the thread is left to finish
+    in the background and its result is dropped. Its limiter slots are given
+    back right away, so it does not hold up later assessments (see
+    LimiterSlot). Raises TimeoutError.
+    """
+    results = queue.Queue(maxsize=1)
+    slots = SlotGroup()
+
+    def target():
+        try:
+            results.put((run_in_slot_group(slots, function), None))
+        except BaseException as e:
+            results.put((None, e))
+
+    threading.Thread(target=target, daemon=True).start()
+    try:
+        result, error = results.get(timeout=timeout)
+    except queue.Empty:
+        slots.release()
+        raise TimeoutError
+    if error is not None:
+        raise error
+    return result
+
+
+def run_step(
+    state: AgentState, llm, step, cache: Optional[DiskCache] = None, **options
+) -> dict:
+    def run():
+        return run_request(step.request(state, **options), llm, cache, step.name)
+
+    timeout = time_left(state, step)
+    if timeout is None:
+        return run()
+    try:
+        if timeout <= 0:
+            raise TimeoutError
+        return _call_with_timeout(run, timeout)
+    except TimeoutError:
+        print(f"{step.name} missed the deadline")
+        return step.on_timeout(state)
+
+
+async def arun_step(
+    state: AgentState, llm, step, cache: Optional[DiskCache] = None, **options
+) -> dict:
+    async def run():
+        return await arun_request(step.request(state, **options), llm, cache, step.name)
+
+    timeout = time_left(state, step)
+    if timeout is None:
+        return await run()
+    try:
+        if timeout <= 0:
+            raise asyncio.TimeoutError
+        return await asyncio.wait_for(run(), timeout)
+    except asyncio.TimeoutError:
+        print(f"{step.name} missed the deadline")
+        return step.on_timeout(state)
@@ -0,0 +1,63 @@
+# Compute the recency dimension from the experience timeline instead of an LLM call
+LOCAL_RECENCY_EVALUATION = False
+# Skills used within this many months count as fully relevant
+RECENT_SKILL_MONTHS = 36
+# Skills last used before this many months count as outdated
+STALE_SKILL_MONTHS = 60
+RECENT_SKILL_WEIGHT = 1.0
+AGING_SKILL_WEIGHT = 0.75
+STALE_SKILL_WEIGHT = 0.5
+
+# Ask the LLM about required skills the local matcher cannot resolve
+SKILLS_LLM_FALLBACK = True
+# Credit for a related skill, e.g. PostgreSQL for SQL
+PARTIAL_SKILL_CREDIT = 0.7
+# Share of the skills score that comes from nice-to-have skills
+BONUS_SKILL_SHARE = 0.1
+
+# Let the LLM write the keyword reasoning, the counts are always computed locally
+KEYWORD_LLM_REASONING = False
+
+# Classify seniority from title tokens and years, the LLM only sees ambiguous cases
+LOCAL_SENIORITY_CLASSIFIER = True
+SENIORITY_MIN_CONFIDENCE = 0.7
+
+# Hashed character n-gram vectors used for similarity between skill and domain names
+NGRAM_SIZES = (2, 3, 4)
+NGRAM_DIMENSIONS = 4096
+# Similar skill names at or above this are listed for the LLM residual, never credited
+SKILL_SIMILARITY_THRESHOLD = 0.5
+DOMAIN_SIMILARITY_THRESHOLD = 0.4
+
+# Evaluate all dimensions that still need the LLM with one structured call
+FUSED_EVALUATION = False
+
+# Skip the evaluation for pairs the local signals show to be clearly unrelated.
+# Opt-in: a gated pair gets a short local result instead of the full review
+RELEVANCE_GATE = False
+# Too few required skills to judge the overlap, always evaluate
+GATE_MIN_REQUIRED_SKILLS = 3
+# At most this share of required skills matched (partial matches included)
+GATE_MAX_SKILL_COVERAGE = 0.15
+# Signals besides the skills that must also fail (domain, certifications, education)
+GATE_MIN_FAILED_SIGNALS = 1
+CERTIFICATION_SIMILARITY_THRESHOLD = 0.6
+EDUCATION_SIMILARITY_THRESHOLD = 0.4
+
+# Reuse dimension results across runs when the prompt sent for them is unchanged
+DIMENSION_CACHE = True
+DIMENSION_CACHE_SUBDIR = "dimensions"
+DIMENSION_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Seconds an assessment may take, None (default) waits for every LLM call
+EVALUATION_TIME_BUDGET = None
+# Part of the budget kept for scoring, dimensions and weights must finish before it
+SCORING_TIME_RESERVE = 20
+# Lower bounds of the scoring decisions, used when scoring itself misses the deadline
+DECISION_THRESHOLDS = [
+    (85, "Strong Match"),
+    (70, "Good Match"),
+    (55, "Partial Match"),
+    (40, "Weak Match"),
+    (0, "Poor Match"),
+]
@@ -1,40 +1,125 @@
+import time
 from langgraph.graph import StateGraph, START, END
 from functools import partial
 from match_evaluation.agent_state import AgentState
 from match_evaluation.parallel_execution import *
+from match_evaluation.dimension_registry import (
+    DIMENSIONS,
+    Dimension,
+    arun_step,
+    get_dimension_cache,
+    run_step,
+)
+from match_evaluation.evaluation_consts import (
+    DIMENSION_CACHE,
+    EVALUATION_TIME_BUDGET,
+    FUSED_EVALUATION,
+    LOCAL_RECENCY_EVALUATION,
+    RELEVANCE_GATE,
+)
+from match_evaluation.fused_evaluation import fused_evaluation_step
+from match_evaluation.relevance_gate import relevance_gate, route_relevance
 from extracting_data.extraction_functions import *
 
 
-def build_evaluation_graph(llm) -> StateGraph:
+def evaluation_steps(fused=FUSED_EVALUATION) -> list:
+    dimensions = [fused_evaluation_step()] if fused else list(DIMENSIONS.values())
+    return [*dimensions, WEIGHT_GENERATION_STEP, scoring_step()]
+
+
+def build_evaluation_graph(
+    llm,
+    local_recency=LOCAL_RECENCY_EVALUATION,
+    asynchronous=False,
+    fused=FUSED_EVALUATION,
+    gate=RELEVANCE_GATE,
+    use_cache=DIMENSION_CACHE,
+) -> StateGraph:
+    """
+    Nodes come from the dimension registry and are wired by the state fields
+    they read: a step waits only for the steps writing those fields, steps
+    reading only extraction output start at START.
+
+    asynchronous=True builds the graph from the async runners, run it with
+    arun_evaluation_flow so the LLM calls share the event loop instead of
+    occupying a thread each.
+
+    fused=True replaces the dimension nodes with a single node asking for all
+    dimensions in one LLM call, for providers with tight request rate limits.
+
+    gate=True puts the local relevance gate in front of the fan-out, clearly
+    unrelated pairs end there without any LLM call.
+
+    use_cache=True stores each dimension's LLM answer on disk, keyed on the
+    prompt it was given. An edited CV or a similar posting only reruns the
+    dimensions whose inputs changed.
+    """
+    options = {"recency_relevance": {"local": local_recency}}
+    options["fused_evaluation"] = {"dimension_options": dict(options)}
+    runner = arun_step if asynchronous else run_step
+    cache = get_dimension_cache() if use_cache else None
+    steps = evaluation_steps(fused)
+    producers = {field: step.name for step in steps for field in step.writes}
+    consumed = set()
+    entry = []
+
     g = StateGraph(AgentState)
-    g.add_node("qualification_match", partial(qualification_match_agent_sync, llm=llm))
-    g.add_node("skills_match", partial(skills_match_agent_sync, llm=llm))
-    g.add_node("domain_match", partial(domain_match_agent_sync, llm=llm))
-    g.add_node("seniority_match", partial(seniority_match_agent_sync, llm=llm))
-    g.add_node("recency_relevance", partial(recency_relevance_agent_sync, llm=llm))
-    g.add_node(
-        "requirements_coverage", partial(requirements_coverage_agent_sync, llm=llm)
-    )
-    g.add_node("keyword_match", partial(keyword_macth_agent_sync, llm=llm))
-    g.add_node("weight_generation", partial(weight_generation_agent_sync, llm=llm))
-    g.add_node("scoring", partial(scoring_agent_sync, llm=llm))
-
-    for node in [
-        "qualification_match",
-        "skills_match",
-        "domain_match",
-        "seniority_match",
-        "recency_relevance",
-        "requirements_coverage",
-        "keyword_match",
-    ]:
-        g.add_edge(START, node)
-        g.add_edge(node, "weight_generation")
-
-    g.add_edge("weight_generation", "scoring")
-    g.add_edge("scoring", END)
+    for step in steps:
+        g.add_node(
+            step.name,
+            partial(
+                runner,
+                llm=llm,
+                step=step,
+                cache=cache if isinstance(step, Dimension) else None,
+                **options.get(step.name, {}),
+            ),
+        )
+        dependencies = sorted(
+            {producers[field] for field in step.reads if field in producers}
+        )
+        consumed.update(dependencies)
+        if dependencies:
+            g.add_edge(dependencies, step.name)
+        else:
+            entry.append(step.name)
+
+    if gate:
+        g.add_node("relevance_gate", relevance_gate)
+        g.add_edge(START, "relevance_gate")
+        g.add_conditional_edges(
+            "relevance_gate",
+            partial(route_relevance, evaluation_nodes=entry),
+            [*entry, END],
+        )
+    else:
+        for node in entry:
+            g.add_edge(START, node)
+
+    for step in steps:
+        if step.name not in consumed:
+            g.add_edge(step.name, END)
     return g.compile()
 
 
-def run_evaluation_flow(state: AgentState, llm, evaluation_graph):
-    return evaluation_graph.invoke(state)
+def start_evaluation(state: AgentState, time_budget=EVALUATION_TIME_BUDGET):
+    """Fresh evaluation state with the deadline set from the time budget."""
+    update = {name: None for name in DIMENSIONS}
+    update.update(relevant=None, skipped_dimensions=[], deadline=None)
+    if time_budget is not None:
+        update["deadline"] = time.time() + time_budget
+    if isinstance(state, dict):
+        return {**state, **update}
+    return state.model_copy(update=update)
+
+
+def run_evaluation_flow(
+    state: AgentState, llm, evaluation_graph, time_budget=EVALUATION_TIME_BUDGET
+):
+    return evaluation_graph.invoke(start_evaluation(state, time_budget))
+
+
+async def arun_evaluation_flow(
+    state: AgentState, llm, evaluation_graph, time_budget=EVALUATION_TIME_BUDGET
+):
+    return await evaluation_graph.ainvoke(start_evaluation(state, time_budget))
@@ -0,0 +1,326 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from extracting_data.description_schemas import CVExperience
+from match_evaluation.evaluation_consts import (
+    RECENT_SKILL_MONTHS,
+    STALE_SKILL_MONTHS,
+    RECENT_SKILL_WEIGHT,
+    AGING_SKILL_WEIGHT,
+    STALE_SKILL_WEIGHT,
+)
+from match_evaluation.output_schemas import RecencyRelevanceResult
+from skill_taxonomy.taxonomy import get_taxonomy
+
+MONTH_NAMES = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "sept": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+    "spring": 3,
+    "summer": 6,
+    "fall": 9,
+    "autumn": 9,
+    "winter": 12,
+}
+PRESENT_WORDS = (
+    "present",
+    "current",
+    "currently",
+    "now",
+    "today",
+    "ongoing",
+    "to date",
+    "till date",
+)
+PRESENT = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, PRESENT_WORDS)))
+RANGE_SEPARATOR = re.compile(
+    r"\s+(?:-|–|—|to|until|till)\s+|\s*[–—]\s*"
+    r"|(?<=\d)-(?=(?:19|20)\d{2}\b|\d{1,2}[/.]\d{4}|[a-z])"
+)
+
+# Only real month and season names count, "marketing 2019" is a bare year.
+# An optional day sits between month and year ("June 15, 2020"), a two
+# digit number followed by a four digit year is that day, not the year
+MONTH_YEAR = re.compile(
+    r"\b(%s)\.?,?\s*(?:\d{1,2}(?:st|nd|rd|th)?(?:,\s*|\s+))?"
+    r"'?(\d{4}|\d{2}(?!,?\s*\d{4}))\b" % "|".join(MONTH_NAMES)
+)
+YEAR_MONTH = re.compile(r"\b((?:19|20)\d{2})\s*[-/.]\s*(\d{1,2})\b")
+NUMERIC_MONTH_YEAR = re.compile(r"\b(\d{1,2})\s*[-/.]\s*((?:19|20)\d{2})\b")
+YEAR = re.compile(r"\b((?:19|20)\d{2})\b")
+
+
+def month_index(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def format_month(index: int) -> str:
+    year, month = divmod(index, 12)
+    return date(year, month + 1, 1).strftime("%b %Y")
+
+
+def expand_year(text: str, today: date) -> int:
+    year = int(text)
+    if len(text) == 2:
+        year += 2000 if year <= today.year % 100 else 1900
+    return year
+
+
+def parse_date(text: Optional[str], is_end=False, today: date = None) -> Optional[int]:
+    """Parse a free text CV date into a month index, None if unparseable.
+
+    A bare year starts in January and ends in December.
+    """
+    today = today or date.today()
+    if not text:
+        return None
+    lowered = text.strip().lower()
+    if PRESENT.search(lowered):
+        return month_index(today.year, today.month)
+
+    match = MONTH_YEAR.search(lowered)
+    if match:
+        return month_index(
+            expand_year(match.group(2), today), MONTH_NAMES[match.group(1)]
+        )
+
+    match = YEAR_MONTH.search(lowered)
+    if match and 1 <= int(match.group(2)) <= 12:
+        return month_index(int(match.group(1)), int(match.group(2)))
+
+    match = NUMERIC_MONTH_YEAR.search(lowered)
+    if match and 1 <= int(match.group(1)) <= 12:
+        return month_index(int(match.group(2)), int(match.group(1)))
+
+    match = YEAR.search(lowered)
+    if match:
+        return month_index(int(match.group(1)), 12 if is_end else 1)
+    return None
+
+
+def parse_period(
+    start_date: Optional[str], end_date: Optional[str], today: date = None
+) -> Optional[Tuple[int, int]]:
+    """Return a half-open [start, end) month interval for one role.
+
+    A whole range written into start_date is split, and a missing end date
+    means the role is ongoing.
+    """
+    today = today or date.today()
+    if start_date and not end_date:
+        parts = RANGE_SEPARATOR.split(start_date.strip().lower(), maxsplit=1)
+        if len(parts) == 2:
+            start_date, end_date = parts
+
+    now = month_index(today.year, today.month)
+    start = parse_date(start_date, today=today)
+    if start is None:
+        return None
+    end = parse_date(end_date, is_end=True, today=today) if end_date else now
+    if end is None:
+        return None
+    end = min(end, now)
+    if end < start:
+        return None
+    return start, end + 1
+
+
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def covered_months(intervals: Iterable[Tuple[int, int]]) -> int:
+    return sum(end - start for start, end in merge_intervals(intervals))
+
+
+@dataclass
+class RolePeriod:
+    title: str
+    company: Optional[str]
+    start: int
+    end: int
+    technologies: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        company = f" at {self.company}" if self.company else ""
+        return f"{self.title}{company} ({format_month(self.start)} – {format_month(self.end - 1)})"
+
+
+class ExperienceTimeline:
+    """Merged employment periods of a CV with per technology usage."""
+
+    def __init__(self, experiences: List[CVExperience], today: date = None):
+        self.today = today or date.today()
+        self.now = month_index(self.today.year, self.today.month)
+        self.roles: List[RolePeriod] = []
+        self.undated: List[str] = []
+        for exp in experiences:
+            period = parse_period(exp.start_date, exp.end_date, self.today)
+            if period is None:
+                self.undated.append(exp.title)
+                continue
+            self.roles.append(
+                RolePeriod(exp.title, exp.company, *period, exp.technologies)
+            )
+        self.roles.sort(key=lambda role: role.end, reverse=True)
+
+        self.total_months = covered_months((r.start, r.end) for r in self.roles)
+        self.technology_names: Dict[str, str] = {}
+        technology_periods: Dict[str, List[Tuple[int, int]]] = {}
+        for role in self.roles:
+            for tech in role.technologies:
+                key = get_taxonomy().key(tech)
+                if not key:
+                    continue
+                self.technology_names.setdefault(key, tech)
+                technology_periods.setdefault(key, []).append((role.start, role.end))
+        self.technology_months = {
+            key: covered_months(periods) for key, periods in technology_periods.items()
+        }
+        self.last_used = {
+            key: max(end for _, end in periods)
+            for key, periods in technology_periods.items()
+        }
+
+    @property
+    def total_years(self) -> float:
+        return round(self.total_months / 12, 1)
+
+    @property
+    def most_recent_role(self) -> Optional[RolePeriod]:
+        return self.roles[0] if self.roles else None
+
+    def years_with(self, skill: str) -> float:
+        return round(self.technology_months.get(get_taxonomy().key(skill), 0) / 12, 1)
+
+    def months_since_last_used(self, skill: str) -> Optional[int]:
+        last_used = self.last_used.get(get_taxonomy().key(skill))
+        if last_used is None:
+            return None
+        return max(0, self.now - (last_used - 1))
+
+    def facts(self, required_skills: List[str]) -> str:
+        """Precomputed numbers for the evaluation prompts."""
+        if not self.roles:
+            return "No parseable employment dates in the CV."
+        lines = [
+            f"Total experience (overlapping roles merged): {self.total_years} years",
+            f"Most recent role: {self.most_recent_role.describe()}",
+        ]
+        if self.undated:
+            lines.append(f"Roles without parseable dates: {', '.join(self.undated)}")
+        for skill in required_skills:
+            months = self.months_since_last_used(skill)
+            if months is None:
+                lines.append(f"- {skill}: not listed in any dated role")
+            else:
+                lines.append(
+                    f"- {skill}: {self.years_with(skill)} years, last used {months} months ago"
+                )
+        return "\n".join(lines)
+
+
+def candidate_total_years(cv) -> Optional[float]:
+    """Timeline years when the CV has dates, the extracted estimate otherwise."""
+    timeline = ExperienceTimeline(cv.experience)
+    if timeline.roles:
+        return timeline.total_years
+    return cv.total_years_experience
+
+
+def skill_relevance(months: Optional[int]) -> float:
+    if months is None:
+        return 0.0
+    if months <= RECENT_SKILL_MONTHS:
+        return RECENT_SKILL_WEIGHT
+    if months <= STALE_SKILL_MONTHS:
+        return AGING_SKILL_WEIGHT
+    return STALE_SKILL_WEIGHT
+
+
+def local_recency_relevance(
+    timeline: ExperienceTimeline, required_skills: List[str]
+) -> RecencyRelevanceResult:
+    """Score recency from the timeline without an LLM call."""
+    recent, outdated, missing, red_flags = [], [], [], []
+    used = {}
+    for skill in required_skills:
+        months = timeline.months_since_last_used(skill)
+        if months is None:
+            missing.append(skill)
+            continue
+        used[skill] = months
+        if months <= RECENT_SKILL_MONTHS:
+            recent.append(skill)
+        else:
+            outdated.append(f"{skill} (last used {months} months ago)")
+        if months > STALE_SKILL_MONTHS:
+            red_flags.append(f"{skill} not used in the last {months // 12} years")
+
+    if used:
+        score = 100 * sum(skill_relevance(m) for m in used.values()) / len(used)
+    else:
+        score = 0.0
+        red_flags.append("None of the required skills appear in a dated role")
+
+    latest_use = sorted(used.values())[(len(used) - 1) // 2] if used else None
+    if latest_use is not None and latest_use <= RECENT_SKILL_MONTHS:
+        freshness = "current"
+    elif latest_use is not None and latest_use <= STALE_SKILL_MONTHS:
+        freshness = "somewhat-current"
+    else:
+        freshness = "outdated"
+
+    role = timeline.most_recent_role
+    if role is None:
+        role_match = "No dated roles in the CV"
+    else:
+        role_keys = {get_taxonomy().key(t) for t in role.technologies}
+        overlap = [s for s in required_skills if get_taxonomy().key(s) in role_keys]
+        role_match = (
+            f"{role.describe()} uses {len(overlap)} of {len(required_skills)} "
+            f"required skills: {', '.join(overlap) or 'none'}"
+        )
+
+    reasoning = (
+        f"{len(recent)} required skills used within {RECENT_SKILL_MONTHS} months, "
+        f"{len(outdated)} used earlier, {len(missing)} not found in dated roles "
+        f"({', '.join(missing) or 'none'}). Computed from the experience timeline."
+    )
+    return RecencyRelevanceResult(
+        score=round(score, 1),
+        recent_relevant_experience=recent,
+        outdated_experience=outdated,
+        most_recent_role_match=role_match,
+        reasoning=reasoning,
+        red_flags=red_flags,
+        technology_freshness=freshness,
+    )
@@ -0,0 +1,78 @@
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel, create_model
+from match_evaluation.agent_state import AgentState
+from match_evaluation.agent_prompts import FUSED_EVALUATION_PROMPT
+from match_evaluation.dimension_registry import DIMENSIONS, EvaluationStep
+from match_evaluation.llm_requests import LLMRequest
+from match_evaluation.evaluation_consts import SCORING_TIME_RESERVE
+from match_evaluation.experience_timeline import candidate_total_years
+
+
+@lru_cache(maxsize=None)
+def fused_schema(fields: Tuple[Tuple[str, Optional[Type[BaseModel]]], ...]):
+    """Composite schema with one field per dimension, plain text for free-form requests."""
+    return create_model(
+        "FusedEvaluationResult",
+        **{name: (schema or str, ...) for name, schema in fields},
+    )
+
+
+def fused_evaluation_request(state: AgentState, dimension_options: Dict = None):
+    """
+    Every dimension's LLM request sent as one structured call.
+
+    The CV and job go into the prompt once, each dimension only adds its
+    instructions. Dimensions answered locally are merged as they are. The
+    response is split back per dimension and passed to that dimension's own
+    finalize, so the state looks the same as after the separate calls.
+    """
+    print("Assissing all dimensions in one call...")
+    dimension_options = dimension_options or {}
+    update, pending = {}, {}
+    for name, dimension in DIMENSIONS.items():
+        request = dimension.request(state, **dimension_options.get(name, {}))
+        if isinstance(request, LLMRequest):
+            pending[name] = request
+        else:
+            update.update(request)
+    if not pending:
+        return update
+
+    def finalize(result):
+        for name, request in pending.items():
+            value = getattr(result, name)
+            if request.schema is None:
+                value = AIMessage(content=value)
+            update.update(request.finalize(value))
+        return update
+
+    sections = "\n\n".join(
+        f"## Section: {name}\n{(request.instructions or request.prompt).strip()}"
+        for name, request in pending.items()
+    )
+    return LLMRequest(
+        FUSED_EVALUATION_PROMPT.format(
+            job=state.job.model_dump_json(exclude_none=True),
+            cv=state.cv.model_dump_json(exclude_none=True),
+            total_years_experience=candidate_total_years(state.cv),
+            current_date=date.today().strftime("%B %Y"),
+            sections=sections,
+        ),
+        finalize,
+        fused_schema(tuple((name, r.schema) for name, r in pending.items())),
+    )
+
+
+def fused_evaluation_step() -> EvaluationStep:
+    reads = {field: None for d in DIMENSIONS.values() for field in d.reads}
+    return EvaluationStep(
+        "fused_evaluation",
+        tuple(reads),
+        tuple(DIMENSIONS),
+        fused_evaluation_request,
+        lambda state: {"skipped_dimensions": list(DIMENSIONS)},
+        SCORING_TIME_RESERVE,
+    )
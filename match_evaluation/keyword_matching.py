@@ -0,0 +1,173 @@
+import re
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from match_evaluation.output_schemas import KeywordMatchResult
+
+# Commonly abbreviated terms that count as the same keyword
+KEYWORD_EQUIVALENTS = [
+    ["machine learning", "ML"],
+    ["artificial intelligence", "AI"],
+    ["JavaScript", "JS"],
+    ["TypeScript", "TS"],
+]
+WORD_CHARS = re.compile(r"[A-Za-z0-9+#]")
+# Keywords this short ("Go", "R", "C") are matched in their own case and "-"
+# and "&" join words around them, so "go-to", "to go" and "R&D" do not count
+SHORT_KEYWORD_CHARS = 2
+SHORT_WORD_CHARS = re.compile(r"[A-Za-z0-9+#&-]")
+FOLDED, EXACT = 0, 1
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def is_case_sensitive(name: str) -> bool:
+    """Short and all-caps names (AWS, SQL) keep their case when matched."""
+    return len(name) <= SHORT_KEYWORD_CHARS or name.isupper()
+
+
+def inflections(word: str) -> List[str]:
+    forms = [word, word + "s", word + "es", word + "'s"]
+    if word.endswith("y") and len(word) > 2:
+        forms.append(word[:-1] + "ies")
+    if word.endswith("ies"):
+        forms.append(word[:-3] + "y")
+    elif word.endswith("s") and len(word) > 3:
+        forms.append(word[:-1])
+        if word.endswith("es"):
+            forms.append(word[:-2])
+    return forms
+
+
+def keyword_variants(keyword: str) -> List[Tuple[str, bool]]:
+    """Spellings of a keyword that count as a literal match.
+
+    Covers plural/singular forms of the last word, hyphen vs space and the
+    equivalence groups. Each spelling comes with whether it is case sensitive;
+    other spellings are lowercase and matched against lowercased text.
+    """
+    base = " ".join(keyword.split())
+    names = {base}
+    for group in KEYWORD_EQUIVALENTS:
+        if normalize_keyword(base) in map(normalize_keyword, group):
+            names.update(group)
+    variants = set()
+    for name in names:
+        case_sensitive = is_case_sensitive(name)
+        spellings = {name, name.upper()} if case_sensitive else {name.lower()}
+        for spelling in list(spellings):
+            spellings.update({spelling.replace("-", " "), spelling.replace(" ", "-")})
+        for spelling in spellings:
+            head, _, last = spelling.rpartition(" ")
+            for form in inflections(last):
+                variants.add((f"{head} {form}" if head else form, case_sensitive))
+    return sorted(variants)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton counting whole-word keyword hits in one pass.
+
+    Case-insensitive spellings hang off the FOLDED root and see lowercased
+    characters, case-sensitive ones hang off the EXACT root and see the text
+    as written. Both are advanced over the same scan.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self.goto: List[Dict[str, int]] = [{}, {}]
+        self.fail: List[int] = [FOLDED, EXACT]
+        self.output: List[List[Tuple[int, int]]] = [[], []]
+        for index, keyword in enumerate(keywords):
+            for variant, case_sensitive in keyword_variants(keyword):
+                self._add(variant, index, EXACT if case_sensitive else FOLDED)
+        self._build_failure_links(FOLDED)
+        self._build_failure_links(EXACT)
+
+    def _add(self, pattern: str, index: int, root: int):
+        state = root
+        for char in pattern:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(root)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        if (index, len(pattern)) not in self.output[state]:
+            self.output[state].append((index, len(pattern)))
+
+    def _build_failure_links(self, root: int):
+        queue = deque(self.goto[root].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback != root and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, root)
+                if self.fail[child] == child:
+                    self.fail[child] = root
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def _step(self, state: int, char: str, root: int) -> int:
+        while state != root and char not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(char, root)
+
+    def count(self, text: str) -> Counter:
+        """Occurrences per keyword, variants of one keyword share a count."""
+        text = " ".join(text.split())
+        counts = Counter()
+        seen = set()
+        folded, exact = FOLDED, EXACT
+        for end, char in enumerate(text, start=1):
+            lower = char.lower()
+            folded = self._step(folded, lower if len(lower) == 1 else char, FOLDED)
+            exact = self._step(exact, char, EXACT)
+            for index, length in self.output[folded] + self.output[exact]:
+                start = end - length
+                word_chars = (
+                    SHORT_WORD_CHARS if length <= SHORT_KEYWORD_CHARS else WORD_CHARS
+                )
+                if start > 0 and word_chars.match(text[start - 1]):
+                    continue
+                if end < len(text) and word_chars.match(text[end]):
+                    continue
+                if (index, start) in seen:
+                    continue
+                seen.add((index, start))
+                counts[self.keywords[index]] += 1
+        return counts
+
+
+@lru_cache(maxsize=64)
+def get_automaton(keywords: Tuple[str, ...]) -> KeywordAutomaton:
+    return KeywordAutomaton(list(keywords))
+
+
+def local_keyword_match(keywords: List[str], text: str) -> KeywordMatchResult:
+    """Exact keyword presence, frequency and score without an LLM call."""
+    keywords = list(dict.fromkeys(k for k in keywords if k.strip()))
+    counts = get_automaton(tuple(keywords)).count(text or "")
+    matched = [k for k in keywords if counts[k]]
+    missing = [k for k in keywords if not counts[k]]
+    score = 100 * len(matched) / len(keywords) if keywords else 100.0
+    rare = [k for k in matched if counts[k] == 1]
+    reasoning = (
+        f"{len(matched)} of {len(keywords)} critical keywords found in the CV text."
+    )
+    if rare:
+        reasoning += f" Mentioned only once: {', '.join(rare)}."
+    if missing:
+        reasoning += f" An ATS filter would miss: {', '.join(missing)}."
+    return KeywordMatchResult(
+        score=round(score, 1),
+        matched_keywords=matched,
+        missing_keywords=missing,
+        reasoning=reasoning,
+        red_flags=[f"Missing critical keyword: {k}" for k in missing],
+        keyword_frequency={k: counts[k] for k in matched},
+    )
@@ -0,0 +1,122 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Type, Union
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+from disk_cache import DiskCache, content_hash, llm_model_name
+from llm_hedging import ainvoke_hedged, invoke_hedged
+
+
+@dataclass
+class LLMRequest:
+    """
+    The LLM call an evaluation agent still needs after its local work.
+
+    Agents build one of these (or return a finished state update) so the
+    same agent can run on the sync and the async path. finalize turns the
+    LLM response into the state update. instructions is the prompt without
+    the CV and job data, sent instead of it when requests are fused.
+    """
+
+    prompt: str
+    finalize: Callable[[Any], dict]
+    schema: Optional[Type[BaseModel]] = None
+    method: Optional[str] = None
+    instructions: Optional[str] = None
+
+    @classmethod
+    def for_key(
+        cls,
+        key: str,
+        schema: Type[BaseModel],
+        prompt: str,
+        instructions: Optional[str] = None,
+    ) -> "LLMRequest":
+        """Request whose structured result is stored under one state key."""
+        return cls(prompt, lambda result: {key: result}, schema, None, instructions)
+
+    def runnable(self, llm):
+        if self.schema is None:
+            return llm
+        if self.method:
+            return llm.with_structured_output(self.schema, method=self.method)
+        return llm.with_structured_output(self.schema)
+
+    def cache_key(self, llm) -> str:
+        """
+        Key on the formatted prompt, which holds exactly the state fields the
+        agent reads and the prompt template itself, plus schema and model.
+        """
+        schema = self.schema.model_json_schema() if self.schema else None
+        return content_hash(
+            self.prompt,
+            json.dumps(schema, sort_keys=True),
+            self.method,
+            llm_model_name(llm),
+        )
+
+    def node_key(self) -> str:
+        return self.schema.__name__ if self.schema else "text"
+
+    def dump(self, response) -> dict:
+        if self.schema is None:
+            return {"content": response.content}
+        return {"result": response.model_dump(mode="json")}
+
+    def load(self, entry: dict):
+        if self.schema is None:
+            return AIMessage(content=entry["content"])
+        return self.schema.model_validate(entry["result"])
+
+
+def _cached(request: LLMRequest, llm, cache: Optional[DiskCache]):
+    if cache is None:
+        return None
+    entry = cache.get(request.cache_key(llm))
+    if entry is None:
+        return None
+    try:
+        return request.load(entry)
+    except (KeyError, ValueError):
+        # Written by an older schema, recompute
+        return None
+
+
+def _store(request: LLMRequest, llm, cache: Optional[DiskCache], response):
+    if cache is not None:
+        cache.put(request.cache_key(llm), request.dump(response))
+
+
+def run_request(
+    request: Union[LLMRequest, dict],
+    llm,
+    cache: Optional[DiskCache] = None,
+    key: Optional[str] = None,
+) -> dict:
+    """key names the node for latency tracking, the schema name by default."""
+    if not isinstance(request, LLMRequest):
+        return request
+    response = _cached(request, llm, cache)
+    if response is None:
+        response = invoke_hedged(
+            key or request.node_key(), request.runnable(llm), request.prompt
+        )
+        _store(request, llm, cache, response)
+    return request.finalize(response)
+
+
+async def arun_request(
+    request: Union[LLMRequest, dict],
+    llm,
+    cache: Optional[DiskCache] = None,
+    key: Optional[str] = None,
+) -> dict:
+    if not isinstance(request, LLMRequest):
+        return request
+    response = _cached(request, llm, cache)
+    if response is None:
+        response = await ainvoke_hedged(
+            key or request.node_key(), request.runnable(llm), request.prompt
+        )
+        _store(request, llm, cache, response)
+    return request.finalize(response)
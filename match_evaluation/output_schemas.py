@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from typing import Dict, List, Literal
 
 
 class SkillsMatchResult(BaseModel):
@@ -14,6 +14,19 @@ class SkillsMatchResult(BaseModel):
     red_flags: List[str] = Field(description="Critical missing skills")
 
 
+class SkillsResidualResult(BaseModel):
+    matched_items: List[str] = Field(
+        description="Required skills from the list that the candidate has"
+    )
+    partial_matches: List[str] = Field(
+        description="Required skills with only a related candidate skill, as 'Required → Candidate skill'"
+    )
+    bonus_items: List[str] = Field(
+        description="Nice-to-have skills from the list that the candidate has"
+    )
+    reasoning: str = Field(description="One sentence on the decisions")
+
+
 class QualificationMatchResult(BaseModel):
     score: float = Field(description="Match score from 0-100")
     matched_items: List[str] = Field(
@@ -121,44 +134,27 @@ class FinalScoringResult(BaseModel):
 
 
 class WeightingStrategy(BaseModel):
-    """Dynamic weights tailored to specific job requirements"""
+    """
+    Dynamic weights tailored to specific job requirements.
 
-    skills_match: float = Field(
-        ge=0, le=1, description="Weight for technical skills matching"
-    )
-    keyword_match: float = Field(
-        ge=0, le=1, description="Weight for ATS keyword matching"
-    )
-    requirements_coverage: float = Field(
-        ge=0, le=1, description="Weight for must-have requirements"
-    )
-    seniority_match: float = Field(
-        ge=0, le=1, description="Weight for experience level"
-    )
-    qualification_match: float = Field(
-        ge=0, le=1, description="Weight for education/certs/portfolio"
-    )
-    recency_relevance: float = Field(
-        ge=0, le=1, description="Weight for how current experience is"
-    )
-    domain_match: float = Field(
-        ge=0, le=1, description="Weight for industry experience"
-    )
+    Only the common fields, the weight fields are added per registered
+    dimension by dimension_registry.weighting_schema.
+    """
 
     reasoning: str = Field(description="Why these weights were chosen for this role")
     role_archetype: str = Field(
         description="E.g., 'senior-technical', 'entry-level', 'domain-specialist', 'leadership'"
     )
 
+    @property
+    def weights(self) -> Dict[str, float]:
+        return {
+            name: getattr(self, name)
+            for name in type(self).model_fields
+            if name not in WeightingStrategy.model_fields
+        }
+
     @property
     def total_weight(self) -> float:
         """Ensure weights sum to 1.0"""
-        return (
-            self.skills_match
-            + self.keyword_match
-            + self.requirements_coverage
-            + self.seniority_match
-            + self.qualification_match
-            + self.recency_relevance
-            + self.domain_match
-        )
+        return sum(self.weights.values())
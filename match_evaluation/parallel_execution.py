@@ -1,31 +1,100 @@
 from match_evaluation.agent_state import AgentState
 from match_evaluation.output_schemas import *
 from match_evaluation.agent_prompts import *
-
-
-def skills_match_agent_sync(state: AgentState, llm):
+from match_evaluation.llm_requests import LLMRequest
+from match_evaluation.dimension_registry import (
+    DIMENSIONS,
+    Dimension,
+    EvaluationStep,
+    register_dimension,
+    weighting_schema,
+)
+from match_evaluation.similarity import best_matches, related_pairs
+from match_evaluation.evaluation_consts import (
+    DECISION_THRESHOLDS,
+    DOMAIN_SIMILARITY_THRESHOLD,
+    SKILL_SIMILARITY_THRESHOLD,
+    KEYWORD_LLM_REASONING,
+    LOCAL_RECENCY_EVALUATION,
+    LOCAL_SENIORITY_CLASSIFIER,
+    SCORING_TIME_RESERVE,
+    SKILLS_LLM_FALLBACK,
+)
+from match_evaluation.seniority_classifier import local_seniority_match
+from match_evaluation.keyword_matching import local_keyword_match
+from match_evaluation.skills_matching import (
+    EXACT,
+    PARTIAL,
+    CandidateSkills,
+    build_skills_result,
+    match_skills,
+)
+from match_evaluation.experience_timeline import (
+    ExperienceTimeline,
+    candidate_total_years,
+    local_recency_relevance,
+)
+
+
+def skills_match_request(state: AgentState, llm_fallback=SKILLS_LLM_FALLBACK):
     print("Assissing skills...")
-    cv_skills = state.cv.technical_skills
-    required_skills = state.job.required_technical_skills
-    nice_to_have = state.job.nice_to_have_skills
-
-    experience_skills = []
-    for exp in state.cv.experience:
-        experience_skills.extend(exp.technologies)
+    required = [s.name for s in state.job.required_technical_skills]
+    nice_to_have = [s.name for s in state.job.nice_to_have_skills]
+
+    candidate = CandidateSkills.from_cv(state.cv, state.skill_ids)
+
+    required_matches, unresolved_required = match_skills(required, candidate)
+    bonus_matches, unresolved_nice = match_skills(nice_to_have, candidate)
+    matched = [m.skill for m in required_matches if m.kind == EXACT]
+    partial = [m.describe() for m in required_matches if m.kind == PARTIAL]
+    bonus = [m.skill for m in bonus_matches]
+    candidate_names = list(candidate.names.values())
+    # Similar names ("Microsoft Word" / "Microsoft Excel") are only hints for
+    # the LLM, they are never credited on their own
+    similar_names = [
+        f"{skill} ~ {candidate_skill}"
+        for skill, candidate_skill, _ in best_matches(
+            unresolved_required + unresolved_nice,
+            candidate_names,
+            SKILL_SIMILARITY_THRESHOLD,
+        )
+    ]
 
-    result = llm.with_structured_output(SkillsMatchResult).invoke(
-        SKILL_MATCH_PROMPT.format(
-            required_skills=required_skills,
-            nice_to_have=nice_to_have,
-            cv_skills=cv_skills,
-            experience_skills=experience_skills,
+    if not llm_fallback or not (unresolved_required or unresolved_nice):
+        result = build_skills_result(required, nice_to_have, matched, partial, bonus)
+        return {"skills_match": result}
+
+    def finalize(residual: SkillsResidualResult):
+        result = build_skills_result(
+            required,
+            nice_to_have,
+            matched + [s for s in residual.matched_items if s in unresolved_required],
+            partial
+            + [
+                p
+                for p in residual.partial_matches
+                if p.split(" → ")[0] in unresolved_required
+            ],
+            bonus + [s for s in residual.bonus_items if s in unresolved_nice],
+            residual.reasoning,
         )
-    )
+        return {"skills_match": result}
 
-    return {"skills_match": result}
+    values = dict(
+        required_skills=unresolved_required,
+        nice_to_have=unresolved_nice,
+        candidate_skills=candidate_names,
+        similar_names=similar_names or "none",
+    )
+    return LLMRequest(
+        SKILL_RESIDUAL_PROMPT.format(**values),
+        finalize,
+        SkillsResidualResult,
+        instructions=SKILL_RESIDUAL_INSTRUCTIONS.format(**values),
+    )
 
 
-def qualification_match_agent_sync(state: AgentState, llm) -> QualificationMatchResult:
+def qualification_match_request(state: AgentState) -> LLMRequest:
     print("Assissing qualification...")
     cv_education = state.cv.education
     cv_certifications = state.cv.certifications
@@ -41,7 +110,9 @@ def qualification_match_agent_sync(state: AgentState, llm) -> QualificationMatch
         for p in cv_projects
     ]
 
-    result = llm.with_structured_output(QualificationMatchResult).invoke(
+    return LLMRequest.for_key(
+        "qualification_match",
+        QualificationMatchResult,
         QUALIFICATION_MATCH_PROMPT.format(
             must_have_requirements=state.job.required_technical_skills,
             required_years_experience=state.job.required_years_experience,
@@ -49,52 +120,80 @@ def qualification_match_agent_sync(state: AgentState, llm) -> QualificationMatch
             required_certifications=state.job.required_certifications,
             education_formatted=education_formatted,
             cv_certifications=cv_certifications,
-            total_years_experience=state.cv.total_years_experience,
+            total_years_experience=candidate_total_years(state.cv),
             projects_formatted=projects_formatted,
             technical_skills=technical_skills,
-        )
+        ),
+        QUALIFICATION_MATCH_INSTRUCTIONS,
     )
-    return {"qualification_match": result}
 
 
-def seniority_match_agent_sync(state: AgentState, llm) -> SeniorityMatchResult:
+def seniority_match_request(state: AgentState, local=LOCAL_SENIORITY_CLASSIFIER):
     print("Assissing seniority...")
     cv_titles = [exp.title for exp in state.cv.experience]
+    timeline = ExperienceTimeline(state.cv.experience)
+    total_years = (
+        timeline.total_years if timeline.roles else state.cv.total_years_experience
+    )
+    if local:
+        current_title = state.cv.current_title or (
+            timeline.most_recent_role.title if timeline.most_recent_role else None
+        )
+        result = local_seniority_match(
+            current_title,
+            total_years,
+            state.job.required_seniority,
+            state.job.job_title,
+            state.job.required_years_experience,
+        )
+        if result is not None:
+            return {"seniority_match": result}
 
-    result = llm.with_structured_output(SeniorityMatchResult).invoke(
+    timeline_facts = timeline.facts([])
+    return LLMRequest.for_key(
+        "seniority_match",
+        SeniorityMatchResult,
         SENIORITY_MATCH_PROMPT.format(
             required_years_experience=state.job.required_years_experience,
             required_seniority=state.job.required_seniority,
             job_title=state.job.job_title,
-            total_years_experience=state.cv.total_years_experience,
+            total_years_experience=total_years,
             cv_titles=cv_titles,
             current_title=state.cv.current_title,
-        )
+            timeline_facts=timeline_facts,
+        ),
+        SENIORITY_MATCH_INSTRUCTIONS.format(timeline_facts=timeline_facts),
     )
-    return {"seniority_match": result}
 
 
-def domain_match_agent_sync(state: AgentState, llm) -> DomainMatchResult:
+def domain_match_request(state: AgentState) -> LLMRequest:
     print("Assissing domain...")
 
     cv_domains = state.cv.domains
     cv_experience_domains = [exp.domain for exp in state.cv.experience if exp.domain]
     required_domains = state.job.required_domains
+    related_domains = related_pairs(
+        required_domains,
+        list(dict.fromkeys(cv_domains + cv_experience_domains)),
+        DOMAIN_SIMILARITY_THRESHOLD,
+    )
 
-    result = llm.with_structured_output(DomainMatchResult).invoke(
+    related_domains = "\n".join(related_domains) or "None"
+    return LLMRequest.for_key(
+        "domain_match",
+        DomainMatchResult,
         DOMAIN_MATCH_PROMPT.format(
             required_domains=required_domains,
             company=state.job.company,
             cv_domains=cv_domains,
             cv_experience_domains=cv_experience_domains,
-        )
+            related_domains=related_domains,
+        ),
+        DOMAIN_MATCH_INSTRUCTIONS.format(related_domains=related_domains),
     )
-    return {"domain_match": result}
 
 
-def requirements_coverage_agent_sync(
-    state: AgentState, llm
-) -> RequirementsCoverageResult:
+def requirements_coverage_request(state: AgentState) -> LLMRequest:
     print("Assissing requirements coverage...")
 
     must_have = state.job.required_technical_skills
@@ -108,60 +207,81 @@ def requirements_coverage_agent_sync(
         ],
         "education": [f"{e.certification} in {e.field}" for e in state.cv.education],
         "certifications": state.cv.certifications,
-        "years": state.cv.total_years_experience,
+        "years": candidate_total_years(state.cv),
     }
 
-    result = llm.with_structured_output(RequirementsCoverageResult).invoke(
+    return LLMRequest.for_key(
+        "requirements_coverage",
+        RequirementsCoverageResult,
         REQUIREMENTS_COVERAGE_PROMPT.format(
             must_have=must_have,
             nice_to_have=nice_to_have,
             other_requirements=other_requirements,
             cv_summary=cv_summary,
-        )
+        ),
+        REQUIREMENTS_COVERAGE_INSTRUCTIONS,
     )
-    return {"requirements_coverage": result}
 
 
-def recency_relevance_agent_sync(state: AgentState, llm) -> RecencyRelevanceResult:
+def recency_relevance_request(state: AgentState, local=LOCAL_RECENCY_EVALUATION):
     print("Assissing relevance...")
 
     experiences = state.cv.experience
     required_skills = state.job.required_technical_skills
+    timeline = ExperienceTimeline(experiences)
+    required_names = [s.name for s in required_skills]
+    if local:
+        return {"recency_relevance": local_recency_relevance(timeline, required_names)}
 
     experiences_formatted = [
         f"{e.title} at {e.company} ({e.start_date} to {e.end_date}): {', '.join(e.technologies)}"
         for e in experiences
     ]
 
-    result = llm.with_structured_output(RecencyRelevanceResult).invoke(
+    values = dict(
+        timeline_facts=timeline.facts(required_names),
+        current_date=timeline.today.strftime("%B %Y"),
+    )
+    return LLMRequest.for_key(
+        "recency_relevance",
+        RecencyRelevanceResult,
         RECENCY_RELEVANCE_PROMPT.format(
             required_skills=required_skills,
             job_title=state.job.job_title,
             experiences_formatted=experiences_formatted,
-        )
+            **values,
+        ),
+        RECENCY_RELEVANCE_INSTRUCTIONS.format(**values),
     )
-    return {"recency_relevance": result}
 
 
-def keyword_macth_agent_sync(state: AgentState, llm) -> KeywordMatchResult:
+def keyword_match_request(state: AgentState, llm_reasoning=KEYWORD_LLM_REASONING):
     print("Assissing keyword macth...")
 
-    critical_keywords = state.job.critical_keywords
-    cv_full_text = state.cv_description_text
+    result = local_keyword_match(state.job.critical_keywords, state.cv_description_text)
+    if not llm_reasoning:
+        return {"keyword_match": result}
 
-    result = llm.with_structured_output(KeywordMatchResult).invoke(
-        KEYWORD_MATCH_PROMPT.format(
-            critical_keywords=critical_keywords,
-            cv_full_text=cv_full_text,
-        )
+    def finalize(message):
+        result.reasoning = message.content
+        return {"keyword_match": result}
+
+    values = dict(
+        keyword_frequency=result.keyword_frequency,
+        missing_keywords=result.missing_keywords,
+        score=result.score,
+    )
+    return LLMRequest(
+        KEYWORD_REASONING_PROMPT.format(**values),
+        finalize,
+        instructions=KEYWORD_REASONING_INSTRUCTIONS.format(**values),
     )
-    return {"keyword_match": result}
 
 
-def weight_generation_agent_sync(state: AgentState, llm) -> dict:
+def weight_generation_request(state: AgentState) -> LLMRequest:
     """Generate dynamic weights based on job characteristics"""
     print("Weighting scores based on importance")
-    result = llm.with_structured_output(WeightingStrategy).invoke(
+    return LLMRequest(
         WEIGHT_GENERATION_PROMPT.format(
             job_title=state.job.job_title,
             required_years_experience=state.job.required_years_experience
@@ -175,37 +295,57 @@ def weight_generation_agent_sync(state: AgentState, llm) -> dict:
             required_certifications=state.job.required_certifications,
             must_have_requirements=state.job.other_requirements,
             role_summary=state.job.role_summary or "Not provided",
-        )
+            dimensions="\n".join(
+                f"{number}. **{d.weight_key}** (0-1): {d.weight_description}"
+                for number, d in enumerate(DIMENSIONS.values(), 1)
+            ),
+        ),
+        normalize_weights,
+        weighting_schema(),
     )
 
+
+def normalize_weights(result: WeightingStrategy) -> dict:
     # Normalize weights to ensure they sum to 1.0
     total = result.total_weight
     if abs(total - 1.0) > 0.01:  # Allow small floating point errors
         # Normalize
-        result.skills_match /= total
-        result.keyword_match /= total
-        result.requirements_coverage /= total
-        result.seniority_match /= total
-        result.qualification_match /= total
-        result.recency_relevance /= total
-        result.domain_match /= total
+        for dimension in DIMENSIONS.values():
+            key = dimension.weight_key
+            setattr(result, key, getattr(result, key) / total)
 
     return {"weighting_strategy": result}
 
 
-def scoring_agent_sync(state: AgentState, llm):
-    """Final scoring with dynamic weights and ATS reasoning"""
+def uniform_weights(state: AgentState) -> dict:
+    """Equal weights, used when weight generation misses the deadline."""
+    weight = 1 / len(DIMENSIONS)
+    return {
+        "weighting_strategy": weighting_schema()(
+            **{d.weight_key: weight for d in DIMENSIONS.values()},
+            reasoning="Weight generation missed the deadline, all dimensions weigh the same",
+            role_archetype="unknown",
+        )
+    }
 
-    print("Final scoring...")
-    weights = {
-        "skills_match": state.weighting_strategy.skills_match,
-        "keyword_match": state.weighting_strategy.keyword_match,
-        "requirements_coverage": state.weighting_strategy.requirements_coverage,
-        "seniority_match": state.weighting_strategy.seniority_match,
-        "qualification_match": state.weighting_strategy.qualification_match,
-        "recency_relevance": state.weighting_strategy.recency_relevance,
-        "domain_match": state.weighting_strategy.domain_match,
+
+def scoring_weights(state: AgentState) -> dict:
+    """Weights of the completed dimensions, renormalized to sum to 1."""
+    completed = {
+        name: getattr(state.weighting_strategy, dimension.weight_key)
+        for name, dimension in DIMENSIONS.items()
+        if getattr(state, name) is not None
     }
+    total = sum(completed.values())
+    if total <= 0:
+        return {name: 1 / len(completed) for name in completed}
+    return {name: weight / total for name, weight in completed.items()}
+
+
+def scoring_summary(state: AgentState) -> dict:
+    """Weighted score, breakdown and red flags over the completed dimensions."""
+    weights = scoring_weights(state)
+    skipped = [name for name in DIMENSIONS if name not in weights]
 
     weighted_score = sum(weights[k] * getattr(state, k).score for k in weights)
 
@@ -215,86 +355,253 @@ def scoring_agent_sync(state: AgentState, llm):
             for k in weights
         ]
     )
+    if skipped:
+        score_breakdown += (
+            f"\n  not evaluated (missed the deadline): {', '.join(skipped)}"
+        )
 
     all_red_flags_list = []
-    for dimension in [
-        "skills_match",
-        "keyword_match",
-        "requirements_coverage",
-        "seniority_match",
-        "qualification_match",
-        "recency_relevance",
-        "domain_match",
-    ]:
+    for dimension in weights:
         all_red_flags_list.extend(getattr(state, dimension).red_flags)
 
-    result = llm.with_structured_output(FinalScoringResult, method="json_mode").invoke(
-        SCORING_PROMPT.format(
-            job_title=state.job.job_title,
-            company=state.job.company or "Not specified",
-            required_seniority=state.job.required_seniority or "Not specified",
-            required_years_experience=state.job.required_years_experience
-            or "Not specified",
-            # Weights (formatted as percentages)
-            weight_skills=weights["skills_match"],
-            weight_keyword=weights["keyword_match"],
-            weight_requirements=weights["requirements_coverage"],
-            weight_seniority=weights["seniority_match"],
-            weight_qualification=weights["qualification_match"],
-            weight_recency=weights["recency_relevance"],
-            weight_domain=weights["domain_match"],
-            # Skills match details
-            skills_match_score=state.skills_match.score,
-            skills_matched=", ".join(state.skills_match.matched_items[:5]) or "None",
-            skills_missing=", ".join(state.skills_match.missing_items[:5]) or "None",
-            skills_red_flags=", ".join(state.skills_match.red_flags) or "None",
-            # Keyword match details
-            keyword_match_score=state.keyword_match.score,
-            keyword_missing=", ".join(state.keyword_match.missing_keywords[:5])
-            or "None",
-            keyword_red_flags=", ".join(state.keyword_match.red_flags) or "None",
-            # Requirements coverage
-            requirements_coverage_score=state.requirements_coverage.score,
-            requirements_satisfied=len(state.requirements_coverage.must_have_satisfied),
-            requirements_total=len(state.requirements_coverage.must_have_satisfied)
-            + len(state.requirements_coverage.must_have_missing),
-            requirements_coverage_pct=state.requirements_coverage.coverage_percentage,
-            requirements_red_flags=", ".join(state.requirements_coverage.red_flags)
-            or "None",
-            # Seniority
-            seniority_match_score=state.seniority_match.score,
-            candidate_level=state.seniority_match.candidate_level,
-            required_level=state.seniority_match.required_level,
-            years_gap=state.seniority_match.years_gap,
-            seniority_red_flags=", ".join(state.seniority_match.red_flags) or "None",
-            # Qualification
-            qualification_match_score=state.qualification_match.score,
-            portfolio_quality=state.qualification_match.portfolio_quality,
-            portfolio_boost=state.qualification_match.portfolio_boost,
-            qualification_red_flags=", ".join(state.qualification_match.red_flags)
-            or "None",
-            # Recency
-            recency_relevance_score=state.recency_relevance.score,
-            tech_freshness=state.recency_relevance.technology_freshness,
-            recency_red_flags=", ".join(state.recency_relevance.red_flags) or "None",
-            # Domain
-            domain_match_score=state.domain_match.score,
-            domain_matched=", ".join(state.domain_match.matched_items) or "None",
-            domain_red_flags=", ".join(state.domain_match.red_flags) or "None",
-            # Calculated values
-            weighted_score=weighted_score,
-            score_breakdown=score_breakdown,
-        )
-    )
+    return {
+        "weights": weights,
+        "weighted_score": weighted_score,
+        "score_breakdown": score_breakdown,
+        "all_red_flags": all_red_flags_list,
+    }
+
+
+def scoring_update(result: FinalScoringResult, summary: dict) -> dict:
     print("Done with the scoring")
     return {
         "decision": result.decision,
         "recommendation": result.recommendation,
         "final_scoring": result,
         "focus_areas": result.focus_areas,
-        "all_red_flags": all_red_flags_list,
+        "all_red_flags": summary["all_red_flags"],
         "weaknesses": result.weaknesses,
         "strengths": result.strengths,
-        "weighted_score": weighted_score,
-        "score_breakdown": score_breakdown,
+        "weighted_score": summary["weighted_score"],
+        "score_breakdown": summary["score_breakdown"],
+    }
+
+
+def local_scoring(state: AgentState, summary: dict) -> FinalScoringResult:
+    """Decision from the weighted score alone, without the LLM review."""
+    weighted_score = summary["weighted_score"]
+    decision = next(d for low, d in DECISION_THRESHOLDS if weighted_score >= low)
+    ranked = sorted(
+        summary["weights"], key=lambda k: getattr(state, k).score, reverse=True
+    )
+    return FinalScoringResult(
+        decision=decision,
+        strengths=[f"{k}: {getattr(state, k).score:.0f}/100" for k in ranked[:3]],
+        weaknesses=[f"{k}: {getattr(state, k).score:.0f}/100" for k in ranked[-3:]],
+        recommendation=(
+            f"Your weighted match score is {weighted_score:.0f}/100 ({decision}). "
+            "The detailed review did not finish in time, so this decision comes "
+            "from the dimension scores only (confidence: low)."
+        ),
+        focus_areas=summary["all_red_flags"][:5],
+    )
+
+
+def local_scoring_update(state: AgentState) -> dict:
+    """Scoring result used when the scoring call misses the deadline."""
+    summary = scoring_summary(state)
+    return scoring_update(local_scoring(state, summary), summary)
+
+
+def evaluation_results(state: AgentState, weights: dict) -> str:
+    """One block per registered dimension for SCORING_PROMPT."""
+    blocks = []
+    for number, (name, dimension) in enumerate(DIMENSIONS.items(), 1):
+        if name not in weights:
+            blocks.append(
+                f"{number} **{dimension.title}**\n   Not evaluated (missed the deadline)"
+            )
+            continue
+        result = getattr(state, name)
+        lines = [
+            f"{number} **{dimension.title}** (weight: {weights[name]:.1%})",
+            f"   Score: {result.score}/100",
+        ]
+        if dimension.scoring_details is not None:
+            details = dimension.scoring_details(result)
+            lines.extend(f"   {label}: {value}" for label, value in details.items())
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def scoring_request(state: AgentState):
+    """Final scoring with dynamic weights and ATS reasoning"""
+
+    print("Final scoring...")
+    summary = scoring_summary(state)
+    if not summary["weights"]:
+        # No dimension finished, there is nothing to reason about
+        return scoring_update(local_scoring(state, summary), summary)
+
+    return LLMRequest(
+        SCORING_PROMPT.format(
+            job_title=state.job.job_title,
+            company=state.job.company or "Not specified",
+            required_seniority=state.job.required_seniority or "Not specified",
+            required_years_experience=state.job.required_years_experience
+            or "Not specified",
+            evaluation_results=evaluation_results(state, summary["weights"]),
+            weighted_score=summary["weighted_score"],
+            score_breakdown=summary["score_breakdown"],
+        ),
+        lambda result: scoring_update(result, summary),
+        FinalScoringResult,
+        method="json_mode",
+    )
+
+
+def skills_scoring_details(result: SkillsMatchResult) -> dict:
+    return {
+        "Matched": ", ".join(result.matched_items[:5]) or "None",
+        "Missing": ", ".join(result.missing_items[:5]) or "None",
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+def keyword_scoring_details(result: KeywordMatchResult) -> dict:
+    return {
+        "Missing Keywords": ", ".join(result.missing_keywords[:5]) or "None",
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+def requirements_scoring_details(result: RequirementsCoverageResult) -> dict:
+    total = len(result.must_have_satisfied) + len(result.must_have_missing)
+    return {
+        "Must-Haves Satisfied": f"{len(result.must_have_satisfied)}/{total}",
+        "Coverage": f"{result.coverage_percentage}%",
+        "Red Flags": ", ".join(result.red_flags) or "None",
     }
+
+
+def seniority_scoring_details(result: SeniorityMatchResult) -> dict:
+    return {
+        "Candidate Level": f"{result.candidate_level} | Required: {result.required_level}",
+        "Years Gap": f"{result.years_gap:+.1f} years",
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+def qualification_scoring_details(result: QualificationMatchResult) -> dict:
+    return {
+        "Portfolio Quality": result.portfolio_quality,
+        "Portfolio Boost": f"+{result.portfolio_boost} points",
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+def recency_scoring_details(result: RecencyRelevanceResult) -> dict:
+    return {
+        "Tech Freshness": result.technology_freshness,
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+def domain_scoring_details(result: DomainMatchResult) -> dict:
+    return {
+        "Matched Domains": ", ".join(result.matched_items) or "None",
+        "Red Flags": ", ".join(result.red_flags) or "None",
+    }
+
+
+register_dimension(
+    Dimension(
+        "qualification_match",
+        ("cv", "job"),
+        qualification_match_request,
+        title="Qualification Match",
+        weight_description="Education, certifications, portfolio quality",
+        scoring_details=qualification_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "skills_match",
+        ("cv", "job", "skill_ids"),
+        skills_match_request,
+        title="Skills Match",
+        weight_description="Technical skills alignment (semantic matching)",
+        scoring_details=skills_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "domain_match",
+        ("cv", "job"),
+        domain_match_request,
+        title="Domain Match",
+        weight_description="Industry/domain experience relevance",
+        scoring_details=domain_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "seniority_match",
+        ("cv", "job"),
+        seniority_match_request,
+        title="Seniority Match",
+        weight_description="Years of experience and title level",
+        scoring_details=seniority_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "recency_relevance",
+        ("cv", "job"),
+        recency_relevance_request,
+        title="Recency/Relevance",
+        weight_description="How current/fresh is the experience",
+        scoring_details=recency_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "requirements_coverage",
+        ("cv", "job"),
+        requirements_coverage_request,
+        title="Requirements Coverage",
+        weight_description="Must-have vs nice-to-have satisfaction",
+        scoring_details=requirements_scoring_details,
+    )
+)
+register_dimension(
+    Dimension(
+        "keyword_match",
+        ("job", "cv_description_text"),
+        keyword_match_request,
+        title="Keyword Match",
+        weight_description="Exact keyword matching (ATS filtering)",
+        scoring_details=keyword_scoring_details,
+    )
+)
+
+# Weights depend on the job only, so they are generated next to the dimensions
+WEIGHT_GENERATION_STEP = EvaluationStep(
+    "weight_generation",
+    ("job",),
+    ("weighting_strategy",),
+    weight_generation_request,
+    uniform_weights,
+    SCORING_TIME_RESERVE,
+)
+
+
+def scoring_step() -> EvaluationStep:
+    """Scoring reads every registered dimension, so it is built on demand."""
+    return EvaluationStep(
+        "scoring",
+        ("job", "weighting_strategy", *DIMENSIONS),
+        ("final_scoring",),
+        scoring_request,
+        local_scoring_update,
+    )
@@ -0,0 +1,162 @@
+from dataclasses import dataclass, field
+from langgraph.graph import END
+from typing import List
+from match_evaluation.agent_state import AgentState
+from match_evaluation.output_schemas import FinalScoringResult
+from match_evaluation.similarity import best_matches, related_pairs
+from match_evaluation.skills_matching import CandidateSkills, match_skills
+from match_evaluation.evaluation_consts import (
+    CERTIFICATION_SIMILARITY_THRESHOLD,
+    DECISION_THRESHOLDS,
+    DOMAIN_SIMILARITY_THRESHOLD,
+    EDUCATION_SIMILARITY_THRESHOLD,
+    GATE_MAX_SKILL_COVERAGE,
+    GATE_MIN_FAILED_SIGNALS,
+    GATE_MIN_REQUIRED_SKILLS,
+    SKILL_SIMILARITY_THRESHOLD,
+)
+
+
+@dataclass
+class RelevanceSignals:
+    required_skills: List[str]
+    matched_skills: List[str]
+    missing_skills: List[str]
+    # Checks besides the skills the CV fails or meets
+    failed: List[str] = field(default_factory=list)
+    passed: List[str] = field(default_factory=list)
+
+    @property
+    def skill_coverage(self) -> float:
+        return len(self.matched_skills) / len(self.required_skills)
+
+    @property
+    def irrelevant(self) -> bool:
+        return (
+            len(self.required_skills) >= GATE_MIN_REQUIRED_SKILLS
+            and self.skill_coverage <= GATE_MAX_SKILL_COVERAGE
+            and len(self.failed) >= GATE_MIN_FAILED_SIGNALS
+        )
+
+
+def _missing(required: List[str], available: List[str], threshold: float):
+    found = {left for left, _, _ in best_matches(required, available, threshold)}
+    return [r for r in required if r not in found]
+
+
+def relevance_signals(state: AgentState) -> RelevanceSignals:
+    """Skill, domain and hard-requirement overlap, computed without the LLM."""
+    cv, job = state.cv, state.job
+    required = [s.name for s in job.required_technical_skills]
+    candidate = CandidateSkills.from_cv(cv, state.skill_ids)
+    resolved, unresolved = match_skills(required, candidate)
+    similar = best_matches(
+        unresolved, list(candidate.names.values()), SKILL_SIMILARITY_THRESHOLD
+    )
+    matched = [m.skill for m in resolved] + [skill for skill, _, _ in similar]
+    signals = RelevanceSignals(
+        required, matched, [s for s in required if s not in matched]
+    )
+
+    cv_domains = list(
+        dict.fromkeys(cv.domains + [e.domain for e in cv.experience if e.domain])
+    )
+    if job.required_domains:
+        domains = ", ".join(job.required_domains)
+        if related_pairs(job.required_domains, cv_domains, DOMAIN_SIMILARITY_THRESHOLD):
+            signals.passed.append(
+                f"Experience related to the required domains: {domains}"
+            )
+        else:
+            signals.failed.append(f"No experience in the required domains: {domains}")
+
+    missing_certifications = _missing(
+        job.required_certifications,
+        cv.certifications,
+        CERTIFICATION_SIMILARITY_THRESHOLD,
+    )
+    if missing_certifications:
+        signals.failed.append(
+            f"Missing mandatory certifications: {', '.join(missing_certifications)}"
+        )
+    elif job.required_certifications:
+        signals.passed.append("Holds the required certifications")
+
+    required_fields = [e.field for e in job.required_education if e.field]
+    cv_fields = [e.field for e in cv.education if e.field]
+    if required_fields:
+        missing_fields = _missing(
+            required_fields, cv_fields, EDUCATION_SIMILARITY_THRESHOLD
+        )
+        if len(missing_fields) == len(required_fields):
+            signals.failed.append(
+                f"No education in the required fields: {', '.join(required_fields)}"
+            )
+        else:
+            signals.passed.append("Education in a required field")
+    return signals
+
+
+def relevance_gate(state: AgentState) -> dict:
+    """
+    Final result for clearly unrelated pairs, only relevant=True otherwise.
+
+    A pair is only cut short when almost no required skill matches and at
+    least one hard signal (domain, certification, education) fails as well.
+    The score of a gated pair is its required skill coverage, the only part
+    of the evaluation that ran.
+    """
+    signals = relevance_signals(state)
+    if not signals.irrelevant:
+        return {"relevant": True}
+    print("Position not relevant, skipping the detailed evaluation")
+
+    score = round(100 * signals.skill_coverage, 1)
+    decision = next(d for low, d in DECISION_THRESHOLDS if score >= low)
+    strengths = list(signals.passed)
+    if signals.matched_skills:
+        strengths.insert(
+            0,
+            f"Matches {len(signals.matched_skills)} of "
+            f"{len(signals.required_skills)} required skills: "
+            f"{', '.join(signals.matched_skills)}",
+        )
+    result = FinalScoringResult(
+        decision=decision,
+        strengths=strengths,
+        weaknesses=[
+            f"Missing required skills: {', '.join(signals.missing_skills)}",
+            *signals.failed,
+        ],
+        recommendation=(
+            "Quick relevance check only, the detailed evaluation was skipped. "
+            f"This position is not relevant to your profile: you match "
+            f"{len(signals.matched_skills)} of {len(signals.required_skills)} "
+            "required skills. "
+            + "".join(f"{reason}. " for reason in signals.failed[:1])
+            + "Applying or tailoring your CV for it is unlikely to be worth the effort."
+        ),
+        focus_areas=signals.missing_skills[:5],
+    )
+    return {
+        "relevant": False,
+        "decision": result.decision,
+        "recommendation": result.recommendation,
+        "final_scoring": result,
+        "focus_areas": result.focus_areas,
+        "all_red_flags": result.weaknesses,
+        "weaknesses": result.weaknesses,
+        "strengths": result.strengths,
+        "weighted_score": score,
+        "score_breakdown": (
+            f"  relevance gate: {signals.skill_coverage:.0%} of required skills "
+            "matched, detailed evaluation skipped"
+        ),
+    }
+
+
+def route_relevance(state: AgentState, evaluation_nodes: List[str]):
+    """Stop after the gate when it already produced the final result."""
+    if state.relevant is False:
+        return END
+    return evaluation_nodes
@@ -0,0 +1,160 @@
+import re
+from typing import List, Optional, Tuple
+from match_evaluation.evaluation_consts import SENIORITY_MIN_CONFIDENCE
+from match_evaluation.output_schemas import SeniorityMatchResult
+
+LEVELS = ["junior", "mid", "senior", "lead", "principal"]
+# Lower bound of years of experience per level, see SENIORITY_MATCH_PROMPT
+LEVEL_MIN_YEARS = {"junior": 0, "mid": 2, "senior": 5, "lead": 8, "principal": 12}
+
+TITLE_LEVELS = {
+    "intern": "junior",
+    "internship": "junior",
+    "trainee": "junior",
+    "apprentice": "junior",
+    "junior": "junior",
+    "jr": "junior",
+    "graduate": "junior",
+    "entry": "junior",
+    "mid": "mid",
+    "intermediate": "mid",
+    "ii": "mid",
+    "senior": "senior",
+    "sr": "senior",
+    "iii": "senior",
+    "lead": "lead",
+    "staff": "lead",
+    "iv": "lead",
+    "principal": "principal",
+    "architect": "principal",
+    "head": "principal",
+    "director": "principal",
+    "distinguished": "principal",
+    "vp": "principal",
+    "chief": "principal",
+    "cto": "principal",
+}
+
+MATCHING_CONFIDENCE = 0.9
+ADJACENT_CONFIDENCE = 0.75
+SINGLE_SIGNAL_CONFIDENCE = 0.7
+# Below SENIORITY_MIN_CONFIDENCE: years alone cannot tell a "Marketing
+# Coordinator" from an engineer, such titles go to the LLM
+YEARS_ONLY_CONFIDENCE = 0.5
+CONFLICT_CONFIDENCE = 0.4
+OVERQUALIFIED_MAX_SCORE = 80
+LEVEL_STEP_PENALTY = 25
+YEAR_GAP_PENALTY = 10
+
+
+def title_levels(title: Optional[str]) -> List[str]:
+    if not title:
+        return []
+    tokens = re.split(r"[^a-z]+", title.lower())
+    return sorted(
+        {TITLE_LEVELS[t] for t in tokens if t in TITLE_LEVELS}, key=LEVELS.index
+    )
+
+
+def years_level(years: Optional[float]) -> Optional[str]:
+    if years is None:
+        return None
+    return [level for level in LEVELS if years >= LEVEL_MIN_YEARS[level]][-1]
+
+
+def classify(
+    title: Optional[str], years: Optional[float]
+) -> Tuple[Optional[str], float]:
+    """Level from title tokens and years bands, with a confidence in [0, 1].
+
+    Titles with conflicting tokens ("Mid-Senior"), a title level far from
+    the years band or a title without any level token are ambiguous.
+    """
+    levels = title_levels(title)
+    by_years = years_level(years)
+    if len(levels) > 1 and LEVELS.index(levels[-1]) - LEVELS.index(levels[0]) > 1:
+        return levels[-1], CONFLICT_CONFIDENCE
+    by_title = levels[-1] if levels else None
+    if by_title and by_years:
+        distance = abs(LEVELS.index(by_title) - LEVELS.index(by_years))
+        if distance == 0:
+            return by_title, MATCHING_CONFIDENCE
+        if distance == 1:
+            return by_title, ADJACENT_CONFIDENCE
+        return by_title, CONFLICT_CONFIDENCE
+    if by_title:
+        confidence = SINGLE_SIGNAL_CONFIDENCE
+        if len(levels) > 1:
+            confidence = CONFLICT_CONFIDENCE
+        return by_title, confidence
+    if by_years:
+        return by_years, YEARS_ONLY_CONFIDENCE
+    return None, 0.0
+
+
+def local_seniority_match(
+    current_title: Optional[str],
+    total_years: Optional[float],
+    required_seniority: Optional[str],
+    job_title: Optional[str],
+    required_years: Optional[float],
+) -> Optional[SeniorityMatchResult]:
+    """SeniorityMatchResult without an LLM call, None when titles are ambiguous."""
+    candidate_level, candidate_confidence = classify(current_title, total_years)
+    required_title = (
+        required_seniority if title_levels(required_seniority) else job_title
+    )
+    required_level, required_confidence = classify(required_title, required_years)
+    confidence = min(candidate_confidence, required_confidence)
+    if (
+        not candidate_level
+        or not required_level
+        or confidence < SENIORITY_MIN_CONFIDENCE
+    ):
+        return None
+
+    if required_years is None:
+        required_years = LEVEL_MIN_YEARS[required_level]
+    level_gap = LEVELS.index(candidate_level) - LEVELS.index(required_level)
+    level_score = 100 - LEVEL_STEP_PENALTY * abs(level_gap)
+    if total_years is None:
+        # Unknown experience is not zero experience, score on the title only
+        years_gap = 0.0
+        score = max(0.0, min(100.0, level_score))
+    else:
+        years_gap = round(total_years - required_years, 1)
+        years_score = 100 - YEAR_GAP_PENALTY * max(0.0, -years_gap)
+        score = max(0.0, min(100.0, (years_score + level_score) / 2))
+    red_flags = []
+    if level_gap > 0:
+        score = min(score, OVERQUALIFIED_MAX_SCORE)
+        red_flags.append(
+            f"Overqualified: {candidate_level} candidate for a {required_level} role"
+        )
+    if years_gap <= -2:
+        red_flags.append(f"Underqualified by {-years_gap:g} years of experience")
+    if level_gap <= -2:
+        red_flags.append(
+            f"Title level {candidate_level} is two or more steps below {required_level}"
+        )
+
+    alignment = ["well-aligned", "slight-mismatch"]
+    return SeniorityMatchResult(
+        score=round(score, 1),
+        candidate_level=candidate_level,
+        required_level=required_level,
+        reasoning=(
+            f"Candidate classified as {candidate_level} ({current_title}, "
+            f"{'unknown' if total_years is None else total_years} years), "
+            f"role as {required_level} "
+            f"({required_title}, {required_years} years required). "
+            f"Classified locally with confidence {confidence:.2f}."
+        ),
+        red_flags=red_flags,
+        years_gap=years_gap,
+        title_alignment=(
+            alignment[abs(level_gap)]
+            if abs(level_gap) < len(alignment)
+            else "significant-mismatch"
+        ),
+    )
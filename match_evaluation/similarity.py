@@ -0,0 +1,100 @@
+import zlib
+from typing import List, Optional, Tuple
+import numpy as np
+from skill_taxonomy.taxonomy import (
+    SkillTaxonomy,
+    get_domain_taxonomy,
+    normalize_skill_name,
+)
+from match_evaluation.evaluation_consts import NGRAM_SIZES, NGRAM_DIMENSIONS
+
+
+def char_ngrams(text: str) -> List[str]:
+    padded = f" {normalize_skill_name(text)} "
+    return [padded[i : i + n] for n in NGRAM_SIZES for i in range(len(padded) - n + 1)]
+
+
+def ngram_vectors(texts: List[str], dimensions=NGRAM_DIMENSIONS) -> np.ndarray:
+    """
+    Hashed character n-gram TF-IDF vectors, one L2-normalized row per text.
+
+    crc32 keeps the hashing stable across processes. The IDF is computed
+    over the given texts, so frequent fragments such as " data" weigh less.
+    """
+    counts = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for gram in char_ngrams(text):
+            counts[row, zlib.crc32(gram.encode("utf-8")) % dimensions] += 1
+    tf = np.log1p(counts)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    vectors = tf * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def similarity_matrix(left: List[str], right: List[str]) -> np.ndarray:
+    """Cosine similarity of every left x right pair in one matrix product."""
+    if not left or not right:
+        return np.zeros((len(left), len(right)), dtype=np.float32)
+    vectors = ngram_vectors(left + right)
+    return vectors[: len(left)] @ vectors[len(left) :].T
+
+
+def best_matches(
+    left: List[str], right: List[str], threshold: float
+) -> List[Tuple[str, str, float]]:
+    """Most similar right item for each left item scoring at least threshold."""
+    matrix = similarity_matrix(left, right)
+    if matrix.size == 0:
+        return []
+    best = matrix.argmax(axis=1)
+    scores = matrix[np.arange(len(left)), best]
+    return [
+        (left[i], right[best[i]], float(scores[i]))
+        for i in np.flatnonzero(scores >= threshold)
+    ]
+
+
+def taxonomy_relation(left: str, right: str, taxonomy: SkillTaxonomy) -> Optional[str]:
+    """How two names relate through the taxonomy, None if they do not."""
+    left_id, right_id = taxonomy.resolve(left), taxonomy.resolve(right)
+    if left_id is None or right_id is None:
+        return None
+    if left_id == right_id:
+        return "same"
+    left_ancestors = taxonomy.ancestors(left_id)
+    right_ancestors = taxonomy.ancestors(right_id)
+    if right_id in left_ancestors or left_id in right_ancestors:
+        return "related"
+    # Sharing only a root category ("Industries") says nothing
+    shared = [a for a in left_ancestors & right_ancestors if taxonomy.parents(a)]
+    if shared:
+        return f"both {taxonomy.name(shared[0])}"
+    return None
+
+
+def related_pairs(
+    required: List[str],
+    candidate: List[str],
+    threshold: float,
+    taxonomy: Optional[SkillTaxonomy] = None,
+) -> List[str]:
+    """
+    Required items with a related candidate item, as readable hints.
+    Relations come from the domain taxonomy unless another one is given.
+    """
+    taxonomy = taxonomy or get_domain_taxonomy()
+    pairs = []
+    matched = set()
+    for left in required:
+        for right in candidate:
+            relation = taxonomy_relation(left, right, taxonomy)
+            if relation:
+                pairs.append(f"{left} ~ {right} ({relation})")
+                matched.add(left)
+                break
+    unmatched = [r for r in required if r not in matched]
+    for left, right, score in best_matches(unmatched, candidate, threshold):
+        pairs.append(f"{left} ~ {right} (name similarity {score:.2f})")
+    return pairs
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from skill_taxonomy.taxonomy import get_taxonomy, normalize_skill_name
+from match_evaluation.evaluation_consts import PARTIAL_SKILL_CREDIT, BONUS_SKILL_SHARE
+from match_evaluation.output_schemas import SkillsMatchResult
+
+EXACT = "exact"
+PARTIAL = "partial"
+
+
+@dataclass
+class SkillMatch:
+    skill: str
+    kind: Optional[str] = None
+    candidate_skill: Optional[str] = None
+
+    def describe(self) -> str:
+        return f"{self.skill} → {self.candidate_skill}"
+
+
+class CandidateSkills:
+    """Index of the skills a CV mentions, by taxonomy id and normalized name."""
+
+    def __init__(self, names: Iterable[str], skill_ids: Dict[str, int] = None):
+        self.taxonomy = get_taxonomy()
+        self.skill_ids = skill_ids or {}
+        self.names: Dict[str, str] = {}
+        self.by_id: Dict[int, str] = {}
+        self.by_ancestor: Dict[int, str] = {}
+        for name in names:
+            key = normalize_skill_name(name)
+            if not key:
+                continue
+            self.names.setdefault(key, name)
+            skill_id = self.resolve(name)
+            if skill_id is not None:
+                self.by_id.setdefault(skill_id, name)
+                for ancestor in self.taxonomy.ancestors(skill_id):
+                    self.by_ancestor.setdefault(ancestor, name)
+        self.tokens = {key: set(key.split()) for key in self.names}
+
+    @classmethod
+    def from_cv(cls, cv, skill_ids: Dict[str, int] = None) -> "CandidateSkills":
+        """Skills section plus the technologies of every role."""
+        names = [s.name for s in cv.technical_skills]
+        for exp in cv.experience:
+            names.extend(exp.technologies)
+        return cls(names, skill_ids)
+
+    def resolve(self, name: str) -> Optional[int]:
+        if name in self.skill_ids:
+            return self.skill_ids[name]
+        return self.taxonomy.resolve(name)
+
+    def _known_unrelated(self, skill_id: Optional[int], cv_key: str) -> bool:
+        """Both are known skills and neither is filed under the other."""
+        cv_id = self.resolve(self.names[cv_key])
+        if skill_id is None or cv_id is None:
+            return False
+        related = self.taxonomy.ancestors(cv_id) | self.taxonomy.ancestors(skill_id)
+        return skill_id not in related and cv_id not in related
+
+    def match(self, skill: str) -> SkillMatch:
+        key = normalize_skill_name(skill)
+        if not key:
+            return SkillMatch(skill)
+        if key in self.names:
+            return SkillMatch(skill, EXACT, self.names[key])
+        skill_id = self.resolve(skill)
+        tokens = set(key.split())
+        if skill_id in self.by_id:
+            if self.taxonomy.aliases.get(key) == skill_id:
+                return SkillMatch(skill, EXACT, self.by_id[skill_id])
+            # "Java EE" only resolves to Java inside a longer name, a CV has
+            # the specialization when one of its names says it too
+            for cv_key, cv_tokens in self.tokens.items():
+                if tokens <= cv_tokens and self.resolve(self.names[cv_key]) == skill_id:
+                    return SkillMatch(skill, EXACT, self.names[cv_key])
+            return SkillMatch(skill, PARTIAL, self.by_id[skill_id])
+
+        # "AWS" is covered by "AWS Lambda", the taxonomy files one under the
+        # other. Shared words alone are not enough: "C" and "Objective C"
+        if skill_id is not None:
+            for cv_key, cv_tokens in self.tokens.items():
+                cv_id = self.resolve(self.names[cv_key])
+                if (
+                    tokens <= cv_tokens
+                    and cv_id is not None
+                    and skill_id in self.taxonomy.ancestors(cv_id)
+                ):
+                    return SkillMatch(skill, EXACT, self.names[cv_key])
+            # "SQL" is related to "PostgreSQL"
+            if skill_id in self.by_ancestor:
+                return SkillMatch(skill, PARTIAL, self.by_ancestor[skill_id])
+            # "PyTorch" is related to "Deep Learning"
+            for ancestor in self.taxonomy.ancestors(skill_id):
+                if ancestor in self.by_id:
+                    return SkillMatch(skill, PARTIAL, self.by_id[ancestor])
+        # Shared words hint at a relation the taxonomy does not know, "AWS
+        # Lambda" is only partly covered by "AWS"
+        for cv_key, cv_tokens in self.tokens.items():
+            if (tokens <= cv_tokens or cv_tokens < tokens) and not (
+                self._known_unrelated(skill_id, cv_key)
+            ):
+                return SkillMatch(skill, PARTIAL, self.names[cv_key])
+        return SkillMatch(skill)
+
+
+def match_skills(
+    skills: List[str], candidate: CandidateSkills
+) -> Tuple[List[SkillMatch], List[str]]:
+    """Resolve skills locally, return the matches and the unresolved names."""
+    resolved, unresolved = [], []
+    for skill in skills:
+        match = candidate.match(skill)
+        if match.kind:
+            resolved.append(match)
+        else:
+            unresolved.append(skill)
+    return resolved, unresolved
+
+
+def score_skills(
+    required: List[str],
+    nice_to_have: List[str],
+    matched: List[str],
+    partial: List[str],
+    bonus: List[str],
+) -> float:
+    if required:
+        coverage = (len(matched) + PARTIAL_SKILL_CREDIT * len(partial)) / len(required)
+    else:
+        coverage = 1.0
+    if not nice_to_have:
+        return round(100 * coverage, 1)
+    bonus_ratio = len(bonus) / len(nice_to_have)
+    return round(
+        100 * ((1 - BONUS_SKILL_SHARE) * coverage + BONUS_SKILL_SHARE * bonus_ratio), 1
+    )
+
+
+def build_skills_result(
+    required: List[str],
+    nice_to_have: List[str],
+    matched: List[str],
+    partial: List[str],
+    bonus: List[str],
+    notes: str = "",
+) -> SkillsMatchResult:
+    """Assemble SkillsMatchResult from resolved items, anything else is missing."""
+    partial_names = {p.split(" → ")[0] for p in partial}
+    missing = [s for s in required if s not in matched and s not in partial_names]
+    score = score_skills(
+        required,
+        nice_to_have,
+        matched,
+        [s for s in required if s in partial_names],
+        bonus,
+    )
+    reasoning = (
+        f"{len(matched)} of {len(required)} required skills matched, "
+        f"{len(partial)} related, {len(missing)} missing; "
+        f"{len(bonus)} of {len(nice_to_have)} nice-to-have skills present."
+    )
+    if notes:
+        reasoning = f"{reasoning} {notes}"
+    return SkillsMatchResult(
+        score=score,
+        matched_items=matched,
+        missing_items=missing,
+        partial_matches=partial,
+        bonus_items=bonus,
+        reasoning=reasoning,
+        red_flags=[f"Missing required skill: {s}" for s in missing],
+    )
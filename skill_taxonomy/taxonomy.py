@@ -0,0 +1,177 @@
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from consts import (
+    DOMAIN_TAXONOMY_PATH,
+    SKILL_TAXONOMY_PATH,
+    SKILL_TAXONOMY_EXTRA_PATHS,
+)
+
+VERSION_TOKEN = re.compile(r"^v?\d+(\.\d+)*(\.x)?\+?$")
+TRIE_END = ""
+
+
+def normalize_skill_name(name: str) -> str:
+    """Lowercase a skill name and drop versions, qualifiers and .js suffixes."""
+    text = re.sub(r"\(.*?\)", " ", name.lower())
+    text = re.sub(r"[^a-z0-9+#./\- ]+", " ", text)
+    tokens = []
+    for token in text.split():
+        token = token.strip(".-")
+        if not token or VERSION_TOKEN.match(token):
+            continue
+        if len(token) > 4 and token.endswith(".js"):
+            token = token[:-3]
+        elif len(token) > 4 and token.endswith("js"):
+            token = token[:-2]
+        tokens.append(token)
+    return " ".join(tokens)
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with aliases and parent categories.
+
+    Every skill gets a small integer id in load order, so profiles can be
+    compared with set operations. Aliases live in a hash map for whole-name
+    lookups and in a token trie for finding skills inside longer strings.
+    Loading another file with an existing id extends that skill. The same
+    structure holds the separate industry and domain taxonomy.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.parent_ids: List[List[str]] = []
+        self.index: Dict[str, int] = {}
+        self.aliases: Dict[str, int] = {}
+        self.trie: dict = {}
+        self._resolved: Dict[str, Optional[int]] = {}
+        self._ancestors: Dict[int, FrozenSet[int]] = {}
+
+    def load(self, path) -> "SkillTaxonomy":
+        for entry in json.loads(Path(path).read_text(encoding="utf-8")):
+            self.add(entry)
+        return self
+
+    def add(self, entry: dict) -> int:
+        skill_id = self.index.get(entry["id"])
+        if skill_id is None:
+            skill_id = len(self.ids)
+            self.ids.append(entry["id"])
+            self.names.append(entry.get("name", entry["id"]))
+            self.parent_ids.append([])
+            self.index[entry["id"]] = skill_id
+        for parent in entry.get("parents", []):
+            if parent not in self.parent_ids[skill_id]:
+                self.parent_ids[skill_id].append(parent)
+        for alias in [entry["id"], self.names[skill_id], *entry.get("aliases", [])]:
+            self._index_alias(alias, skill_id)
+        self._resolved.clear()
+        self._ancestors.clear()
+        return skill_id
+
+    def _index_alias(self, alias: str, skill_id: int):
+        key = normalize_skill_name(alias)
+        if not key:
+            return
+        self.aliases.setdefault(key, skill_id)
+        node = self.trie
+        for token in key.split():
+            node = node.setdefault(token, {})
+        node.setdefault(TRIE_END, skill_id)
+
+    def find_all(self, text: str) -> List[int]:
+        """Skill ids mentioned in a text, longest alias wins at each position."""
+        tokens = normalize_skill_name(text).split()
+        found = []
+        position = 0
+        while position < len(tokens):
+            node, match, match_end = self.trie, None, position
+            for end in range(position, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if TRIE_END in node:
+                    match, match_end = node[TRIE_END], end + 1
+            if match is None:
+                position += 1
+                continue
+            if match not in found:
+                found.append(match)
+            position = match_end
+        return found
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Canonical id of a skill name, None if unknown or ambiguous."""
+        if name in self._resolved:
+            return self._resolved[name]
+        key = normalize_skill_name(name)
+        skill_id = self.aliases.get(key)
+        if skill_id is None and key:
+            # "Python scripting", "AWS Lambda functions"
+            found = self.find_all(key)
+            skill_id = found[0] if len(found) == 1 else None
+        self._resolved[name] = skill_id
+        return skill_id
+
+    def annotate(self, names: Iterable[str]) -> Dict[str, int]:
+        ids = {}
+        for name in names:
+            skill_id = self.resolve(name)
+            if skill_id is not None:
+                ids[name] = skill_id
+        return ids
+
+    def parents(self, skill_id: int) -> List[int]:
+        return [self.index[p] for p in self.parent_ids[skill_id] if p in self.index]
+
+    def ancestors(self, skill_id: int) -> FrozenSet[int]:
+        if skill_id not in self._ancestors:
+            found, stack = set(), self.parents(skill_id)
+            while stack:
+                parent = stack.pop()
+                if parent not in found:
+                    found.add(parent)
+                    stack.extend(self.parents(parent))
+            self._ancestors[skill_id] = frozenset(found)
+        return self._ancestors[skill_id]
+
+    def name(self, skill_id: int) -> str:
+        return self.names[skill_id]
+
+    def key(self, name: str) -> str:
+        """Canonical id for known skills, the normalized name otherwise."""
+        skill_id = self.resolve(name)
+        return (
+            self.ids[skill_id] if skill_id is not None else normalize_skill_name(name)
+        )
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            taxonomy = SkillTaxonomy().load(SKILL_TAXONOMY_PATH)
+            for path in SKILL_TAXONOMY_EXTRA_PATHS:
+                taxonomy.load(path)
+            _taxonomy = taxonomy
+    return _taxonomy
+
+
+_domain_taxonomy: Optional[SkillTaxonomy] = None
+
+
+def get_domain_taxonomy() -> SkillTaxonomy:
+    global _domain_taxonomy
+    with _taxonomy_lock:
+        if _domain_taxonomy is None:
+            _domain_taxonomy = SkillTaxonomy().load(DOMAIN_TAXONOMY_PATH)
+    return _domain_taxonomy
@@ -0,0 +1,148 @@
+import asyncio
+import time
+import typing
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+import llm_hedging
+import llm_limiter
+from extracting_data.description_schemas import (
+    CVDescription,
+    CVExperience,
+    JobDescription,
+    Skill,
+)
+from llm_limiter import LLMLimiter
+from match_evaluation.agent_state import AgentState
+from match_evaluation.dimension_registry import DIMENSIONS, arun_step
+from match_evaluation.evaluation_graph import (
+    arun_evaluation_flow,
+    build_evaluation_graph,
+)
+
+LIMIT = 2
+
+
+def sample(annotation, field=None):
+    """Smallest valid value of a field type, weights get 0.5."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        return sample(next(a for a in args if a is not type(None)), field)
+    if origin is list:
+        return []
+    if origin is dict:
+        return {}
+    if origin is typing.Literal:
+        return args[0]
+    if annotation is float:
+        bounded = field and any(getattr(m, "le", None) == 1 for m in field.metadata)
+        return 0.5 if bounded else 50.0
+    return {str: "ok", int: 1, bool: True}[annotation]
+
+
+class FakeLLM:
+    """Answers every structured request with a valid minimal result after delay."""
+
+    model_name = "fake"
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.schemas = []
+        self.active = 0
+        self.peak = 0
+
+    def with_structured_output(self, schema, **options):
+        return FakeStructured(self, schema)
+
+    async def respond(self, schema):
+        self.schemas.append(schema.__name__ if schema else "text")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if schema is None:
+            return AIMessage(content="ok")
+        return schema(
+            **{
+                name: sample(field.annotation, field)
+                for name, field in schema.model_fields.items()
+            }
+        )
+
+    async def ainvoke(self, prompt, *args, **kwargs):
+        return await self.respond(None)
+
+    def invoke(self, prompt, *args, **kwargs):
+        raise AssertionError("the async graph must not make blocking calls")
+
+
+class FakeStructured:
+    def __init__(self, llm, schema):
+        self.llm, self.schema = llm, schema
+
+    async def ainvoke(self, prompt, *args, **kwargs):
+        return await self.llm.respond(self.schema)
+
+    def invoke(self, prompt, *args, **kwargs):
+        raise AssertionError("the async graph must not make blocking calls")
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    limiter = LLMLimiter(LIMIT)
+    monkeypatch.setattr(llm_limiter, "_limiter", limiter)
+    monkeypatch.setattr(llm_hedging, "_hedger", None)
+    return limiter
+
+
+def make_state(**fields):
+    cv = CVDescription(
+        current_title="Senior Data Engineer",
+        technical_skills=[Skill(name="Python"), Skill(name="SQL")],
+        experience=[
+            CVExperience(
+                title="Senior Data Engineer",
+                start_date="Jan 2019",
+                end_date="Present",
+                technologies=["Python", "AWS"],
+            )
+        ],
+    )
+    job = JobDescription(
+        job_title="Data Engineer",
+        required_technical_skills=[Skill(name="Python"), Skill(name="Terraform")],
+        critical_keywords=["Python", "Terraform"],
+    )
+    return AgentState(cv=cv, job=job, cv_description_text="Python, SQL", **fields)
+
+
+def test_async_graph_runs_every_dimension_within_the_limit(limiter):
+    llm = FakeLLM(delay=0.02)
+    graph = build_evaluation_graph(llm, asynchronous=True, use_cache=False)
+
+    state = asyncio.run(arun_evaluation_flow(make_state(), llm, graph))
+
+    assert all(state[name] is not None for name in DIMENSIONS)
+    assert state["weighting_strategy"] is not None
+    assert state["final_scoring"] is not None
+    assert "FinalScoringResult" in llm.schemas
+    assert 1 < llm.peak <= LIMIT
+    assert limiter.in_flight == 0
+
+
+def test_arun_step_gives_up_at_the_deadline_and_frees_its_slot(limiter):
+    llm = FakeLLM(delay=5)
+    step = DIMENSIONS["domain_match"]
+    state = make_state(deadline=time.time() + step.time_reserve + 0.1)
+
+    start = time.perf_counter()
+    update = asyncio.run(arun_step(state, llm, step))
+
+    assert update == {"skipped_dimensions": ["domain_match"]}
+    assert time.perf_counter() - start < 1
+    assert limiter.in_flight == 0
@@ -0,0 +1,158 @@
+import struct
+import threading
+from pathlib import Path
+
+import pytest
+
+from extracting_data import document_readers
+from extracting_data.document_readers import (
+    DOC,
+    read_doc_ole,
+    read_document,
+    register_reader,
+    sniff_content_type,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SECTOR = 512
+END_OF_CHAIN = 0xFFFFFFFE
+FREE = 0xFFFFFFFF
+NO_STREAM = 0xFFFFFFFF
+# A stream at least this long is stored in regular sectors, not the mini stream
+MIN_REGULAR_STREAM = 4096
+TEXT_OFFSET = 1024
+
+COMPRESSED_TEXT = "Jane Doe\rSenior Engineer – Python\x07SQL\r"
+UNICODE_TEXT = 'Zürich, Łódź, 東京\r\x13 HYPERLINK "x" \x14' "portfolio\x15\r"
+
+
+def word_document(pieces):
+    """
+    WordDocument stream and 1Table stream with a piece table over pieces,
+    given as (text, compressed) pairs.
+    """
+    stream = bytearray(TEXT_OFFSET)
+    struct.pack_into("<HH", stream, 0, 0xA5EC, 0x00C1)
+    struct.pack_into("<H", stream, 0x0A, 0x0200)  # fWhichTblStm: 1Table
+    offset = 32
+    struct.pack_into("<H", stream, offset, 14)  # csw, then fibRgW
+    offset += 2 + 14 * 2
+    struct.pack_into("<H", stream, offset, 22)  # cslw, then fibRgLw
+    offset += 2 + 22 * 4
+    struct.pack_into("<H", stream, offset, 93)  # cbRgFcLcb
+    fc_lcb_clx = offset + 2 + 33 * 8
+
+    cps, descriptors = [0], []
+    for text, compressed in pieces:
+        fc = len(stream)
+        if compressed:
+            stream += text.encode("cp1252")
+            fc = (fc * 2) | 0x40000000
+        else:
+            stream += text.encode("utf-16-le")
+        cps.append(cps[-1] + len(text))
+        descriptors.append(struct.pack("<HIH", 0, fc, 0))
+    plc_pcd = struct.pack(f"<{len(cps)}I", *cps) + b"".join(descriptors)
+    # One Prc (formatting) entry before the Pcdt, the reader must skip it
+    clx = b"\x01" + struct.pack("<H", 2) + b"\x00\x00"
+    clx += b"\x02" + struct.pack("<I", len(plc_pcd)) + plc_pcd
+    struct.pack_into("<II", stream, fc_lcb_clx, 0, len(clx))
+    return bytes(stream), clx
+
+
+def directory_entry(name, kind, child, left, start, size):
+    encoded = name.encode("utf-16-le") + b"\x00\x00" if name else b""
+    return (
+        encoded.ljust(64, b"\x00")
+        + struct.pack("<HBBIII", len(encoded), kind, 1, left, NO_STREAM, child)
+        + bytes(16 + 4 + 16)
+        + struct.pack("<IQ", start, size)
+    )
+
+
+def compound_file(streams):
+    """Minimal version 3 compound file holding streams, a {name: bytes} dict."""
+    streams = {
+        name: data.ljust(max(len(data), MIN_REGULAR_STREAM), b"\x00")
+        for name, data in streams.items()
+    }
+    fat = [0xFFFFFFFD, END_OF_CHAIN]  # sector 0: FAT, sector 1: directory
+    body = b""
+    starts = {}
+    for name, data in streams.items():
+        data = data.ljust(-(-len(data) // SECTOR) * SECTOR, b"\x00")
+        first = len(fat)
+        count = len(data) // SECTOR
+        fat += list(range(first + 1, first + count)) + [END_OF_CHAIN]
+        starts[name] = first
+        body += data
+    assert len(fat) <= SECTOR // 4
+
+    names = list(streams)  # ["WordDocument", "1Table"], 1Table sorts first
+    entries = directory_entry("Root Entry", 5, 1, NO_STREAM, END_OF_CHAIN, 0)
+    entries += directory_entry(
+        names[0], 2, NO_STREAM, 2, starts[names[0]], len(streams[names[0]])
+    )
+    entries += directory_entry(
+        names[1], 2, NO_STREAM, NO_STREAM, starts[names[1]], len(streams[names[1]])
+    )
+    entries += directory_entry("", 0, NO_STREAM, NO_STREAM, 0, 0)
+
+    header = document_readers.OLE_MAGIC + bytes(16)
+    header += struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6) + bytes(6)
+    header += struct.pack(
+        "<IIIIIIIII", 0, 1, 1, 0, 4096, END_OF_CHAIN, 0, END_OF_CHAIN, 0
+    )
+    header += struct.pack("<109I", 0, *[FREE] * 108)
+    fat_sector = struct.pack(
+        f"<{SECTOR // 4}I", *fat, *[FREE] * (SECTOR // 4 - len(fat))
+    )
+    return header + fat_sector + entries + body
+
+
+def make_doc(path, pieces):
+    stream, table = word_document(pieces)
+    path.write_bytes(compound_file({"WordDocument": stream, "1Table": table}))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "pieces, expected",
+    [
+        (
+            [(COMPRESSED_TEXT, True)],
+            "Jane Doe\nSenior Engineer – Python\tSQL\n",
+        ),
+        (
+            [(UNICODE_TEXT, False)],
+            "Zürich, Łódź, 東京\nportfolio\n",
+        ),
+    ],
+    ids=["compressed", "unicode"],
+)
+def test_read_doc_ole_piece_types(tmp_path, pieces, expected):
+    assert read_doc_ole(make_doc(tmp_path / "cv.doc", pieces)) == expected
+
+
+def test_mixed_pieces_fixture():
+    # Written by make_doc with a compressed piece followed by a Unicode piece
+    path = str(FIXTURES / "mixed_pieces.doc")
+    assert sniff_content_type(path) == DOC
+    assert read_document(path) == (
+        "Jane Doe\nSenior Engineer – Python\tSQL\n" "Zürich, Łódź, 東京\nportfolio\n"
+    )
+
+
+def test_shelling_out_readers_run_on_the_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(document_readers, "READERS", dict(document_readers.READERS))
+    threads = []
+
+    def converter(path):
+        threads.append(threading.current_thread().name)
+        return "converted"
+
+    register_reader("text", converter, shells_out=True)
+    path = tmp_path / "notes.txt"
+    path.write_text("plain text")
+    assert read_document(str(path)) == "converted"
+    assert threads[0].startswith("document-reader")
@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+
+from extracting_data.description_schemas import CVExperience
+from match_evaluation.experience_timeline import (
+    ExperienceTimeline,
+    merge_intervals,
+    month_index,
+    parse_date,
+    parse_period,
+)
+
+TODAY = date(2026, 10, 18)
+
+
+def month(year, number):
+    return month_index(year, number)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Jan 2020", month(2020, 1)),
+        ("September 2018", month(2018, 9)),
+        ("Sept. 2018", month(2018, 9)),
+        ("June 15, 2020", month(2020, 6)),
+        ("3rd March 2021", month(2021, 3)),
+        ("Dec '19", month(2019, 12)),
+        ("Summer 2017", month(2017, 6)),
+        ("2019-04", month(2019, 4)),
+        ("04/2019", month(2019, 4)),
+        ("2015", month(2015, 1)),
+        ("Present", month(2026, 10)),
+        ("currently employed", month(2026, 10)),
+        # Words that only start like a month name are not months
+        ("marketing 2019", month(2019, 1)),
+        ("Decathlon 2019", month(2019, 1)),
+        ("Junior developer 2021", month(2021, 1)),
+        # "now" and "current" only as whole words
+        ("Nowhere Inc 2018", month(2018, 1)),
+        ("not a date", None),
+        (None, None),
+    ],
+)
+def test_parse_date(text, expected):
+    assert parse_date(text, today=TODAY) == expected
+
+
+def test_bare_year_ends_in_december():
+    assert parse_date("2019", is_end=True, today=TODAY) == month(2019, 12)
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        ("Jan 2020", "Mar 2021", (month(2020, 1), month(2021, 4))),
+        ("2018 - 2019", None, (month(2018, 1), month(2020, 1))),
+        ("May 2016 – Present", None, (month(2016, 5), month(2026, 11))),
+        ("Jan 2024", None, (month(2024, 1), month(2026, 11))),
+        ("Mar 2025", "Dec 2030", (month(2025, 3), month(2026, 11))),
+        ("2021", "2019", None),
+        ("unknown", "2019", None),
+    ],
+)
+def test_parse_period(start, end, expected):
+    assert parse_period(start, end, today=TODAY) == expected
+
+
+def test_merge_intervals():
+    assert merge_intervals([(5, 9), (0, 3), (3, 4), (8, 12), (20, 22)]) == [
+        (0, 4),
+        (5, 12),
+        (20, 22),
+    ]
+
+
+def test_overlapping_roles_are_counted_once():
+    timeline = ExperienceTimeline(
+        [
+            CVExperience(
+                title="Senior Engineer",
+                start_date="Jan 2022",
+                end_date="Present",
+                technologies=["Python", "AWS"],
+            ),
+            CVExperience(
+                title="Consultant",
+                start_date="Jun 2021",
+                end_date="Jun 2023",
+                technologies=["Python"],
+            ),
+            CVExperience(
+                title="Engineer",
+                start_date="2016",
+                end_date="2019",
+                technologies=["Java"],
+            ),
+            CVExperience(title="Freelancer", start_date="sometime"),
+        ],
+        today=TODAY,
+    )
+    # Jun 2021 - Oct 2026 (65 months) plus 2016 - 2019 (48 months)
+    assert timeline.total_months == 65 + 48
+    assert timeline.most_recent_role.title == "Senior Engineer"
+    assert timeline.undated == ["Freelancer"]
+    assert timeline.years_with("Python") == round(65 / 12, 1)
+    assert timeline.months_since_last_used("Python") == 0
+    assert timeline.months_since_last_used("Java") == month(2026, 10) - month(2019, 12)
+    assert timeline.months_since_last_used("Rust") is None
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from extracting_data.html_content import extract_main_content
+
+BODY = (
+    "<p>We are looking for a backend engineer to build payment services, "
+    "APIs and data pipelines for our growing platform.</p>"
+    "<ul><li>Five years of Python, Django and PostgreSQL experience</li>"
+    "<li>Experience running services on AWS, Docker and Kubernetes</li></ul>"
+)
+
+
+def page(head="", body=""):
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def json_ld(payload):
+    return f'<script type="application/ld+json">{json.dumps(payload)}</script>'
+
+
+@pytest.mark.parametrize("payload", ["hello", 42, None, ["a", 1], {"@graph": "x"}])
+def test_json_ld_without_objects_falls_back_to_the_page(payload):
+    html = page(json_ld(payload), f"<main>{BODY}</main>")
+    assert "payment services" in extract_main_content(html)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"@type": ["JobPosting", "Thing"], "title": "Backend Engineer"},
+        {"@graph": [{"@type": "Organization"}, {"@type": "JobPosting"}]},
+        [{"@type": "JobPosting", "title": "Backend Engineer"}],
+    ],
+)
+def test_json_ld_job_posting_is_used(payload):
+    items = payload if isinstance(payload, list) else payload.get("@graph", [payload])
+    items[-1]["description"] = "<p>Build the payment APIs.</p>"
+    html = page(json_ld(payload), "<main><p>Unrelated page text</p></main>")
+    assert "Build the payment APIs." in extract_main_content(html)
+
+
+def test_article_header_keeps_the_job_title():
+    html = page(
+        body=(
+            "<header><a href='/'>Acme jobs</a> Sign in</header>"
+            "<article><header><h1>Senior Backend Engineer</h1></header>"
+            f"{BODY}</article>"
+        )
+    )
+    text = extract_main_content(html)
+    assert "Senior Backend Engineer" in text
+    assert "Sign in" not in text
+
+
+def test_banner_header_is_removed_inside_main():
+    html = page(
+        body=(
+            "<main><header role='banner'>Acme careers portal</header>"
+            f"<section>{BODY}</section></main>"
+        )
+    )
+    text = extract_main_content(html)
+    assert "payment services" in text
+    assert "careers portal" not in text
@@ -0,0 +1,45 @@
+import pytest
+
+from match_evaluation.keyword_matching import KeywordAutomaton, local_keyword_match
+
+
+def count(keyword, text):
+    return KeywordAutomaton([keyword]).count(text)[keyword]
+
+
+@pytest.mark.parametrize(
+    "keyword, text, expected",
+    [
+        ("Go", "Backend services in Go and GO", 2),
+        ("Go", "My go-to tool, ready to go", 0),
+        ("R", "Statistics in R, R-based reports and R&D work", 1),
+        ("C", "C, C++ and C#", 1),
+        ("AWS", "Deployed on AWS", 1),
+        ("AWS", "jaws of aws", 0),
+        ("ML", "5 ml of solution", 0),
+        ("machine learning", "Machine Learning and ML models", 2),
+    ],
+)
+def test_short_and_all_caps_keywords(keyword, text, expected):
+    assert count(keyword, text) == expected
+
+
+@pytest.mark.parametrize(
+    "keyword, text, expected",
+    [
+        ("Kubernetes", "kubernetes, KUBERNETES", 2),
+        ("REST APIs", "Designed a REST API and rest-apis", 2),
+        ("data pipeline", "Built data pipelines", 1),
+        ("JavaScript", "JS and javascript", 2),
+        ("C++", "Modern C++ code", 1),
+    ],
+)
+def test_longer_keywords_ignore_case(keyword, text, expected):
+    assert count(keyword, text) == expected
+
+
+def test_local_keyword_match():
+    result = local_keyword_match(["Go", "Python", "R"], "Python and Go, R&D team")
+    assert result.matched_keywords == ["Go", "Python"]
+    assert result.missing_keywords == ["R"]
+    assert result.keyword_frequency == {"Go": 1, "Python": 1}
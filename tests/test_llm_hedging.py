@@ -0,0 +1,146 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+import llm_limiter
+from llm_hedging import HedgeBudget, LLMHedger
+from llm_limiter import LLMLimiter
+
+KEY = "skills_match"
+FAST = 0.01
+STALL = 1.0
+
+
+class StallingLLM:
+    """
+    Fake LLM answering with the number of its call. delays[i] is the latency
+    of call i; past the list, calls stall at random with stall_probability.
+    """
+
+    def __init__(self, delays=(), stall_probability=0.0, seed=0):
+        self.delays = list(delays)
+        self.stall_probability = stall_probability
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.cancelled = []
+        self.finished = []
+        self._lock = threading.Lock()
+
+    def _next(self):
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+            if call < len(self.delays):
+                return call, self.delays[call]
+            stalled = self.rng.random() < self.stall_probability
+            return call, STALL if stalled else FAST
+
+    def invoke(self, prompt):
+        call, delay = self._next()
+        time.sleep(delay)
+        self.finished.append(call)
+        return call
+
+    async def ainvoke(self, prompt):
+        call, delay = self._next()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(call)
+            raise
+        self.finished.append(call)
+        return call
+
+
+class FailingLLM:
+    def invoke(self, prompt):
+        raise ValueError("provider error")
+
+    async def ainvoke(self, prompt):
+        raise ValueError("provider error")
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    limiter = LLMLimiter(4)
+    monkeypatch.setattr(llm_limiter, "_limiter", limiter)
+    return limiter
+
+
+def warm_hedger(budget=1.0, samples=20):
+    hedger = LLMHedger(percentile=0.95, budget=budget, min_samples=samples)
+    for _ in range(samples):
+        hedger.latencies.record(KEY, FAST)
+    return hedger
+
+
+def test_no_hedge_before_enough_samples():
+    hedger = LLMHedger(min_samples=20)
+    llm = StallingLLM(delays=[0.05])
+    assert hedger.invoke(KEY, llm, "prompt") == 0
+    assert llm.calls == 1
+    assert hedger.budget.hedges == 0
+
+
+def test_sync_first_result_wins_and_loser_frees_its_slot(limiter):
+    hedger = warm_hedger()
+    llm = StallingLLM(delays=[STALL, FAST])
+
+    start = time.perf_counter()
+    assert hedger.invoke(KEY, llm, "prompt") == 1
+    assert time.perf_counter() - start < STALL / 2
+    assert hedger.budget.hedges == 1
+    # The stalled call is still running, but no longer holds a slot
+    assert llm.finished == [1]
+    assert limiter.in_flight == 0
+
+
+def test_async_first_result_wins_and_loser_is_cancelled(limiter):
+    hedger = warm_hedger()
+    llm = StallingLLM(delays=[STALL, FAST])
+
+    async def run():
+        start = time.perf_counter()
+        result = await hedger.ainvoke(KEY, llm, "prompt")
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(run())
+    assert result == 1
+    assert elapsed < STALL / 2
+    assert llm.cancelled == [0]
+    assert limiter.in_flight == 0
+
+
+def test_budget_caps_hedges_under_random_stalls():
+    hedger = warm_hedger(budget=0.1, samples=50)
+    llm = StallingLLM(stall_probability=0.5, seed=3)
+
+    async def run():
+        await asyncio.gather(*(hedger.ainvoke(KEY, llm, "prompt") for _ in range(40)))
+
+    asyncio.run(run())
+    assert hedger.budget.requests == 40
+    assert 0 < hedger.budget.hedges <= 0.1 * 40
+    # A hedge still queued for a slot when its original answers is never sent
+    assert llm.calls <= 40 + hedger.budget.hedges
+
+
+def test_hedge_budget_ratio():
+    budget = HedgeBudget(0.25)
+    for _ in range(8):
+        budget.count_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_failed_attempts_are_recorded_on_both_paths(asynchronous):
+    hedger = LLMHedger(min_samples=20)
+    with pytest.raises(ValueError):
+        if asynchronous:
+            asyncio.run(hedger.ainvoke(KEY, FailingLLM(), "prompt"))
+        else:
+            hedger.invoke(KEY, FailingLLM(), "prompt")
+    assert len(hedger.latencies._samples[KEY]) == 1
@@ -0,0 +1,80 @@
+import threading
+
+from extracting_data import profile_extraction
+from extracting_data.description_schemas import (
+    CVEducationSection,
+    CVExperience,
+    CVExperienceSection,
+    CVHeaderSection,
+    CVProjectsSection,
+    CVSkillsSection,
+    Skill,
+)
+from extracting_data.profile_extraction import cv_section_spans, extract_cv_by_sections
+
+CV_TEXT = """Jane Doe
+Data engineer
+
+Work Experience
+Senior Data Engineer, Acme, 2020 – Present
+
+Skills
+Python, SQL
+
+Education
+BSc Computer Science
+
+Certifications
+AWS Solutions Architect"""
+
+
+def test_spans_follow_the_section_headers():
+    spans = cv_section_spans(CV_TEXT)
+    assert spans[CVExperienceSection] == (
+        "Work Experience\nSenior Data Engineer, Acme, 2020 – Present"
+    )
+    assert spans[CVEducationSection] == (
+        "Education\nBSc Computer Science\n\nCertifications\nAWS Solutions Architect"
+    )
+    # Header and skills read the whole CV, projects need their own section
+    assert spans[CVHeaderSection] == spans[CVSkillsSection] == CV_TEXT
+    assert CVProjectsSection not in spans
+
+
+def test_spans_fall_back_to_the_whole_cv():
+    text = "Jane Doe\nSenior Data Engineer at Acme since 2020\nProjects\nETL toolkit"
+    spans = cv_section_spans(text)
+    assert spans[CVExperienceSection] == text
+    assert spans[CVEducationSection] == text
+    assert spans[CVProjectsSection] == "Projects\nETL toolkit"
+
+
+def test_sections_are_extracted_concurrently_and_merged(monkeypatch):
+    results = {
+        CVHeaderSection: CVHeaderSection(full_name="Jane Doe"),
+        CVExperienceSection: CVExperienceSection(
+            experience=[CVExperience(title="Senior Data Engineer")]
+        ),
+        CVEducationSection: CVEducationSection(
+            certifications=["AWS Solutions Architect"]
+        ),
+        CVSkillsSection: CVSkillsSection(technical_skills=[Skill(name="Python")]),
+    }
+    barrier = threading.Barrier(len(results), timeout=5)
+    seen = {}
+
+    def extract(text, schema, llm, system_instructions):
+        seen[schema] = text
+        # Fails unless every section call is running at the same time
+        barrier.wait()
+        return results[schema]
+
+    monkeypatch.setattr(profile_extraction, "trustcall_extract_text_to_schema", extract)
+    cv = extract_cv_by_sections(CV_TEXT, llm=None)
+
+    assert seen == cv_section_spans(CV_TEXT)
+    assert cv.full_name == "Jane Doe"
+    assert [e.title for e in cv.experience] == ["Senior Data Engineer"]
+    assert cv.certifications == ["AWS Solutions Architect"]
+    assert [s.name for s in cv.technical_skills] == ["Python"]
+    assert cv.projects == []
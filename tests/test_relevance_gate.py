@@ -0,0 +1,80 @@
+from langgraph.graph import END
+
+from extracting_data.description_schemas import (
+    CVDescription,
+    CVEducation,
+    JobDescription,
+    Skill,
+)
+from match_evaluation import relevance_gate as gate
+from match_evaluation.agent_state import AgentState
+from match_evaluation.relevance_gate import relevance_gate, route_relevance
+
+NODES = ["skills_match", "domain_match"]
+
+
+def skills(*names):
+    return [Skill(name=name) for name in names]
+
+
+def developer_cv():
+    return CVDescription(
+        technical_skills=skills("Python", "Django", "PostgreSQL", "Docker"),
+        domains=["Fintech"],
+        education=[CVEducation(field="Computer Science")],
+    )
+
+
+def nurse_job(**fields):
+    return JobDescription(
+        job_title="Registered Nurse",
+        required_technical_skills=skills(
+            "Patient care", "Phlebotomy", "Wound dressing", "Triage"
+        ),
+        required_domains=["Healthcare"],
+        required_education=[CVEducation(field="Nursing")],
+        **fields,
+    )
+
+
+def test_unrelated_pair_is_cut_short():
+    state = AgentState(cv=developer_cv(), job=nurse_job())
+    update = relevance_gate(state)
+
+    assert update["relevant"] is False
+    assert update["weighted_score"] == 0.0
+    assert update["decision"] == "Poor Match"
+    assert update["recommendation"].startswith("Quick relevance check only")
+    assert "No experience in the required domains: Healthcare." in (
+        update["recommendation"]
+    )
+    assert update["weaknesses"][0].startswith("Missing required skills: Patient care")
+    assert route_relevance(state.model_copy(update=update), NODES) == END
+
+
+def test_related_pair_goes_on_to_the_evaluation():
+    job = JobDescription(
+        job_title="Backend Engineer",
+        required_technical_skills=skills("Python", "SQL", "Docker", "Kubernetes"),
+        required_domains=["Healthcare"],
+    )
+    state = AgentState(cv=developer_cv(), job=job)
+    assert relevance_gate(state) == {"relevant": True}
+    assert route_relevance(state.model_copy(update={"relevant": True}), NODES) == NODES
+
+
+def test_few_required_skills_are_always_evaluated():
+    job = nurse_job()
+    job.required_technical_skills = job.required_technical_skills[:2]
+    assert relevance_gate(AgentState(cv=developer_cv(), job=job)) == {"relevant": True}
+
+
+def test_no_failed_signal_needed_when_configured(monkeypatch):
+    monkeypatch.setattr(gate, "GATE_MIN_FAILED_SIGNALS", 0)
+    job = nurse_job()
+    job.required_domains = []
+    job.required_education = []
+    update = relevance_gate(AgentState(cv=developer_cv(), job=job))
+
+    assert update["relevant"] is False
+    assert "required skills. Applying" in update["recommendation"]
@@ -0,0 +1,40 @@
+import pytest
+
+from match_evaluation.seniority_classifier import classify, local_seniority_match
+
+
+@pytest.mark.parametrize(
+    "cv_title, years, job_title, required_years",
+    [
+        ("Marketing Coordinator", 9, "Backend Engineer", 3),
+        ("Software Engineer", 4, "Data Engineer", 3),
+        ("Mid-Senior Principal Engineer", 6, "Senior Engineer", 5),
+    ],
+)
+def test_ambiguous_titles_are_left_to_the_llm(
+    cv_title, years, job_title, required_years
+):
+    assert (
+        local_seniority_match(cv_title, years, None, job_title, required_years) is None
+    )
+
+
+def test_title_levels_agreeing_with_years_are_scored_locally():
+    result = local_seniority_match(
+        "Senior Data Engineer", 7, None, "Senior Engineer", 5
+    )
+    assert result.candidate_level == result.required_level == "senior"
+    assert result.score == 100
+    assert result.title_alignment == "well-aligned"
+
+
+def test_unknown_years_score_on_the_title():
+    result = local_seniority_match("Lead Engineer", None, "Senior", "Engineer", 5)
+    assert result.years_gap == 0.0
+    assert result.red_flags == ["Overqualified: lead candidate for a senior role"]
+
+
+def test_years_alone_are_not_confident():
+    level, confidence = classify("Engineer", 9)
+    assert level == "lead"
+    assert confidence < classify("Lead Engineer", None)[1]
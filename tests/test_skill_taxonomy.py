@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from skill_taxonomy.taxonomy import SkillTaxonomy, get_taxonomy, normalize_skill_name
+
+ENTRIES = [
+    {"id": "languages", "name": "Programming Languages"},
+    {"id": "java", "name": "Java", "parents": ["languages"]},
+    {
+        "id": "javascript",
+        "name": "JavaScript",
+        "aliases": ["js"],
+        "parents": ["languages"],
+    },
+    {"id": "spring", "name": "Spring", "aliases": ["spring boot"], "parents": ["java"]},
+    {"id": "aws", "name": "AWS", "aliases": ["amazon web services"]},
+    {"id": "aws-lambda", "name": "AWS Lambda", "parents": ["aws"]},
+]
+
+
+@pytest.fixture
+def taxonomy(tmp_path):
+    path = tmp_path / "skills.json"
+    path.write_text(json.dumps(ENTRIES))
+    return SkillTaxonomy().load(path)
+
+
+def ids(taxonomy, skill_ids):
+    return [taxonomy.ids[skill_id] for skill_id in skill_ids]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Python 3.11", "python"),
+        ("React.js", "react"),
+        ("Node.js (backend)", "node"),
+        ("C++", "c++"),
+        ("CI/CD", "ci/cd"),
+        ("  Spring   Boot v2.x ", "spring boot"),
+    ],
+)
+def test_normalize_skill_name(name, expected):
+    assert normalize_skill_name(name) == expected
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Java", "java"),
+        ("JS", "javascript"),
+        ("Spring Boot 3", "spring"),
+        ("Amazon Web Services", "aws"),
+        # Found inside a longer name by the trie
+        ("Java development", "java"),
+        ("AWS Lambda functions", "aws-lambda"),
+        # Ambiguous or unknown
+        ("Java and JavaScript", None),
+        ("Rust", None),
+    ],
+)
+def test_resolve(taxonomy, name, expected):
+    skill_id = taxonomy.resolve(name)
+    assert (taxonomy.ids[skill_id] if skill_id is not None else None) == expected
+
+
+def test_find_all_prefers_the_longest_alias(taxonomy):
+    found = taxonomy.find_all("Spring Boot services on AWS Lambda, some Java and JS")
+    assert ids(taxonomy, found) == ["spring", "aws-lambda", "java", "javascript"]
+
+
+def test_ancestors_and_key(taxonomy):
+    spring = taxonomy.resolve("Spring")
+    assert set(ids(taxonomy, taxonomy.ancestors(spring))) == {"java", "languages"}
+    assert taxonomy.key("spring boot") == "spring"
+    assert taxonomy.key("Rust 1.70") == "rust"
+
+
+def test_loading_an_existing_id_extends_it(taxonomy, tmp_path):
+    extra = tmp_path / "extra.json"
+    extra.write_text(
+        json.dumps([{"id": "java", "aliases": ["jdk"], "parents": ["jvm"]}])
+    )
+    taxonomy.load(extra)
+    assert taxonomy.ids[taxonomy.resolve("JDK")] == "java"
+    assert taxonomy.name(taxonomy.resolve("JDK")) == "Java"
+    # Unknown parents are kept but ignored until they are defined
+    assert ids(taxonomy, taxonomy.ancestors(taxonomy.resolve("Java"))) == ["languages"]
+
+
+def test_shipped_taxonomy_resolves_common_aliases():
+    taxonomy = get_taxonomy()
+    assert taxonomy.key("k8s") == taxonomy.key("Kubernetes")
+    assert taxonomy.key("Postgres") == taxonomy.key("PostgreSQL")
+    assert taxonomy.resolve("SQL") in taxonomy.ancestors(taxonomy.resolve("PostgreSQL"))
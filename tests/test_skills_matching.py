@@ -0,0 +1,94 @@
+import pytest
+
+from extracting_data.description_schemas import (
+    CVDescription,
+    CVExperience,
+    JobDescription,
+    Skill,
+)
+from match_evaluation.agent_state import AgentState
+from match_evaluation.llm_requests import LLMRequest
+from match_evaluation.output_schemas import SkillsResidualResult
+from match_evaluation.parallel_execution import skills_match_request
+from match_evaluation.skills_matching import EXACT, PARTIAL, CandidateSkills
+
+
+def skills(*names):
+    return [Skill(name=name) for name in names]
+
+
+def make_state(required, nice_to_have, cv_skills, technologies=()):
+    cv = CVDescription(
+        technical_skills=skills(*cv_skills),
+        experience=[CVExperience(title="Analyst", technologies=list(technologies))],
+    )
+    job = JobDescription(
+        job_title="Analyst",
+        required_technical_skills=skills(*required),
+        nice_to_have_skills=skills(*nice_to_have),
+    )
+    return AgentState(cv=cv, job=job)
+
+
+@pytest.mark.parametrize(
+    "required, cv_skills, kind, candidate_skill",
+    [
+        # Aliases and versions name the same skill
+        ("Python", ["Python 3"], EXACT, "Python 3"),
+        ("Kubernetes", ["k8s"], EXACT, "k8s"),
+        ("Node.js", ["NodeJS"], EXACT, "NodeJS"),
+        # The CV is more specific than the requirement
+        ("AWS", ["AWS Lambda"], EXACT, "AWS Lambda"),
+        ("Java", ["Java EE"], EXACT, "Java EE"),
+        # The requirement is more specific than the CV
+        ("Java EE", ["Java"], PARTIAL, "Java"),
+        ("Java EE", ["Java", "Java EE 8"], EXACT, "Java EE 8"),
+        ("AWS Lambda", ["AWS"], PARTIAL, "AWS"),
+        # Related through the taxonomy
+        ("SQL", ["PostgreSQL"], PARTIAL, "PostgreSQL"),
+        # Shared words alone
+        ("C", ["Objective C"], None, None),
+        ("Java", ["JavaScript"], None, None),
+        ("Rust", ["Python"], None, None),
+    ],
+)
+def test_candidate_skill_match(required, cv_skills, kind, candidate_skill):
+    match = CandidateSkills(cv_skills).match(required)
+    assert (match.kind, match.candidate_skill) == (kind, candidate_skill)
+
+
+def test_specialization_gets_partial_credit():
+    state = make_state(["Java EE", "SQL"], [], ["Java", "SQL"])
+    result = skills_match_request(state, llm_fallback=False)["skills_match"]
+    assert result.matched_items == ["SQL"]
+    assert result.partial_matches == ["Java EE → Java"]
+    assert result.score == 85.0
+
+
+def test_similar_names_are_not_credited_without_the_llm():
+    state = make_state(
+        ["Microsoft Excel", "Python"], ["Google Sheets"], ["Microsoft Word", "Python"]
+    )
+    result = skills_match_request(state, llm_fallback=False)["skills_match"]
+    assert result.matched_items == ["Python"]
+    assert result.partial_matches == []
+    assert result.missing_items == ["Microsoft Excel"]
+    assert result.bonus_items == []
+
+
+def test_similar_names_go_to_the_llm_as_hints():
+    state = make_state(["Microsoft Excel"], ["Google Sheets"], ["Microsoft Word"])
+    request = skills_match_request(state, llm_fallback=True)
+    assert isinstance(request, LLMRequest)
+    assert "Microsoft Excel ~ Microsoft Word" in request.prompt
+
+    rejected = SkillsResidualResult(
+        matched_items=[],
+        partial_matches=[],
+        bonus_items=[],
+        reasoning="Different tools",
+    )
+    result = request.finalize(rejected)["skills_match"]
+    assert result.partial_matches == []
+    assert result.missing_items == ["Microsoft Excel"]
+    assert result.bonus_items == []
@@ -0,0 +1,95 @@
+import pytest
+
+from extracting_data.extracting_consts import CV, JOB_DESCRIPTION, PAGE_SEPARATOR
+from extracting_data.text_normalizer import (
+    is_section_header,
+    local_cleanup,
+    normalize_text,
+    segment_sections,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Data\u00a0Engineer\u200b", "Data Engineer"),
+        ("E\ufb03cient work\ufb02ow", "Efficient workflow"),
+        ("soft\xadware", "software"),
+        ("E D U C A T I O N", "Education"),
+        ("W O R K  E X P E R I E N C E", "Work Experience"),
+        ("• Built pipelines", "- Built pipelines"),
+        ("\uf0b7 Built pipelines", "- Built pipelines"),
+        ("Jan 2020 to Present", "Jan 2020 – Present"),
+        ("2019 - 2021", "2019 – 2021"),
+        ("03/2018 -- 11/2019", "03/2018 – 11/2019"),
+        ("Python,\tSQL   and  AWS", "Python, SQL and AWS"),
+        ("Team-lead - not a range", "Team-lead - not a range"),
+    ],
+)
+def test_normalize_line(text, expected):
+    assert normalize_text(text) == expected
+
+
+def test_normalize_keeps_pages_and_collapses_blank_lines():
+    text = f"Jane Doe\r\n\r\n\r\n\r\nEngineer{PAGE_SEPARATOR}\n \n{PAGE_SEPARATOR}Page three"
+    assert normalize_text(text) == f"Jane Doe\n\nEngineer{PAGE_SEPARATOR}Page three"
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("Experience", True),
+        ("## Technical Skills:", True),
+        ("WHAT WE LOOK FOR", True),
+        ("Built a new experience.", False),
+        ("Senior Data Engineer at Acme", False),
+    ],
+)
+def test_is_section_header(line, expected):
+    assert is_section_header(line) is expected
+
+
+CV_TEXT = """Jane Doe
+jane@example.com
+SUMMARY
+Data engineer with eight years of experience.
+EXPERIENCE
+Senior Data Engineer, Acme, Jan 2020 - Present
+• Built pipelines
+Education
+BSc Computer Science
+Skills:
+Python, SQL"""
+
+
+def test_segment_sections():
+    assert segment_sections(normalize_text(CV_TEXT)) == [
+        (None, "Jane Doe\njane@example.com"),
+        ("Summary", "Data engineer with eight years of experience."),
+        (
+            "Experience",
+            "Senior Data Engineer, Acme, Jan 2020 – Present\n- Built pipelines",
+        ),
+        ("Education", "BSc Computer Science"),
+        ("Skills", "Python, SQL"),
+    ]
+
+
+def test_local_cleanup_of_a_structured_cv():
+    text, well_structured = local_cleanup(CV_TEXT, CV)
+    assert well_structured
+    assert text.startswith("Jane Doe\njane@example.com\n\nSummary\n")
+
+
+def test_local_cleanup_needs_enough_sections():
+    _, well_structured = local_cleanup("Jane Doe\nSkills\nPython", CV)
+    assert not well_structured
+    _, well_structured = local_cleanup(
+        "Requirements\nPython\nBenefits\nRemote work", JOB_DESCRIPTION
+    )
+    assert well_structured
+
+
+def test_local_cleanup_rejects_noisy_text():
+    noisy = CV_TEXT.replace("Python, SQL", "Py{th}on || SQL ~~ [[]] <<>> $$ ^^ ==")
+    assert not local_cleanup(noisy, CV)[1]
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from disk_cache import DiskCache
+from extracting_data import url_fetching
+from extracting_data.extraction_functions import access_cv_data, fetch_documents
+from extracting_data.receive_text_from_documents import DocumentReadError
+from extracting_data.url_fetching import fetch_urls
+from match_evaluation.agent_state import AgentState
+
+PAGES = {
+    "/cv": "<html><body><main><p>Jane Doe, Python developer</p></main></body></html>",
+    "/job": "<html><body><main><p>Senior Python developer wanted</p></main></body></html>",
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "urls", 10 * 1024 * 1024)
+    monkeypatch.setattr(url_fetching, "_url_cache", cache)
+    return cache
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fetch_urls_keeps_order_and_reports_failures(server, cache):
+    bodies = fetch_urls(
+        [url(server, "/job"), url(server, "/missing"), url(server, "/cv")]
+    )
+    assert bodies == [PAGES["/job"], None, PAGES["/cv"]]
+
+
+def test_fetch_urls_revalidates_stale_entries(server, cache):
+    fetch_urls([url(server, "/cv")], fresh_seconds=0)
+    assert fetch_urls([url(server, "/cv")], fresh_seconds=0) == [PAGES["/cv"]]
+    assert server.requests == ["/cv", "/cv"]
+
+
+def test_fresh_entries_need_no_request(server, cache):
+    fetch_urls([url(server, "/cv")])
+    fetch_urls([url(server, "/cv")])
+    assert server.requests == ["/cv"]
+
+
+def test_fetch_urls_inside_running_loop(server, cache):
+    async def caller():
+        return fetch_urls([url(server, "/cv")])
+
+    assert asyncio.run(caller()) == [PAGES["/cv"]]
+
+
+def test_fetch_documents_downloads_both_in_one_batch(server, cache, monkeypatch):
+    batches = []
+    original = url_fetching.UrlFetcher.fetch_many
+
+    async def fetch_many(self, urls):
+        batches.append(list(urls))
+        return await original(self, urls)
+
+    monkeypatch.setattr(url_fetching.UrlFetcher, "fetch_many", fetch_many)
+    state = AgentState(cv_input=url(server, "/cv"), path_to_job=url(server, "/job"))
+    update = fetch_documents(state)
+
+    assert len(batches) == 1 and len(batches[0]) == 2
+    assert "Jane Doe" in update["cv_input"]
+    assert "Senior Python developer" in update["job_input"]
+
+
+def test_failed_link_is_downloaded_once(server, cache):
+    link = url(server, "/missing")
+    state = AgentState(cv_input=link, job_input="Pasted job text")
+    update = fetch_documents(state)
+    assert update == {"cv_fetch_error": f"failed to download {link}"}
+
+    with pytest.raises(DocumentReadError, match="failed to download"):
+        access_cv_data(state.model_copy(update=update), None, interactive=False)
+    assert server.requests == ["/missing"]